@@ -15,15 +15,22 @@ from avilla.core._runtime import get_current_avilla
 from avilla.core.account import AccountInfo, BaseAccount
 from avilla.core.dispatchers import AvillaBuiltinDispatcher
 from avilla.core.event import MetadataModified
+from avilla.core.http import HttpSessionConfig, HttpSessionService, aio
 from avilla.core.protocol import BaseProtocol
+from avilla.core.recorder import EventRecorder
+from avilla.core.scheduler import EventScheduler
 from avilla.core.ryanvk.staff import Staff
-from avilla.core.selector import Selector
+from avilla.core.selector import FollowsPattern, Selector
 from avilla.core.service import AvillaService
 from avilla.core.utilles import identity
+from avilla.core.utilles.io import configure as configure_io
+from avilla.core.utilles.json_codec import JsonCodec, set_codec
+from avilla.core.utilles.subscription import SubscriptionIndex
 from avilla.standard.core.activity import ActivityEvent
 from avilla.standard.core.request import RequestEvent
 
 if TYPE_CHECKING:
+    from aiohttp import ClientSession
     from graia.broadcast import Decorator, Dispatchable, Namespace, T_Dispatcher
 
     from avilla.core.event import AvillaEvent
@@ -42,7 +49,11 @@ class Avilla:
     protocols: list[BaseProtocol]
     accounts: dict[Selector, AccountInfo]
     service: AvillaService
+    http_service: HttpSessionService | None
     global_artifacts: dict[Any, Any]
+    event_scheduler: EventScheduler
+    subscriptions: SubscriptionIndex
+    event_recorder: EventRecorder
 
     def __init__(
         self,
@@ -51,6 +62,16 @@ class Avilla:
         launch_manager: Launart | None = None,
         message_cache_size: int = 300,
         record_send: bool = True,
+        metadata_cache_size: int = 0,
+        metadata_cache_ttl: float = 60.0,
+        event_concurrency: int = 64,
+        event_max_pending: int | None = None,
+        io_workers: int | None = None,
+        io_offload_threshold: int = 64 * 1024,
+        http_config: HttpSessionConfig | None = None,
+        json_codec: JsonCodec | str | None = None,
+        skip_unlistened_events: bool = False,
+        event_record_level: str | None = "DEBUG",
     ):
         self.broadcast = broadcast or it(Broadcast)
         self.launch_manager = launch_manager or it(Launart)
@@ -58,14 +79,26 @@ class Avilla:
         self._protocol_map = {}
         self.accounts = {}
 
-        self.service = AvillaService(self, message_cache_size)
+        self.service = AvillaService(self, message_cache_size, metadata_cache_size, metadata_cache_ttl)
         self.global_artifacts = {}
+        self.event_scheduler = EventScheduler(event_concurrency, event_max_pending)
+        self.subscriptions = SubscriptionIndex(self.broadcast, skip_unlistened_events)
+        self.event_recorder = EventRecorder(event_record_level)
+        configure_io(io_workers, io_offload_threshold)
+        if json_codec is not None:
+            set_codec(json_codec)
+
+        # absent without aiohttp, which every protocol fetching urls depends on anyway.
+        self.http_service = HttpSessionService(http_config) if aio else None
 
         self.launch_manager.add_component(MemcacheService())
+        if self.http_service is not None:
+            self.launch_manager.add_component(self.http_service)
         self.launch_manager.add_component(self.service)
         self.broadcast.finale_dispatchers.append(AvillaBuiltinDispatcher(self))
 
         self.__init_isolate__()
+        self.__init_event_recorder__()
 
         if message_cache_size > 0:
             from avilla.core.context import Context
@@ -86,6 +119,9 @@ class Avilla:
             message_cacher.__annotations__ = {"context": Context, "message": Message}
             clear_cache.__annotations__ = {"event": AccountUnregistered}
 
+        if self.service.enabled_cache_metadata:
+            self.__init_metadata_cache__()
+
         if record_send:
             from avilla.core.context import Context
             from avilla.core.message import Message
@@ -105,75 +141,14 @@ class Avilla:
         self.custom_event_recorder: dict[type[AvillaEvent], Callable[[AvillaEvent], None]] = {}
 
     def event_record(self, event: AvillaEvent | AvillaLifecycleEvent):
-        from avilla.standard.core.account.event import AccountStatusChanged
-        from avilla.standard.core.application import AvillaLifecycleEvent
-        from avilla.standard.core.message import (
-            MessageEdited,
-            MessageReceived,
-            MessageSent,
-        )
-
-        if isinstance(event, AccountStatusChanged):
-            logger.debug(
-                f"[{event.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{event.account.route['account']}]: "
-                f"{event.__class__.__name__}"
-            )
-            return
-        if isinstance(event, AvillaLifecycleEvent):
-            logger.debug(event.__class__.__name__)
-            return
-        context = event.context
-        client = context.client.display
-        scene = context.scene.display
-        endpoint = context.endpoint.display
-
-        if isinstance(event, MessageSent):
+        # account status, lifecycle and sent message events never reach the custom recorders.
+        if not isinstance(event, self._uncustomized_events) and (
+            recorder := self.custom_event_recorder.get(type(event))
+        ) is not None:
+            recorder(event)  # type: ignore
             return
 
-        if type(event) in self.custom_event_recorder:
-            self.custom_event_recorder[type(event)](event)
-
-        elif isinstance(event, RequestEvent):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"Request {event.request.request_type or event.request.id}"
-                f"{f' with {event.request.message}' if event.request.message else ''} "
-                f"from {client} in {scene}"
-            )
-        elif isinstance(event, ActivityEvent):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"Activity {event.id}: {event.activity}"
-                f"from {client} in {scene}"
-            )
-        elif isinstance(event, MetadataModified):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"Metadata {event.route} Modified: {event.details}"
-                f"from {client} in {scene}"
-            )
-        elif isinstance(event, MessageReceived):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"{scene} -> {str(event.message.content)!r}"
-            )
-        elif isinstance(event, MessageEdited):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"{scene} => {str(event.past)!r} -> {str(event.current)!r}"
-            )
-        else:
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"{event.__class__.__name__} from {client} to {endpoint} in {scene}"
-            )
+        self.event_recorder.record(event, depth=1)
 
     @overload
     def add_event_recorder(self, event_type: type[TE]) -> Callable[[Callable[[TE], None]], Callable[[TE], None]]:
@@ -196,6 +171,146 @@ class Avilla:
         self.custom_event_recorder[event_type] = recorder  # type: ignore
         return recorder
 
+    def __init_event_recorder__(self):
+        from avilla.core.event import AvillaEvent
+        from avilla.standard.core.account.event import AccountStatusChanged
+        from avilla.standard.core.application import AvillaLifecycleEvent
+        from avilla.standard.core.message import (
+            MessageEdited,
+            MessageReceived,
+            MessageSent,
+        )
+
+        recorder = self.event_recorder
+        self._uncustomized_events = (AccountStatusChanged, AvillaLifecycleEvent, MessageSent)
+
+        def prefix(account: BaseAccount) -> str:
+            return f"[{account.info.protocol.__class__.__name__.replace('Protocol', '')} {account.route['account']}]: "
+
+        # the snapshots take the values out of the events, which are formatted on the recorder's thread.
+        recorder.register(
+            AccountStatusChanged,
+            "DEBUG",
+            lambda account, name: f"{prefix(account)}{name}",
+            lambda event: (event.account, event.__class__.__name__),
+        )
+        recorder.register(AvillaLifecycleEvent, "DEBUG", str, lambda event: (event.__class__.__name__,))
+        recorder.register(MessageSent, None)  # recorded by `message_sender` when sent by Avilla.
+        recorder.register(
+            RequestEvent,
+            "INFO",
+            lambda account, request, message, client, scene: (
+                f"{prefix(account)}"
+                f"Request {request}{f' with {message}' if message else ''} "
+                f"from {client.display} in {scene.display}"
+            ),
+            lambda event: (
+                event.context.account,
+                event.request.request_type or event.request.id,
+                event.request.message,
+                event.context.client,
+                event.context.scene,
+            ),
+        )
+        recorder.register(
+            ActivityEvent,
+            "INFO",
+            lambda account, id, activity, client, scene: (
+                f"{prefix(account)}Activity {id}: {activity} from {client.display} in {scene.display}"
+            ),
+            lambda event: (event.context.account, event.id, event.activity, event.context.client, event.context.scene),
+        )
+        recorder.register(
+            MetadataModified,
+            "INFO",
+            lambda account, route, details, client, scene: (
+                f"{prefix(account)}Metadata {route} Modified: {details} from {client.display} in {scene.display}"
+            ),
+            lambda event: (
+                event.context.account,
+                event.route,
+                event.details,
+                event.context.client,
+                event.context.scene,
+            ),
+        )
+        recorder.register(
+            MessageReceived,
+            "INFO",
+            lambda account, scene, content: f"{prefix(account)}{scene.display} -> {str(content)!r}",
+            lambda event: (event.context.account, event.context.scene, event.message.content),
+        )
+        recorder.register(
+            MessageEdited,
+            "INFO",
+            lambda account, scene, past, current: (
+                f"{prefix(account)}{scene.display} => {str(past)!r} -> {str(current)!r}"
+            ),
+            lambda event: (event.context.account, event.context.scene, event.past, event.current),
+        )
+        recorder.register(
+            AvillaEvent,
+            "INFO",
+            lambda account, name, client, endpoint, scene: (
+                f"{prefix(account)}{name} from {client.display} to {endpoint.display} in {scene.display}"
+            ),
+            lambda event: (
+                event.context.account,
+                event.__class__.__name__,
+                event.context.client,
+                event.context.endpoint,
+                event.context.scene,
+            ),
+        )
+
+    def __init_metadata_cache__(self):
+        from graia.broadcast.interfaces.dispatcher import DispatcherInterface
+
+        from avilla.core.event import (
+            DirectSessionCreated,
+            DirectSessionDestroyed,
+            MemberCreated,
+            MemberDestroyed,
+            SceneCreated,
+            SceneDestroyed,
+        )
+        from avilla.standard.core.account import AccountUnregistered
+
+        caches = self.service.metadata_cache
+
+        # priority 0, so the stale entries are gone before the other listeners pull again.
+        async def invalidate_metadata(interface: DispatcherInterface):
+            event = interface.event
+            context = event.context
+            if context.account.route not in caches:
+                return
+
+            cache = caches[context.account.route]
+            if isinstance(event, MetadataModified):
+                cache.invalidate(event.endpoint)
+                return
+
+            cache.invalidate(context.endpoint)
+            cache.invalidate(context.scene, descendants=isinstance(event, (SceneDestroyed, DirectSessionDestroyed)))
+
+        async def clear_metadata_cache(event: AccountUnregistered):
+            caches.pop(event.account.route, None)
+
+        invalidate_metadata.__annotations__ = {"interface": DispatcherInterface}
+        clear_metadata_cache.__annotations__ = {"event": AccountUnregistered}
+
+        for event_type in (
+            MetadataModified,
+            DirectSessionCreated,
+            SceneCreated,
+            MemberCreated,
+            DirectSessionDestroyed,
+            SceneDestroyed,
+            MemberDestroyed,
+        ):
+            self.broadcast.receiver(event_type, priority=0)(invalidate_metadata)
+        self.broadcast.receiver(AccountUnregistered)(clear_metadata_cache)
+
     def __init_isolate__(self):
         from avilla.core.builtins.resource_fetch import CoreResourceFetchPerform
 
@@ -214,6 +329,13 @@ class Avilla:
     def current(cls):
         return get_current_avilla()
 
+    @property
+    def http_session(self) -> ClientSession:
+        """The pooled `ClientSession` of `http_service`, for the performs fetching urls."""
+        if self.http_service is None:
+            raise RuntimeError("aiohttp is required to fetch resources over http, install it to do so")
+        return self.http_service.session
+
     async def fetch_resource(self, resource: Resource[T]) -> T:
         return await Staff(self.get_staff_artifacts(), self.get_staff_components()).fetch_resource(resource)
 
@@ -247,7 +369,8 @@ class Avilla:
         if land:
             return [account for account in self.accounts.values() if account.platform.land.name == land]
         if pattern:
-            return [account for selector, account in self.accounts.items() if selector.follows(pattern)]
+            compiled = FollowsPattern.compile(pattern)
+            return [account for selector, account in self.accounts.items() if compiled.match(selector)]
         if protocol_type:
             return [account for account in self.accounts.values() if isinstance(account.protocol, protocol_type)]
         if account_type:
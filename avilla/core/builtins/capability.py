@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Sequence, TypeVar
 
 from typing_extensions import Unpack
 
@@ -8,7 +8,7 @@ from avilla.core.metadata import Metadata, MetadataRoute
 from avilla.core.resource import Resource, T
 from avilla.core.ryanvk.descriptor.query import QuerySchema
 from avilla.core.ryanvk.overload.metadata import MetadataOverload
-from avilla.core.ryanvk.overload.target import TargetOverload
+from avilla.core.ryanvk.overload.target import BatchTargetOverload, TargetOverload
 from graia.ryanvk.capability import Capability
 from graia.ryanvk.fn import Fn
 from graia.ryanvk.overload import NoneOverload, TypeOverload
@@ -37,6 +37,12 @@ class CoreCapability(Capability):
     async def pull(self, target: Selector, route: type[M] | MetadataRoute[Unpack[tuple[Any, ...]], M]) -> Any:
         ...
 
+    @Fn.complex({BatchTargetOverload(): ["targets"], MetadataOverload(): ["route"]})
+    async def pull_many(
+        self, targets: Sequence[Selector], route: type[M] | MetadataRoute[Unpack[tuple[Any, ...]], M]
+    ) -> dict[Selector, Any]:
+        ...
+
     @Fn.complex({TypeOverload(): ["resource"]})
     async def fetch(self, resource: Resource[T]) -> T:
         ...
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any, TypedDict, TypeVar, cast, overload
 
 from typing_extensions import ParamSpec, Unpack
@@ -10,7 +10,7 @@ from avilla.core.account import BaseAccount
 from avilla.core.metadata import Metadata, MetadataRoute
 from avilla.core.platform import Land
 from avilla.core.resource import Resource
-from avilla.core.ryanvk import Fn
+from avilla.core.ryanvk import Fn, QueryOptions
 from avilla.core.ryanvk.staff import Staff
 from avilla.core.selector import FollowsPredicater, Selectable, Selector
 from avilla.core.utilles import classproperty
@@ -114,8 +114,8 @@ class Context:
     def get_staff_artifacts(self):
         return self.artifacts
 
-    def query(self, pattern: str, **predicators: FollowsPredicater):
-        return self.staff.query_entities(pattern, **predicators)
+    def query(self, pattern: str, options: QueryOptions | None = None, /, **predicators: FollowsPredicater):
+        return self.staff.query_entities(pattern, options, **predicators)
 
     async def fetch(self, resource: Resource[_T]) -> _T:
         return await self.staff.fetch_resource(resource)
@@ -130,6 +130,9 @@ class Context:
         if isinstance(target, Selectable):
             target = target.to_selector()
 
+        if flush and (shared := self.staff.metadata_cache) is not None:
+            shared.invalidate(target, route)
+
         cached = self.cache["meta"].get(target)
         if cached is not None and route in cached:
             meta = cached[route]
@@ -140,6 +143,15 @@ class Context:
 
         return await self.staff.pull_metadata(target, route)
 
+    async def pull_many(
+        self,
+        route: type[_MetadataT] | MetadataRoute[Unpack[tuple[Any, ...]], _MetadataT],
+        targets: Iterable[Selector | Selectable],
+    ) -> dict[Selector, _MetadataT]:
+        return await self.staff.pull_metadata_many(
+            [target.to_selector() if isinstance(target, Selectable) else target for target in targets], route
+        )
+
     @overload
     def __getitem__(self, closure: Selector) -> ContextSelector:
         ...
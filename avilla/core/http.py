@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from launart import Launart, Service
+
+try:
+    import aiohttp  # noqa: F401
+
+    aio = True
+except ImportError:
+    aio = False
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+
+@dataclass
+class HttpSessionConfig:
+    limit: int = 100
+    limit_per_host: int = 8
+    keepalive_timeout: float = 30.0
+    total_timeout: float | None = 300.0
+    connect_timeout: float | None = 10.0
+
+
+class HttpSessionService(Service):
+    """Holds the `ClientSession` shared by resource fetching, so that connections are pooled and kept alive.
+
+    Requires aiohttp, Avilla only registers the service when it is installed."""
+
+    id = "avilla.service/http"
+    supported_interface_types = set()
+
+    config: HttpSessionConfig
+    _session: ClientSession | None = None
+    _closed: bool = False
+
+    def __init__(self, config: HttpSessionConfig | None = None):
+        if not aio:
+            raise RuntimeError("aiohttp is required by HttpSessionService")
+        self.config = config or HttpSessionConfig()
+        super().__init__()
+
+    @property
+    def required(self) -> set[str]:
+        return set()
+
+    @property
+    def stages(self):
+        return {"preparing", "blocking", "cleanup"}
+
+    def get_interface(self, interface_type):
+        ...
+
+    @property
+    def session(self) -> ClientSession:
+        # created on demand, since resources may be fetched before the service is launched.
+        if self._closed:
+            raise RuntimeError("http session service is already cleaned up")
+        if self._session is None:
+            from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.config.limit,
+                    limit_per_host=self.config.limit_per_host,
+                    keepalive_timeout=self.config.keepalive_timeout,
+                ),
+                timeout=ClientTimeout(total=self.config.total_timeout, sock_connect=self.config.connect_timeout),
+            )
+        return self._session
+
+    async def launch(self, manager: Launart):
+        async with self.stage("preparing"):
+            ...
+
+        async with self.stage("blocking"):
+            await manager.status.wait_for_sigexit()
+
+        async with self.stage("cleanup"):
+            self._closed = True
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
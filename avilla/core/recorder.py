@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import sys
+from functools import partial
+from queue import Full, Queue
+from threading import Lock, Thread
+from typing import Any, Callable, Tuple
+
+from loguru import logger
+
+Formatter = Callable[..., str]
+Snapshot = Callable[[Any], Tuple[Any, ...]]
+
+_STOP = object()
+
+
+def _set_origin(origin: tuple[str | None, str, int], record: Any):
+    name, function, line = origin
+    record.update(name=name, module=(name or "").rpartition(".")[2], function=function, line=line)
+
+
+class EventRecorder:
+    """Logs the events passing through Avilla.
+
+    Formatters are registered per event class and resolved once per exact event type through its MRO,
+    and events below `level` are dropped before anything is done with them.
+    A formatter registered with a snapshot runs on a background thread, along with the log sinks:
+    only the snapshot, which takes the values the formatter needs out of the event, runs on the calling side,
+    since the event may still change once dispatched. Other formatters are given the event on the calling side.
+    """
+
+    formatters: dict[type, tuple[str, Formatter, Snapshot | None] | None]
+    max_pending: int
+    dropped: int
+
+    def __init__(self, level: str | None = "DEBUG", max_pending: int = 4096) -> None:
+        self.formatters = {}
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._resolved: dict[type, tuple[str, int, Formatter, Snapshot | None] | None] = {}
+        self._queue: Queue = Queue()
+        self._worker: Thread | None = None
+        self._lock = Lock()
+        self.level = level
+
+    @property
+    def level(self) -> str | None:
+        return self._level
+
+    @level.setter
+    def level(self, value: str | None):
+        self._level = value
+        # `None` disables recording entirely.
+        self._levelno = float("inf") if value is None else logger.level(value).no
+
+    def register(
+        self,
+        event_type: type,
+        level: str | None,
+        formatter: Formatter | None = None,
+        snapshot: Snapshot | None = None,
+    ):
+        """Records the events of `event_type` and its subclasses at `level`; `None` keeps them unrecorded.
+
+        With `snapshot`, `formatter` is called on the worker with the values it returns instead of the event.
+        """
+        if level is None or formatter is None:
+            self.formatters[event_type] = None
+        else:
+            self.formatters[event_type] = (level, formatter, snapshot)
+        self._resolved.clear()
+
+    def resolve(self, event_type: type) -> tuple[str, int, Formatter, Snapshot | None] | None:
+        try:
+            return self._resolved[event_type]
+        except KeyError:
+            pass
+
+        result = None
+        for cls in event_type.__mro__:
+            if cls in self.formatters:
+                if (entry := self.formatters[cls]) is not None:
+                    result = (entry[0], logger.level(entry[0]).no, entry[1], entry[2])
+                break
+
+        self._resolved[event_type] = result
+        return result
+
+    def record(self, event: Any, *, depth: int = 0):
+        """Records `event` as logged by the caller of this method, or by the one `depth` frames above it."""
+        entry = self.resolve(type(event))
+        if entry is None or entry[1] < self._levelno:
+            return
+
+        level, _, formatter, snapshot = entry
+        event_type = type(event).__name__
+        try:
+            if snapshot is None:
+                formatter, values = str, (formatter(event),)
+            else:
+                values = snapshot(event)
+        except Exception as e:
+            logger.opt(exception=e).warning(f"failed to record event {event_type}")
+            return
+
+        frame = sys._getframe(depth + 1)
+        origin = (frame.f_globals.get("__name__"), frame.f_code.co_name, frame.f_lineno)
+
+        if self._worker is None:
+            self._start()
+
+        try:
+            self._queue.put_nowait((level, event_type, origin, formatter, values))
+        except Full:
+            self.dropped += 1
+
+    def _start(self):
+        with self._lock:
+            if self._worker is None:
+                # a queue per worker, so that a stopping worker never takes the records of the next one.
+                self._queue = Queue(self.max_pending)
+                self._worker = Thread(target=self._run, args=(self._queue,), name="avilla-event-recorder", daemon=True)
+                self._worker.start()
+
+    def _run(self, queue: Queue):
+        while True:
+            item = queue.get()
+            if item is _STOP:
+                return
+
+            level, event_type, origin, formatter, values = item
+            try:
+                message = formatter(*values)
+                # logged as by the caller of `record`, rather than by this thread.
+                logger.patch(partial(_set_origin, origin)).bind(event_type=event_type).log(level, message)
+            except Exception as e:
+                logger.opt(exception=e).warning(f"failed to record event {event_type}")
+
+    def close(self, timeout: float | None = None):
+        """Stops the worker once the queued records are logged; recording later starts a new one."""
+        with self._lock:
+            worker, queue = self._worker, self._queue
+            self._worker = None
+        if worker is None:
+            return
+
+        queue.put(_STOP)
+        worker.join(timeout)
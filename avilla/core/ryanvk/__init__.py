@@ -2,9 +2,13 @@ from avilla.core.ryanvk.collector.context import (
     ContextBasedPerformTemplate as ContextBasedPerformTemplate,
 )
 from avilla.core.ryanvk.collector.context import ContextCollector as ContextCollector
+from avilla.core.ryanvk.descriptor.query import QueryOptions as QueryOptions
 from avilla.core.ryanvk.descriptor.query import QueryRecord as QueryRecord
 from avilla.core.ryanvk.descriptor.query import QuerySchema as QuerySchema
 from avilla.core.ryanvk.overload.metadata import MetadataOverload as MetadataOverload
+from avilla.core.ryanvk.overload.target import (
+    BatchTargetOverload as BatchTargetOverload,
+)
 from avilla.core.ryanvk.overload.target import TargetOverload as TargetOverload
 from graia.ryanvk.capability import Capability as Capability
 from graia.ryanvk.fn import Fn as Fn
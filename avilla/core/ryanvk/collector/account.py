@@ -9,6 +9,7 @@ from .base import AvillaBaseCollector
 if TYPE_CHECKING:
     from avilla.core.account import BaseAccount
     from avilla.core.protocol import BaseProtocol
+    from avilla.core.ryanvk.staff import Staff
 
 
 TProtocol = TypeVar("TProtocol", bound="BaseProtocol")
@@ -24,6 +25,7 @@ T1 = TypeVar("T1")
 class AccountBasedPerformTemplate(BasePerform, native=True):
     __collector__: ClassVar[AccountCollector]
 
+    staff: Staff
     protocol: Access[BaseProtocol] = Access()
     account: Access[BaseAccount] = Access()
 
@@ -8,6 +8,7 @@ from .base import AvillaBaseCollector
 
 if TYPE_CHECKING:
     from avilla.core.application import Avilla
+    from avilla.core.ryanvk.staff import Staff
 
 
 T = TypeVar("T")
@@ -17,6 +18,7 @@ T1 = TypeVar("T1")
 class ApplicationBasedPerformTemplate(BasePerform, native=True):
     __collector__: ClassVar[ApplicationCollector]
 
+    staff: Staff
     avilla: Access[Avilla] = Access()
 
 
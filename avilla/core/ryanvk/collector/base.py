@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Sequence, TypeVar, overload
 
 from graia.ryanvk import BaseCollector
 
@@ -40,6 +40,29 @@ class AvillaBaseCollector(BaseCollector):
 
         return self.entity(CoreCapability.pull, target=target, route=route)
 
+    @overload
+    def pull_many(
+        self, target: str, route: type[M]
+    ) -> Callable[
+        [Callable[[Any, Sequence[Selector], type[M]], Awaitable[dict[Selector, M]]]],
+        Callable[[Any, Sequence[Selector], type[M]], Awaitable[dict[Selector, M]]],
+    ]:
+        ...
+
+    @overload
+    def pull_many(
+        self, target: str, route: MetadataRoute[Unpack[tuple[Any, ...]], M]
+    ) -> Callable[
+        [Callable[[Any, Sequence[Selector], type[M]], Awaitable[dict[Selector, M]]]],
+        Callable[[Any, Sequence[Selector], type[M]], Awaitable[dict[Selector, M]]],
+    ]:
+        ...
+
+    def pull_many(self, target: str, route: ...) -> ...:
+        from avilla.core.builtins.capability import CoreCapability
+
+        return self.entity(CoreCapability.pull_many, targets=target, route=route)
+
     def fetch(self, resource_type: type[T]) -> Wrapper[Callable[[Any, T], Awaitable[Any]]]:
         from avilla.core.builtins.capability import CoreCapability
 
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from avilla.core.context import Context
     from avilla.core.metadata import Metadata
     from avilla.core.protocol import BaseProtocol
+    from avilla.core.ryanvk.staff import Staff
 
 
 TProtocol = TypeVar("TProtocol", bound="BaseProtocol")
@@ -27,6 +28,7 @@ M = TypeVar("M", bound="Metadata")
 class ContextBasedPerformTemplate(BasePerform, native=True):
     __collector__: ClassVar[ContextCollector]
 
+    staff: Staff
     context: Access[Context] = Access()
 
     @property
@@ -8,6 +8,7 @@ from .base import AvillaBaseCollector
 
 if TYPE_CHECKING:
     from avilla.core.protocol import BaseProtocol
+    from avilla.core.ryanvk.staff import Staff
 
 
 TProtocol = TypeVar("TProtocol", bound="BaseProtocol")
@@ -20,6 +21,7 @@ T1 = TypeVar("T1")
 class ProtocolBasedPerformTemplate(BasePerform, native=True):
     __collector__: ClassVar[ProtocolCollector]
 
+    staff: Staff
     protocol: Access[BaseProtocol] = Access()
 
 
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 from collections import deque
 from dataclasses import dataclass
-from typing import Any, AsyncGenerator, Callable, Container, Protocol, overload
+from typing import Any, AsyncGenerator, Callable, Container, Protocol, Sequence, overload
+from weakref import WeakKeyDictionary
+
+from typing_extensions import TypeAlias
 
 from avilla.core.selector import Selector, _FollowItem
-from graia.ryanvk import BaseCollector
+from graia.ryanvk import ArtifactView, BaseCollector
 
 
 @dataclass(unsafe_hash=True)
@@ -65,19 +69,84 @@ class QueryHandler(Protocol):
         ...
 
 
-# 使用 functools.reduce.
-async def query_depth_generator(
-    handler: QueryHandler,
-    predicate: Callable[[str, str], bool] | str,
-    previous_generator: AsyncGenerator[Selector, None] | None = None,
+@dataclass(frozen=True)
+class QueryOptions:
+    """How a query runs, given apart from the predicators, which may be named anything."""
+
+    concurrency: int = 8
+    """handlers running at once"""
+    limit: int | None = None
+    """results after which the query stops"""
+
+
+async def query_concurrent_generator(
+    steps: Sequence[tuple[QueryHandler, Callable[[str, str], bool] | str]],
+    concurrency: int = 8,
+    limit: int | None = None,
 ):
-    if previous_generator is not None:
-        async for previous in previous_generator:
-            async for current in handler(predicate, previous):
-                yield current
-    else:
-        async for current in handler(predicate):
+    """Runs the query steps as a tree: every selector yielded by a step fans out into a task running the next step.
+
+    At most `concurrency` handlers run at once. Results stream out as soon as they are found, in no particular order;
+    closing the generator, or reaching `limit`, cancels the handlers still running and waits for them to finish.
+    """
+
+    if not steps:
+        return
+
+    results: asyncio.Queue[tuple[Selector | None, BaseException | None]] = asyncio.Queue(max(concurrency, 1))
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks: set[asyncio.Task] = set()
+    last = len(steps) - 1
+    active = 0
+
+    async def expand(depth: int, previous: Selector | None):
+        nonlocal active
+        handler, predicate = steps[depth]
+        try:
+            async with semaphore:
+                generator = handler(predicate) if previous is None else handler(predicate, previous)
+                try:
+                    async for current in generator:
+                        if depth == last:
+                            await results.put((current, None))
+                        else:
+                            spawn(depth + 1, current)
+                finally:
+                    # the handler may be suspended at a yield when cancelled, have its cleanup run now.
+                    await generator.aclose()
+        except Exception as e:
+            await results.put((None, e))
+
+        active -= 1
+        if not active:
+            await results.put((None, None))
+
+    def spawn(depth: int, previous: Selector | None):
+        nonlocal active
+        active += 1
+        task = asyncio.create_task(expand(depth, previous))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    spawn(0, None)
+    count = 0
+    try:
+        while True:
+            current, exc = await results.get()
+            if exc is not None:
+                raise exc
+            if current is None:
+                break
             yield current
+            count += 1
+            if limit is not None and count >= limit:
+                break
+    finally:
+        running = list(tasks)
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
 
 
 @dataclass
@@ -109,3 +178,46 @@ def find_querier_steps(
                 else:
                     queue.append(_MatchStep(full_path, head.start, head.history + (query,)))
     return result
+
+
+_QuerierPlan: TypeAlias = "tuple[tuple[int, int, QueryRecord], ...] | None"
+
+_querier_plans: WeakKeyDictionary[ArtifactView, dict[tuple[str, ...], _QuerierPlan]] = WeakKeyDictionary()
+# layout: {view: {names: plan}}, plans go along with the views replaced when the artifacts change.
+_querier_plans_per_view = 512
+
+
+def _compile_querier_plan(view: ArtifactView, names: tuple[str, ...]) -> _QuerierPlan:
+    # the steps only depend on the names of the pattern, so the plan is shared by patterns of the same shape.
+    plans = _querier_plans.get(view)
+    if plans is None:
+        plans = _querier_plans[view] = {}
+    elif names in plans:
+        return plans[names]
+
+    steps = find_querier_steps(view.mapping, [_FollowItem(name) for name in names])
+    if steps is None:
+        plan = None
+    else:
+        plan = []
+        start = 0
+        for items, record in steps:
+            plan.append((start, start + len(items), record))
+            start += len(items)
+        plan = tuple(plan)
+
+    if len(plans) >= _querier_plans_per_view:
+        plans.clear()
+    plans[names] = plan
+    return plan
+
+
+def find_querier_plan(
+    view: ArtifactView,
+    frags: list[_FollowItem],
+) -> list[tuple[tuple[_FollowItem, ...], QueryRecord]] | None:
+    """Same as `find_querier_steps`, but memoized by the shape of `frags` and the artifact view."""
+    plan = _compile_querier_plan(view, tuple(i.name for i in frags))
+    if plan is None:
+        return
+    return [(tuple(frags[start:end]), record) for start, end, record in plan]
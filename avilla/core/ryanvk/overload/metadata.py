@@ -8,6 +8,8 @@ from graia.ryanvk.overload import FnOverload
 
 
 class MetadataOverload(FnOverload):
+    dispatch_key_hashable = True
+
     def collect_entity(
         self,
         collector: BaseCollector,
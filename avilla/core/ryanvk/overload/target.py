@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Sequence
 
 from typing_extensions import TypeAlias
 
 from avilla.core.selector import FollowsPredicater, Selector, _parse_follows
+from graia.ryanvk import _runtime
 from graia.ryanvk.collector import BaseCollector
 from graia.ryanvk.overload import FnOverload
 
@@ -36,6 +37,50 @@ class TargetOverloadConfig:
         self.predicators = predicators
 
 
+@dataclass(frozen=True)
+class _TrieNode:
+    bind: frozenset[tuple[BaseCollector, Callable]]
+    levels: dict[str, _TrieBranches]
+
+
+@dataclass(frozen=True)
+class _TrieBranches:
+    literals: dict[str, _TrieNode]
+    predicates: tuple[tuple[FollowsPredicater, _TrieNode], ...]
+    default: _TrieNode | None
+    wildcard: frozenset[tuple[BaseCollector, Callable]] | None
+
+
+def _compile_lookup_collection(collection: LookupCollection) -> dict[str, _TrieBranches]:
+    # default branch's levels are merged into its siblings' here, rather than on every lookup.
+    result = {}
+
+    for key, branches in collection.items():
+        default = branches.get(None)
+        literals = {}
+        predicates = []
+
+        for header, branch in branches.items():
+            if header is None:
+                continue
+
+            levels = branch.levels if default is None else default.levels | branch.levels
+            node = _TrieNode(frozenset(branch.bind), _compile_lookup_collection(levels))
+            if callable(header):
+                predicates.append((header, node))
+            else:
+                literals[header] = node
+
+        result[key] = _TrieBranches(
+            literals,
+            tuple(predicates),
+            None if default is None else _TrieNode(frozenset(default.bind), _compile_lookup_collection(default.levels)),
+            frozenset(branches["*"].bind) if "*" in branches else None,
+        )
+
+    return result
+
+
 def _merge_lookup_collection(current: LookupCollection, other: LookupCollection):
     for key, branches in current.items():
         if (other_branches := other.pop(key, None)) is None:
@@ -54,6 +99,19 @@ def _merge_lookup_collection(current: LookupCollection, other: LookupCollection)
 
 
 class TargetOverload(FnOverload):
+    dispatch_key_hashable = True
+
+    compiled: dict[int, tuple[LookupCollection, dict[str, _TrieBranches]]]
+    # layout: {id(collection): (collection, trie)}, dropped as a whole when the artifacts change.
+    compiled_version: int
+    valued_keys: set[str]
+    # keys having literal or predicate branches, the only ones whose values affect the lookup.
+
+    def __init__(self) -> None:
+        self.compiled = {}
+        self.compiled_version = _runtime.artifacts_version
+        self.valued_keys = set()
+
     def collect_entity(
         self,
         collector: BaseCollector,
@@ -79,6 +137,9 @@ class TargetOverload(FnOverload):
                 branch = LookupBranch(LookupBranchMetadata(), {})
 
             for item in pattern_items:
+                if item.literal is not None or item.predicate is not None:
+                    self.valued_keys.add(item.name)
+
                 if item.name not in processing_level:
                     processing_level[item.name] = {}
 
@@ -93,48 +154,67 @@ class TargetOverload(FnOverload):
 
             branch.bind.add(record)
 
+    def get_compiled(self, collection: LookupCollection) -> dict[str, _TrieBranches]:
+        if self.compiled_version != _runtime.artifacts_version:
+            # replaced or modified scopes are only left behind by artifact changes.
+            self.compiled.clear()
+            self.compiled_version = _runtime.artifacts_version
+
+        record = self.compiled.get(id(collection))
+        if record is not None and record[0] is collection:
+            return record[1]
+
+        compiled = _compile_lookup_collection(collection)
+        self.compiled[id(collection)] = (collection, compiled)
+        return compiled
+
     def get_entities(self, scope: dict[Any, Any], args: dict[str, Selector]) -> set[tuple[BaseCollector, Callable]]:
-        bind_sets: list[set] = []
+        bind_sets: list[frozenset] = []
 
         for arg_name, selector in args.items():
             if arg_name not in scope:
                 raise NotImplementedError
 
-            def get_bind_set():
-                processing_scope: LookupCollection = scope[arg_name]
-                branch = None
-                for key, value in selector.pattern.items():
-                    if (branches := processing_scope.get(key)) is None:
-                        raise NotImplementedError
+            levels = self.get_compiled(scope[arg_name])
+            node = None
+
+            for key, value in selector.pattern.items():
+                if (branches := levels.get(key)) is None:
+                    raise NotImplementedError
 
-                    if value in branches:
-                        header = value
+                if (node := branches.literals.get(value)) is None:
+                    for predicate, node in branches.predicates:
+                        if predicate(value):
+                            break  # hit predicate
                     else:
-                        for _key, branch in branches.items():
-                            if callable(_key) and _key(value):
-                                header = _key
-                                break  # hit predicate
+                        if branches.default is not None:
+                            node = branches.default  # hit default
+                        elif branches.wildcard is not None:
+                            bind_sets.append(branches.wildcard)  # hit wildcard
+                            break
                         else:
-                            if None in branches:
-                                header = None  # hit default
-                            elif "*" in branches:
-                                return branches["*"].bind  # hit wildcard
-                            else:
-                                raise NotImplementedError
-
-                    branch = branches[header]
-                    processing_scope = branch.levels
-
-                    if header is not None and None in branches:
-                        processing_scope = branches[None].levels | processing_scope
-                if branch is not None and branch.bind:
-                    # branch has bind
-                    return branch.bind
+                            raise NotImplementedError
 
-                raise NotImplementedError
+                levels = node.levels
+            else:
+                if node is None or not node.bind:
+                    raise NotImplementedError
+                bind_sets.append(node.bind)
+
+        if len(bind_sets) == 1:
+            return bind_sets[0]  # type: ignore
+        return bind_sets.pop().intersection(*bind_sets)  # type: ignore
 
-            bind_sets.append(get_bind_set())
-        return bind_sets.pop().intersection(*bind_sets)
+    def get_selector_key(self, selector: Selector) -> Hashable:
+        # the path of the selector, with only the values that can choose among branches,
+        # so that every member or group of the same shape shares one dispatch record.
+        valued_keys = self.valued_keys
+        if not valued_keys:
+            return selector.path
+        return tuple([(k, v if k in valued_keys else None) for k, v in selector.pattern.items()])
+
+    def get_dispatch_key(self, args: dict[str, Selector]) -> Hashable:
+        return tuple([self.get_selector_key(selector) for selector in args.values()])
 
     def merge_scopes(self, *scopes: dict[Any, Any]):
         # scope layout: {
@@ -151,5 +231,16 @@ class TargetOverload(FnOverload):
             result[param] = current = collections.pop(0)
             for other in collections:
                 _merge_lookup_collection(current, other)
+            self.get_compiled(current)
 
         return result
+
+
+class BatchTargetOverload(TargetOverload):
+    """Dispatches a batch of targets by its first one, so the batch should share the same target pattern."""
+
+    def get_entities(self, scope: dict[Any, Any], args: dict[str, Sequence[Selector]]):
+        return super().get_entities(scope, {name: targets[0] for name, targets in args.items()})
+
+    def get_dispatch_key(self, args: dict[str, Sequence[Selector]]) -> Hashable:
+        return tuple([self.get_selector_key(targets[0]) for targets in args.values()])
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from functools import reduce
-from typing import TYPE_CHECKING, Any, Callable, ChainMap, overload
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Iterable, overload
 
 from typing_extensions import ParamSpec, TypeVar, Unpack
 
@@ -16,11 +16,14 @@ from avilla.core.selector import (
 from graia.ryanvk import BaseCollector
 from graia.ryanvk import Staff as BaseStaff
 
-from .descriptor.query import find_querier_steps, query_depth_generator
+from .descriptor.query import QueryOptions, find_querier_plan, query_concurrent_generator
 
 if TYPE_CHECKING:
+    from avilla.core.account import BaseAccount
+    from avilla.core.application import Avilla
     from avilla.core.metadata import Metadata
     from avilla.core.resource import Resource
+    from avilla.core.utilles.metadata_cache import MetadataCache
 
     from .descriptor.query import QueryHandler, QueryHandlerPerform
 
@@ -30,7 +33,6 @@ R = TypeVar("R", covariant=True)
 M = TypeVar("M", bound="Metadata")
 P = ParamSpec("P")
 P1 = ParamSpec("P1")
-N = TypeVar("N")
 Co = TypeVar("Co", bound="BaseCollector")
 
 
@@ -64,12 +66,105 @@ class Staff(BaseStaff):
         target: Selector,
         route: ...,
     ):
-        return await self.call_fn(CoreCapability.pull, target, route)
+        account: BaseAccount | None = self.components.get("account")
+        avilla: Avilla | None = self.components.get("avilla")
+        if account is None or avilla is None or route.has_params():
+            return await self.call_fn(CoreCapability.pull, target, route)
+
+        cache = self.metadata_cache
+        if cache is not None and (result := cache.get((target, route))) is not None:
+            return result
+
+        async def pull():
+            result = await self.call_fn(CoreCapability.pull, target, route)
+            if cache is not None:
+                cache.set((target, route), result)
+            return result
+
+        # coalesced across the staffs sharing the account and the artifacts, whose pulls resolve the same way;
+        # like the cache, other components (e.g. the context a pull is made in) are assumed not to affect the result.
+        key = (account.route, self.artifact_view, target, route)
+        return await avilla.service.metadata_flight.run(key, pull)
+
+    async def pull_metadata_many(
+        self,
+        targets: Iterable[Selector],
+        route: type[M] | MetadataRoute[Unpack[tuple[Any, ...]], M],
+        *,
+        concurrency: int = 16,
+    ) -> dict[Selector, M]:
+        targets = list(dict.fromkeys(targets))
+        result: dict[Selector, Any] = {}
+
+        cache = None if route.has_params() else self.metadata_cache
+        if cache is not None:
+            for target in targets:
+                if (value := cache.get((target, route))) is not None:
+                    result[target] = value
+
+        # targets served by the same batched implementation are pulled together.
+        batches: dict[tuple[BaseCollector, Callable], list[Selector]] = {}
+        fallback: list[Selector] = []
+        behavior = CoreCapability.pull_many.behavior
+        for target in targets:
+            if target in result:
+                continue
+            try:
+                record = behavior.harvest_overload(self, CoreCapability.pull_many, [target], route)
+            except NotImplementedError:
+                fallback.append(target)
+            else:
+                batches.setdefault(record, []).append(target)
+
+        for (collector, entity), batch in batches.items():
+            values = await CoreCapability.pull_many.execute(self, collector, entity, batch, route)
+            for target in batch:
+                if target in values:
+                    result[target] = values[target]
+                    if cache is not None:
+                        cache.set((target, route), values[target])
+                else:
+                    fallback.append(target)
+
+        if fallback:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def pull(target: Selector):
+                async with semaphore:
+                    result[target] = await self.pull_metadata(target, route)
+
+            await asyncio.gather(*(pull(target) for target in fallback))
+
+        return {target: result[target] for target in targets}
+
+    def sideload_metadata(self, target: Selector, *values: Metadata):
+        """Feeds metadata obtained along the way (e.g. from a member list) into the metadata cache,
+        so that the later pulls of them won't hit the remote."""
+        cache = self.metadata_cache
+        if cache is None:
+            return
+
+        for value in values:
+            cache.set((target, value.route), value)
 
-    async def query_entities(self, pattern: str, **predicators: FollowsPredicater):
+    @property
+    def metadata_cache(self) -> MetadataCache | None:
+        account: BaseAccount | None = self.components.get("account")
+        avilla: Avilla | None = self.components.get("avilla")
+        if account is None or avilla is None or not avilla.service.enabled_cache_metadata:
+            return
+        return avilla.service.metadata_cache[account.route]
+
+    async def query_entities(
+        self, pattern: str, options: QueryOptions | None = None, /, **predicators: FollowsPredicater
+    ):
+        """Queries the selectors matching `pattern`; every step of the pattern fans out concurrently,
+        as bounded by `options`, which is positional so that no predicator name is taken."""
+        options = options or QueryOptions()
         items = _parse_follows(pattern, **predicators)
-        artifact_map = ChainMap(*self.artifact_collections)
-        steps = find_querier_steps(artifact_map, items)
+        view = self.artifact_view
+        artifact_map = view.mapping
+        steps = find_querier_plan(view, items)
 
         if steps is None:
             return
@@ -78,16 +173,16 @@ class Staff(BaseStaff):
             async def handler(predicate: Callable[[str, str], bool] | str, previous: Selector | None = None):
                 collector, entity = artifact
 
-                def _get_instance(_staff: Staff, _cls: type[N]) -> N:
-                    if _cls not in _staff.instances:
-                        res = _staff.instances[_cls] = _cls(_staff)
-                    else:
-                        res = _staff.instances[_cls]
+                instance = self.instances.get(collector.cls)
+                if instance is None:
+                    instance = self.instances[collector.cls] = collector.cls(self)
 
-                    return res
-
-                async for i in entity(_get_instance(self, collector.cls), predicate, previous):
-                    yield i
+                generator = entity(instance, predicate, previous)
+                try:
+                    async for i in generator:
+                        yield i
+                finally:
+                    await generator.aclose()
 
             return handler
 
@@ -106,17 +201,34 @@ class Staff(BaseStaff):
 
             return predicater
 
-        handlers = []
-        for follow_item, query_record in steps:
-            handlers.append((follow_item, build_handler(artifact_map[query_record])))
+        handlers = [
+            (build_handler(artifact_map[query_record]), build_predicate(follow_item))
+            for follow_item, query_record in steps
+        ]
+
+        results = query_concurrent_generator(handlers, options.concurrency, options.limit)
+        try:
+            async for i in results:
+                yield i
+        finally:
+            # cancels the running handlers right away when the caller stops early.
+            await results.aclose()
+
+
+class SharedStaff:
+    """Mixin building the staff of a connection (or alike) once, so that static perform instances are pooled
+    across the events it handles; the `get_staff_*` methods are to be implemented."""
+
+    _staff: Staff | None = None
+
+    def get_staff_components(self) -> dict[str, Any]:
+        raise NotImplementedError
 
-        r = reduce(
-            lambda previous, current: query_depth_generator(current[1], build_predicate(current[0]), previous),
-            handlers,
-            None,
-        )
-        if TYPE_CHECKING:
-            assert r is not None
+    def get_staff_artifacts(self) -> list[dict[Any, Any]]:
+        raise NotImplementedError
 
-        async for i in r:
-            yield i
+    @property
+    def staff(self) -> Staff:
+        if self._staff is None:
+            self._staff = Staff(self.get_staff_artifacts(), self.get_staff_components())
+        return self._staff
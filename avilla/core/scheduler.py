@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Coroutine, Hashable
+
+from loguru import logger
+
+
+class EventScheduler:
+    """Runs event handling jobs in ordered lanes.
+
+    Jobs submitted with the same lane key (usually the scene they happen in) run one by one in submit order,
+    while different lanes run concurrently, bounded by `max_concurrency` running jobs in total.
+
+    Pending jobs are unbounded unless `max_pending` is set, past which `submit` refuses the jobs,
+    and the protocols drop those events: their readers never wait for the scheduler,
+    as responses share the connection with the events that may be waiting for them.
+    """
+
+    max_concurrency: int
+    max_pending: int | None
+    lanes: dict[Hashable, deque[Coroutine[Any, Any, Any]]]
+    tasks: set[asyncio.Task]
+
+    def __init__(self, max_concurrency: int = 64, max_pending: int | None = None) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.lanes = {}
+        self.tasks = set()
+        self.pending = 0
+        self._semaphore = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # created lazily, so that it binds to the running loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def submit(self, key: Hashable, job: Coroutine[Any, Any, Any]) -> bool:
+        if self.max_pending is not None and self.pending >= self.max_pending:
+            job.close()
+            return False
+
+        self.pending += 1
+        lane = self.lanes.get(key)
+        if lane is not None:
+            lane.append(job)
+            return True
+
+        lane = self.lanes[key] = deque([job])
+        task = asyncio.create_task(self._run_lane(key, lane))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return True
+
+    async def _run_lane(self, key: Hashable, lane: deque[Coroutine[Any, Any, Any]]):
+        try:
+            while lane:
+                job = lane[0]
+                try:
+                    async with self.semaphore:
+                        await job
+                except Exception as e:
+                    logger.exception(f"Unhandled exception in event lane {key!r}: {e}")
+                finally:
+                    # the job stays queued while it runs, which keeps the lane open to the jobs submitted meanwhile.
+                    del lane[0]
+                    self.pending -= 1
+        finally:
+            for job in lane:
+                job.close()
+            self.pending -= len(lane)
+            del self.lanes[key]
+
+    @property
+    def lane_depths(self) -> dict[Hashable, int]:
+        """Jobs queued or running in each active lane."""
+        return {key: len(lane) for key, lane in self.lanes.items()}
+
+    @property
+    def max_lane_depth(self) -> int:
+        return max(map(len, self.lanes.values()), default=0)
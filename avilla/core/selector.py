@@ -4,9 +4,12 @@ import re
 from collections.abc import Callable, Mapping
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import filterfalse
-from types import MappingProxyType
-from typing import Protocol, runtime_checkable
+from sys import intern
+from types import MappingProxyType, MethodType
+from typing import ClassVar, Protocol, runtime_checkable
+from weakref import WeakValueDictionary
 
 from typing_extensions import Self, TypeAlias
 
@@ -19,7 +22,7 @@ _follows_pattern = re.compile(r"(?P<name>(\w+?|[*~]))(#(?P<predicate>\w+))?(\((?
 FollowsPredicater: TypeAlias = "Callable[[str], bool]"
 
 
-@dataclass
+@dataclass(frozen=True)
 class _FollowItem:
     name: str
     literal: str | None = None
@@ -51,7 +54,7 @@ def _parse_follows_item(item: str, items: dict[str, _FollowItem], predicates: di
     items[name] = _FollowItem(name, literal, predicate)
 
 
-def _parse_follows(pattern: str, **kwargs: FollowsPredicater) -> list[_FollowItem]:
+def _parse_follows_uncached(pattern: str, **kwargs: FollowsPredicater) -> list[_FollowItem]:
     items = {}
     item = ""
     bracket_stack = []
@@ -74,39 +77,129 @@ def _parse_follows(pattern: str, **kwargs: FollowsPredicater) -> list[_FollowIte
     return list(items.values())
 
 
+@lru_cache(maxsize=256)
+def _appender(name: str) -> Callable[[Selector, str], Selector]:
+    def appender(self: Selector, content: str) -> Selector:
+        return self.appendix(name, content)
+
+    return appender
+
+
+class FollowsPattern:
+    """A parsed follows pattern, compiled ones are cached by pattern string and predicate identities."""
+
+    items: tuple[_FollowItem, ...]
+
+    def __init__(self, items: tuple[_FollowItem, ...]) -> None:
+        self.items = items
+
+    @classmethod
+    def compile(cls, pattern: str, **predicates: FollowsPredicater) -> FollowsPattern:
+        try:
+            return _compile_follows(pattern, tuple(predicates.items()))
+        except TypeError:  # unhashable predicates
+            return cls(tuple(_parse_follows_uncached(pattern, **predicates)))
+
+    def match(self, selector: Selector) -> bool:
+        pattern = selector._items
+        index = 0
+        for index, (item, (name, value)) in enumerate(zip(self.items, pattern)):
+            if item.name == "*":
+                return True
+            if item.name != name:
+                return False
+            if item.predicate is not None and not item.predicate(value):
+                return False
+            if item.literal is not None and value != item.literal:
+                return False
+        return index + 1 == len(pattern)
+
+
+@lru_cache(maxsize=512)
+def _compile_follows(pattern: str, predicates: tuple[tuple[str, FollowsPredicater], ...]) -> FollowsPattern:
+    return FollowsPattern(tuple(_parse_follows_uncached(pattern, **dict(predicates))))
+
+
+def _parse_follows(pattern: str, **kwargs: FollowsPredicater) -> list[_FollowItem]:
+    return list(FollowsPattern.compile(pattern, **kwargs).items)
+
+
 class Selector:
-    pattern: Mapping[str, str]
+    __slots__ = ("_items", "_pattern", "_hash", "_display", "_path", "__weakref__")
+
+    _items: tuple[tuple[str, str], ...]
+    # keys are interned, as the same few keys are used by every selector.
+    _pattern: Mapping[str, str] | None
+    _hash: int | None
+    _display: str | None
+    _path: str | None
+
+    _interned: ClassVar[WeakValueDictionary[tuple[tuple[str, str], ...], Selector]] = WeakValueDictionary()
 
     def __init__(self, pattern: Mapping[str, str] = EMPTY_MAP) -> None:
-        self.pattern = MappingProxyType({k: str(v) for k, v in pattern.items()})
-        self._hash = hash(("Selector", *self.pattern.items()))
+        self._init_items(tuple((intern(k), str(v)) for k, v in pattern.items()))
+
+    def _init_items(self, items: tuple[tuple[str, str], ...]):
+        self._items = items
+        self._pattern = None
+        self._hash = None
+        self._display = None
+        self._path = None
+
+    def _derive(self, items: tuple[tuple[str, str], ...]) -> Self:
+        if type(self) is not Selector:
+            return self.modify(dict(items))
+
+        # fast path: no mapping is built until `pattern` is accessed.
+        instance = object.__new__(type(self))
+        instance._init_items(items)
+        return instance
+
+    @property
+    def pattern(self) -> Mapping[str, str]:
+        if self._pattern is None:
+            self._pattern = MappingProxyType(dict(self._items))
+        return self._pattern
 
     def modify(self, pattern: Mapping[str, str]) -> Self:
         return self.__class__(pattern=pattern)
 
+    def intern(self) -> Self:
+        """Returns the pooled selector equal to this one, which is kept as long as someone refers to it.
+
+        Interned selectors of the same pattern are identical, so they compare and hash as dict keys by identity.
+        Subclasses carry extra state (e.g. the context) and are returned as is.
+        """
+        if type(self) is not Selector:
+            return self
+
+        return self._interned.setdefault(self._items, self)  # type: ignore
+
     def __getattr__(self, name: str) -> Callable[[str], Self]:
         if name.startswith("__"):
             return super().__getattribute__(name)  # type: ignore
 
-        def wrapper(content: str) -> Self:
-            return self.modify({**self.pattern, name: str(content)})
-
-        return wrapper
+        return MethodType(_appender(name), self)
 
     def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(("Selector", *self._items))
         return self._hash
 
     def __eq__(self, o: object) -> bool:
-        return isinstance(o, self.__class__) and o._hash == self._hash
+        return isinstance(o, self.__class__) and (o is self or o._items == self._items)
 
     def __contains__(self, key: str) -> bool:
-        return key in self.pattern
+        return any(k == key for k, _ in self._items)
 
     def __getitem__(self, key: str) -> str:
-        return self.pattern[key]
+        for k, v in self._items:
+            if k == key:
+                return v
+        raise KeyError(key)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}().{'.'.join(f'{k}({v})' for k, v in self.pattern.items())}"
+        return f"{self.__class__.__name__}().{self.display}"
 
     def __copy__(self):
         return self.modify({**self.pattern})
@@ -117,43 +210,53 @@ class Selector:
 
     @property
     def empty(self) -> bool:
-        return not self.pattern
+        return not self._items
 
     @property
     def path(self) -> str:
-        return ".".join(self.pattern)
+        if self._path is None:
+            self._path = ".".join(k for k, _ in self._items)
+        return self._path
 
     @property
     def path_without_land(self) -> str:
-        return ".".join(filterfalse(lambda x: x == "land", self.pattern))
+        return ".".join(filterfalse(lambda x: x == "land", (k for k, _ in self._items)))
 
     @property
     def display(self) -> str:
-        return ".".join(f"{k}({v})" for k, v in self.pattern.items())
+        if self._display is None:
+            self._display = ".".join(f"{k}({v})" for k, v in self._items)
+        return self._display
 
     @property
     def display_without_land(self) -> str:
-        return ".".join(f"{k}({v})" for k, v in self.pattern.items() if k != "land")
+        return ".".join(f"{k}({v})" for k, v in self._items if k != "land")
 
     @property
     def last_key(self) -> str:
-        return next(reversed(self.pattern.keys()))
+        return self._items[-1][0]
 
     @property
     def last_value(self) -> str:
-        return next(reversed(self.pattern.values()))
+        return self._items[-1][1]
 
     def items(self):
         return self.pattern.items()
 
     def appendix(self, key: str, value: str):
-        return self.modify({**self.pattern, key: str(value)})
+        key = intern(key)
+        value = str(value)
+        items = self._items
+        for index, (k, _) in enumerate(items):
+            if k == key:  # replaced in place, as a dict update does.
+                return self._derive((*items[:index], (key, value), *items[index + 1 :]))
+        return self._derive((*items, (key, value)))
 
     def land(self, land: Land | str):
         if isinstance(land, Land):
             land = land.name
 
-        return self.modify({"land": land, **{k: v for k, v in self.pattern.items() if k != "land"}})
+        return self._derive((("land", str(land)), *((k, v) for k, v in self._items if k != "land")))
 
     def to_selector(self):
         return self
@@ -171,18 +274,7 @@ class Selector:
     from_follows_pattern = from_follows
 
     def follows(self, pattern: str, **kwargs: FollowsPredicater) -> bool:
-        items = _parse_follows(pattern, **kwargs)
-        index = 0
-        for index, (item, name, value) in enumerate(zip(items, self.pattern.keys(), self.pattern.values())):
-            if item.name == "*":
-                return True
-            if item.name != name:
-                return False
-            if item.predicate is not None and not item.predicate(value):
-                return False
-            if item.literal is not None and value != item.literal:
-                return False
-        return index + 1 == len(self.pattern)
+        return FollowsPattern.compile(pattern, **kwargs).match(self)
 
     def into(self, pattern: str, **kwargs: str) -> Self:
         items = _parse_follows(pattern)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
@@ -7,6 +8,8 @@ from launart import Launart, Service
 from loguru import logger
 
 from avilla.core.utilles.message_cache import MessageCacheDeque
+from avilla.core.utilles.metadata_cache import MetadataCache
+from avilla.core.utilles.single_flight import SingleFlight
 from avilla.standard.core.application import (
     ApplicationClosed,
     ApplicationClosing,
@@ -28,12 +31,20 @@ class AvillaService(Service):
     avilla: Avilla
     enabled_cache_message: bool
     message_cache: defaultdict[Selector, MessageCacheDeque]
+    enabled_cache_metadata: bool
+    metadata_cache: defaultdict[Selector, MetadataCache]
+    metadata_flight: SingleFlight
 
-    def __init__(self, avilla: Avilla, cache_size: int):
+    def __init__(
+        self, avilla: Avilla, cache_size: int, metadata_cache_size: int = 0, metadata_cache_ttl: float = 60.0
+    ):
         self.avilla = avilla
         if cache_size > 0:
             self.enabled_cache_message = True
             self.message_cache = defaultdict(lambda: MessageCacheDeque(cache_size))
+        self.enabled_cache_metadata = metadata_cache_size > 0 and metadata_cache_ttl > 0
+        self.metadata_cache = defaultdict(lambda: MetadataCache(metadata_cache_size, metadata_cache_ttl))
+        self.metadata_flight = SingleFlight()
         super().__init__()
 
     @property
@@ -67,5 +78,7 @@ class AvillaService(Service):
 
         async with self.stage("cleanup"):
             await self.avilla.broadcast.postEvent(ApplicationClosing(self.avilla))
+            # lets the records queued so far reach the sinks before exiting.
+            await asyncio.to_thread(self.avilla.event_recorder.close, 5.0)
 
         await self.avilla.broadcast.postEvent(ApplicationClosed(self.avilla))
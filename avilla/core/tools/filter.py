@@ -12,7 +12,7 @@ from typing_extensions import ParamSpec
 from avilla.core.account import BaseAccount
 from avilla.core.context import Context
 from avilla.core.event import MetadataModified
-from avilla.core.selector import Selectable, Selector
+from avilla.core.selector import FollowsPattern, Selectable, Selector
 from avilla.core.utilles import classproperty
 
 T = TypeVar("T", covariant=True)
@@ -107,7 +107,8 @@ class Filter(BaseDispatcher, Generic[T]):
         return self.assert_true(lambda result: all(func(result) for func in funcs))
 
     def follows(self: Filter[Selectable], *patterns: str) -> Filter[Selectable]:
-        return self.assert_true(lambda result: any(result.to_selector().follows(pattern) for pattern in patterns))
+        compiled = [FollowsPattern.compile(pattern) for pattern in patterns]
+        return self.assert_true(lambda result: any(i.match(result.to_selector()) for i in compiled))
 
     @classproperty
     @classmethod
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_max_workers: int | None = None
+offload_threshold: int = 64 * 1024
+"""Data smaller than this (in bytes) is handled on the event loop, since the thread hop would cost more."""
+
+
+def configure(max_workers: int | None = None, threshold: int | None = None):
+    global _executor, _max_workers, offload_threshold
+
+    if threshold is not None:
+        offload_threshold = threshold
+    if max_workers != _max_workers:
+        _max_workers = max_workers
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(_max_workers, thread_name_prefix="avilla-io")
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args) -> T:
+    return await asyncio.get_running_loop().run_in_executor(get_executor(), partial(func, *args))
+
+
+async def read_file(path: Path) -> bytes:
+    if path.stat().st_size < offload_threshold:
+        return path.read_bytes()
+    return await run_blocking(path.read_bytes)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+
+async def b64encode(data: bytes) -> str:
+    if len(data) < offload_threshold:
+        return _b64encode(data)
+    return await run_blocking(_b64encode, data)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    name: str
+    loads: Callable[[str | bytes], Any]
+    dumps: Callable[[Any], str]
+
+
+def _stdlib() -> JsonCodec:
+    return JsonCodec("json", json.loads, json.dumps)
+
+
+def _orjson() -> JsonCodec:
+    import orjson
+
+    options = orjson.OPT_NON_STR_KEYS
+
+    def _loads(data: str | bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:  # e.g. integers beyond 64 bits, which the stdlib still handles.
+            return json.loads(data)
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=options).decode("utf-8")
+        except TypeError:  # same as above.
+            return json.dumps(obj)
+
+    return JsonCodec("orjson", _loads, _dumps)
+
+
+def _msgspec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return encoder.encode(obj).decode("utf-8")
+        except (TypeError, msgspec.EncodeError):
+            return json.dumps(obj)
+
+    return JsonCodec("msgspec", decoder.decode, _dumps)
+
+
+CODECS: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _stdlib,
+}
+"""Known codecs by name, in the order of preference."""
+
+_codec: JsonCodec | None = None
+
+
+def _best() -> JsonCodec:
+    for factory in CODECS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return _stdlib()
+
+
+def get_codec() -> JsonCodec:
+    global _codec
+
+    if _codec is None:
+        _codec = _best()
+    return _codec
+
+
+def set_codec(codec: JsonCodec | str | None):
+    """Switches the codec used by every transport; `None` picks the fastest one installed."""
+    global _codec
+
+    if codec is None:
+        _codec = _best()
+    elif isinstance(codec, str):
+        if codec not in CODECS:
+            raise ValueError(f"unknown json codec: {codec}")
+        _codec = CODECS[codec]()
+    else:
+        _codec = codec
+
+
+def loads(data: str | bytes) -> Any:
+    return get_codec().loads(data)
+
+
+def dumps(obj: Any) -> str:
+    return get_codec().dumps(obj)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Union
+
+from avilla.core.utilles.ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+    from avilla.core.metadata import Metadata, MetadataRoute
+    from avilla.core.selector import Selector
+
+    _Route = Union[type[Metadata], MetadataRoute]
+
+
+class MetadataCache(TTLCache["tuple[Selector, _Route]", Any]):
+    """Account-scoped cache of pulled metadata, keyed by (target, route).
+
+    The cached routes are indexed by target as well, so that a target is invalidated along with its descendants.
+    """
+
+    _targets: dict[Selector, set[_Route]]
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0) -> None:
+        super().__init__(max_size, ttl)
+        self._targets = {}
+
+    def set(self, key: tuple[Selector, _Route], value: Any):
+        super().set(key, value)
+        if key in self.records:
+            target, route = key
+            self._targets.setdefault(target, set()).add(route)
+
+    def invalidate(self, target: Selector, route: _Route | None = None, *, descendants: bool = False):
+        """Drops the cached `route` of `target`, or all of its routes if `route` is None.
+
+        With `descendants`, the selectors under `target` (e.g. the members of a group) are dropped too.
+        """
+        targets = [target]
+        if descendants:
+            depth = len(target._items)
+            targets = [i for i in self._targets if i._items[:depth] == target._items]
+
+        for i in targets:
+            routes = [route] if route is not None else list(self._targets.get(i, ()))
+            for r in routes:
+                if (i, r) in self.records:
+                    self._discard((i, r))
+
+    def clear(self):
+        super().clear()
+        self._targets.clear()
+
+    def _discard(self, key: tuple[Selector, _Route]):
+        super()._discard(key)
+
+        target, route = key
+        routes = self._targets[target]
+        routes.discard(route)
+        if not routes:
+            del self._targets[target]
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Merges concurrent calls with the same key into one in-flight call, whose result is shared by all callers."""
+
+    flights: dict[Hashable, asyncio.Future[Any]]
+
+    def __init__(self) -> None:
+        self.flights = {}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        try:
+            flight = self.flights.get(key)
+        except TypeError:  # unhashable key, nothing to merge with.
+            return await factory()
+
+        if flight is None:
+            flight = self.flights[key] = asyncio.ensure_future(factory())
+            flight.add_done_callback(lambda _: self.flights.pop(key, None))
+
+        # shielded, so that a cancelled caller does not cancel the call for the others.
+        return await asyncio.shield(flight)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from functools import wraps
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from graia.broadcast import Broadcast
+
+
+class SubscriptionIndex:
+    """Tells whether any Broadcast listener listens to an event type, so that protocols can skip
+    building the events nobody receives.
+
+    Broadcast matches listeners by the exact event class, and so does the index.
+    It is outdated through `Broadcast.receiver` and `Broadcast.removeListener`, and rebuilt as well
+    when the count of listeners changes, which covers the listeners appended to `Broadcast.listeners` directly.
+    Listeners in disabled namespaces, or removed by returning `RemoveMe`, may still be counted,
+    which only keeps some events built in vain.
+
+    Avilla's own listeners are counted like any other: with the metadata cache enabled,
+    the events invalidating it (`MetadataModified`, `MemberCreated`, `SceneDestroyed`, ...) are always listened,
+    and so is `MessageReceived` with the message cache enabled, as skipping them would leave the caches stale."""
+
+    broadcast: Broadcast
+    enabled: bool
+    _listened: set[type] | None
+    _listener_count: int
+
+    def __init__(self, broadcast: Broadcast, enabled: bool = True):
+        self.broadcast = broadcast
+        self.enabled = enabled
+        self._listened = None
+        self._listener_count = -1
+        self._hook()
+
+    def _hook(self):
+        broadcast = self.broadcast
+        receiver = broadcast.receiver
+        remove_listener = broadcast.removeListener
+
+        @wraps(receiver)
+        def hooked_receiver(*args, **kwargs):
+            wrapper = receiver(*args, **kwargs)
+
+            def hooked_wrapper(callable_target):
+                # `Broadcast.receiver` may append the event to an already registered listener.
+                result = wrapper(callable_target)
+                self.outdate()
+                return result
+
+            return hooked_wrapper
+
+        @wraps(remove_listener)
+        def hooked_remove_listener(target):
+            remove_listener(target)
+            self.outdate()
+
+        broadcast.receiver = hooked_receiver
+        broadcast.removeListener = hooked_remove_listener
+
+    def outdate(self):
+        self._listened = None
+
+    def _rebuild(self) -> set[type]:
+        listeners = self.broadcast.listeners
+        listened = set()
+        for listener in listeners:
+            listened.update(listener.listening_events)
+
+        self._listened = listened
+        self._listener_count = len(listeners)
+        return listened
+
+    def listened(self, *event_types: type) -> bool:
+        if not self.enabled:
+            return True
+
+        listened = self._listened
+        if listened is None or len(self.broadcast.listeners) != self._listener_count:
+            listened = self._rebuild()
+        return any(event_type in listened for event_type in event_types)
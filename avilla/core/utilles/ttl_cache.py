@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from time import monotonic
+from typing import Generic, Hashable, TypeVar, overload
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+D = TypeVar("D")
+
+
+class TTLCache(Generic[K, V]):
+    """A LRU cache whose entries expire `ttl` seconds after being stored; disabled when `max_size` or `ttl` is 0."""
+
+    ttl: float
+    max_size: int
+    records: OrderedDict[K, tuple[float, V]]
+    generation: int
+    # bumped on every clear, so that values fetched before a clear are not stored after it.
+
+    def __init__(self, max_size: int = 256, ttl: float = 10.0) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.records = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, key: K):
+        record = self.records.get(key)
+        return record is not None and record[0] >= monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    @overload
+    def get(self, key: K) -> V | None:
+        ...
+
+    @overload
+    def get(self, key: K, default: D) -> V | D:
+        ...
+
+    def get(self, key: K, default: D | None = None) -> V | D | None:
+        record = self.records.get(key)
+        if record is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = record
+        if expires_at < monotonic():
+            self._discard(key)
+            self.misses += 1
+            return default
+
+        self.records.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V):
+        if not self.enabled:
+            return
+
+        self.records[key] = (monotonic() + self.ttl, value)
+        self.records.move_to_end(key)
+        while len(self.records) > self.max_size:
+            self._discard(next(iter(self.records)))
+
+    def clear(self):
+        self.records.clear()
+        self.generation += 1
+
+    def _discard(self, key: K):
+        # every entry leaves through here but on clear, so that subclasses may keep their indexes in sync.
+        del self.records[key]
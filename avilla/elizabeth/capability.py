@@ -4,14 +4,62 @@ from typing import TYPE_CHECKING, Any
 
 from graia.amnesia.message import Element, MessageChain
 
-from avilla.core.event import AvillaEvent
+from avilla.core.event import (
+    AvillaEvent,
+    DirectSessionCreated,
+    DirectSessionDestroyed,
+    MemberCreated,
+    MemberDestroyed,
+    MetadataModified,
+    SceneCreated,
+    SceneDestroyed,
+)
 from avilla.core.ryanvk.collector.application import ApplicationCollector
+from avilla.standard.core.activity import ActivityTrigged
+from avilla.standard.core.message import MessageReceived, MessageRevoked
+from avilla.standard.core.request import RequestReceived
 from graia.ryanvk import Fn, PredicateOverload, TypeOverload
 
 if TYPE_CHECKING:
     pass
 
 
+# the events each raw event type may turn into, used to skip the frames nobody listens to.
+EVENT_ROUTES: dict[str, tuple[type[AvillaEvent], ...]] = {
+    "FriendMessage": (MessageReceived,),
+    "GroupMessage": (MessageReceived,),
+    "FriendRecallEvent": (MessageRevoked,),
+    "GroupRecallEvent": (MessageRevoked,),
+    "NudgeEvent": (ActivityTrigged,),
+    "FriendInputStatusChangedEvent": (MetadataModified,),
+    "FriendNickChangedEvent": (MetadataModified,),
+    "BotGroupPermissionChangeEvent": (MetadataModified,),
+    "BotMuteEvent": (MetadataModified,),
+    "BotUnmuteEvent": (MetadataModified,),
+    "GroupNameChangeEvent": (MetadataModified,),
+    "GroupMuteAllEvent": (MetadataModified,),
+    "GroupEntranceAnnouncementChangeEvent": (MetadataModified,),
+    "MemberCardChangeEvent": (MetadataModified,),
+    "MemberSpecialTitleChangeEvent": (MetadataModified,),
+    "MemberPermissionChangeEvent": (MetadataModified,),
+    "MemberMuteEvent": (MetadataModified,),
+    "MemberUnmuteEvent": (MetadataModified,),
+    "MemberHonorChangeEvent": (MetadataModified,),
+    "FriendAddEvent": (DirectSessionCreated,),
+    "FriendDeleteEvent": (DirectSessionDestroyed,),
+    "MemberJoinEvent": (MemberCreated,),
+    "MemberLeaveEventKick": (MemberDestroyed,),
+    "MemberLeaveEventQuit": (MemberDestroyed,),
+    "BotJoinGroupEvent": (SceneCreated,),
+    "BotLeaveEventActive": (SceneDestroyed,),
+    "BotLeaveEventKick": (SceneDestroyed,),
+    "BotLeaveEventDisband": (SceneDestroyed,),
+    "MemberJoinRequestEvent": (RequestReceived,),
+    "NewFriendRequestEvent": (RequestReceived,),
+    "BotInvitedJoinGroupRequestEvent": (RequestReceived,),
+}
+
+
 class ElizabethCapability((m := ApplicationCollector())._):
     @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["raw_event"]})
     async def event_callback(self, raw_event: dict) -> AvillaEvent | None:
@@ -44,6 +92,7 @@ class ElizabethCapability((m := ApplicationCollector())._):
     async def handle_event(self, event: dict):
         maybe_event = await self.event_callback(event)
 
-        if maybe_event is not None:
+        # events of types unknown to EVENT_ROUTES are built anyway, but neither recorded nor posted for no one.
+        if maybe_event is not None and self.avilla.subscriptions.listened(type(maybe_event)):
             self.avilla.event_record(maybe_event)
             self.avilla.broadcast.postEvent(maybe_event)
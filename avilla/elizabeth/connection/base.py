@@ -8,9 +8,9 @@ from loguru import logger
 from typing_extensions import Self
 
 from avilla.core.exceptions import InvalidAuthentication
-from avilla.core.ryanvk.staff import Staff
+from avilla.core.ryanvk.staff import SharedStaff
 from avilla.core.selector import Selector
-from avilla.elizabeth.capability import ElizabethCapability
+from avilla.elizabeth.capability import EVENT_ROUTES, ElizabethCapability
 from avilla.standard.core.account import AccountAvailable
 
 from .util import validate_response
@@ -23,13 +23,23 @@ T = TypeVar("T", bound="ElizabethNetworking")
 CallMethod = Literal["get", "post", "fetch", "update", "multipart"]
 
 
-class ElizabethNetworking:
+def event_scene(body: dict) -> int | None:
+    """The group or the friend an event happens with, as far as mirai tells, which events are laned by."""
+    # "operator" is a bare id in some events, e.g. FriendRecallEvent.
+    user = next((v for k in ("sender", "member", "operator", "friend") if isinstance(v := body.get(k), dict)), {})
+    group = user.get("group") or body.get("group") or body.get("subject") or {}
+    return group.get("id") or body.get("groupId") or user.get("id") or body.get("fromId")
+
+
+class ElizabethNetworking(SharedStaff):
     protocol: ElizabethProtocol
     response_waiters: dict[str, asyncio.Future]
     close_signal: asyncio.Event
 
     account_id: int
     session_key: str | None = None
+    # whether media from local files and raw bytes are uploaded as multipart, or inlined as base64.
+    upload_media: bool = False
 
     def __init__(self, protocol: ElizabethProtocol):
         super().__init__()
@@ -43,10 +53,6 @@ class ElizabethNetworking:
     def get_staff_artifacts(self):
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
-    @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
-
     def message_receive(self) -> AsyncIterator[tuple[Self, dict]]:
         ...
 
@@ -61,6 +67,7 @@ class ElizabethNetworking:
         ...
 
     async def message_handle(self):
+        subscriptions = self.protocol.avilla.subscriptions
         async for connection, data in self.message_receive():
             if "code" in data:
                 validate_response(data)
@@ -87,6 +94,10 @@ class ElizabethNetworking:
             if "type" not in body:
                 continue
 
+            # routed on the event type only, so the events nobody listens to are never deserialized.
+            if (routes := EVENT_ROUTES.get(body["type"])) is not None and not subscriptions.listened(*routes):
+                continue
+
             async def event_parse_task(data: dict):
                 event_type = data["type"]
                 with suppress(NotImplementedError):
@@ -95,7 +106,10 @@ class ElizabethNetworking:
 
                 logger.warning(f"received unsupported event {event_type}: {data}")
 
-            asyncio.create_task(event_parse_task(body))
+            if not self.protocol.avilla.event_scheduler.submit(
+                ("elizabeth", self.account_id, event_scene(body)), event_parse_task(body)
+            ):
+                logger.warning(f"too many pending events, dropped event: {body}")
 
     async def connection_closed(self):
         self.session_key = None
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from contextlib import suppress
 from typing import TYPE_CHECKING, cast
 
@@ -13,6 +12,7 @@ from loguru import logger
 
 from avilla.core.account import AccountInfo
 from avilla.core.selector import Selector
+from avilla.core.utilles.json_codec import dumps, loads
 from avilla.elizabeth.account import ElizabethAccount
 from avilla.elizabeth.connection.base import CallMethod
 from avilla.elizabeth.const import PLATFORM
@@ -37,6 +37,7 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
         super().__init__(protocol)
         self.config = config
         self.account_id = self.config.qq
+        self.upload_media = self.config.upload_media
 
     @property
     def id(self):
@@ -51,7 +52,7 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
                 self.close_signal.set()
                 break
             elif msg.type == aiohttp.WSMsgType.TEXT:
-                data: dict = json.loads(cast(str, msg.data))
+                data: dict = loads(cast(str, msg.data))
                 yield self, data
         else:
             await self.connection_closed()
@@ -60,18 +61,18 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
         if self.connection is None:
             raise RuntimeError("connection is not established")
 
-        await self.connection.send_json(payload)
+        await self.connection.send_json(payload, dumps=dumps)
 
     async def call_http(self, method: CallMethod, action: str, params: dict | None = None) -> dict:
         action = action.replace("_", "/")
         if method in {"get", "fetch"}:
             async with self.session.get((self.config.base_url / action).with_query(params or {})) as resp:
-                result = await resp.json()
+                result = await resp.json(loads=loads)
                 return validate_response(result)
 
         if method in {"post", "update"}:
             async with self.session.post((self.config.base_url / action), json=params or {}) as resp:
-                result = await resp.json()
+                result = await resp.json(loads=loads)
                 return validate_response(result)
 
         if method == "multipart":
@@ -85,7 +86,7 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
                     data.add_field(k, v)
 
             async with self.session.post((self.config.base_url / action), data=data) as resp:
-                result = await resp.json()
+                result = await resp.json(loads=loads)
                 return validate_response(result)
 
         raise ValueError(f"Unknown method {method}")
@@ -164,7 +165,7 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=dumps)
 
         async with self.stage("blocking"):
             await self.connection_daemon(manager, self.session)
@@ -34,12 +34,14 @@ class ElizabethMessageActionPerform((m := AccountCollector["ElizabethProtocol",
         *,
         reply: Selector | None = None,
     ) -> Selector:
+        # media uploaded while serializing are typed after the scene they are sent to.
+        staff = self.staff.ext({"upload_type": "group"})
         result = await self.account.connection.call(
             "update",
             "sendGroupMessage",
             {
                 "target": int(target.pattern["group"]),
-                "messageChain": [await self.staff.call_fn(ElizabethCapability.serialize_element, i) for i in message],
+                "messageChain": [await staff.call_fn(ElizabethCapability.serialize_element, i) for i in message],
                 **({"quote": reply.pattern["message"]} if reply is not None else {}),
             },
         )
@@ -70,12 +72,14 @@ class ElizabethMessageActionPerform((m := AccountCollector["ElizabethProtocol",
         *,
         reply: Selector | None = None,
     ) -> Selector:
+        # media uploaded while serializing are typed after the scene they are sent to.
+        staff = self.staff.ext({"upload_type": "friend"})
         result = await self.account.connection.call(
             "update",
             "sendFriendMessage",
             {
                 "target": int(target.pattern["friend"]),
-                "messageChain": [await self.staff.call_fn(ElizabethCapability.serialize_element, i) for i in message],
+                "messageChain": [await staff.call_fn(ElizabethCapability.serialize_element, i) for i in message],
                 **({"quote": reply.pattern["message"]} if reply is not None else {}),
             },
         )
@@ -47,7 +47,7 @@ class ElizabethEventMessagePerform((m := ConnectionCollector())._):
     @m.entity(ElizabethCapability.event_callback, raw_event="FriendMessage")
     async def friend(self, raw_event: dict):
         account = Selector().land("qq").account(str(self.connection.account_id))
-        friend = Selector().land(account["land"]).friend(str(raw_event["sender"]["id"]))
+        friend = Selector().land(account["land"]).friend(str(raw_event["sender"]["id"])).intern()
         context = Context(
             self.protocol.avilla.accounts[account].account,
             friend,
@@ -79,8 +79,8 @@ class ElizabethEventMessagePerform((m := ConnectionCollector())._):
         account = Selector().land("qq").account(str(self.connection.account_id))
         sender = raw_event["sender"]
         group_data = sender["group"]
-        group = Selector().land(account["land"]).group(str(group_data["id"]))
-        member = group.member(str(sender["id"]))
+        group = Selector().land(account["land"]).group(str(group_data["id"])).intern()
+        member = group.member(str(sender["id"])).intern()
         context = Context(
             self.protocol.avilla.accounts[account].account,
             member,
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import base64
 from dataclasses import asdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from avilla.core.elements import Audio, Face, Notice, NoticeAll, Picture, Text, Video
-from avilla.core.resource import LocalFileResource, RawResource, UrlResource
+from avilla.core.resource import LocalFileResource, RawResource, Resource, UrlResource
 from avilla.core.ryanvk.collector.account import AccountCollector
+from avilla.core.utilles.io import b64encode, read_file
 from avilla.elizabeth.capability import ElizabethCapability
 from avilla.elizabeth.resource import ElizabethImageResource, ElizabethVoiceResource, ElizabethVideoResource
 from avilla.standard.qq.elements import (
@@ -31,6 +31,35 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
 
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
+    async def upload(self, resource: Resource[bytes], kind: Literal["image", "voice"]) -> dict:
+        # sent as multipart, instead of inlining the base64 of the whole file into the payload.
+        if isinstance(resource, LocalFileResource):
+            data = await read_file(resource.file)
+        elif isinstance(resource, RawResource):
+            data = resource.data
+        else:
+            data = await self.account.staff.fetch_resource(resource)
+
+        return await self.account.connection.call(
+            "multipart",
+            f"upload{kind.capitalize()}",
+            {
+                "sessionKey": self.account.connection.session_key,
+                # one of "friend", "group" and "temp", set by the sending action.
+                "type": self.staff.components.get("upload_type", "group"),
+                "img" if kind == "image" else "voice": {"value": data, "filename": kind},
+            },
+        )
+
+    async def resource_base64(self, resource: Resource[bytes]) -> str:
+        if isinstance(resource, LocalFileResource):
+            data = await read_file(resource.file)
+        elif isinstance(resource, RawResource):
+            data = resource.data
+        else:
+            data = await self.account.staff.fetch_resource(resource)
+        return await b64encode(data)
+
     @m.entity(ElizabethCapability.serialize_element, element=Text)
     async def text(self, element: Text) -> dict:
         return {"type": "Plain", "text": element.text}
@@ -93,15 +122,11 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
                 "type": "Image",
                 "url": element.resource.url,
             }
-        elif isinstance(element.resource, LocalFileResource):
-            return {"type": "Image", "base64": base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")}
-        elif isinstance(element.resource, RawResource):
-            return {"type": "Image", "base64": base64.b64encode(element.resource.data).decode("utf-8")}
+        elif self.account.connection.upload_media:
+            result = await self.upload(element.resource, "image")
+            return {"type": "Image", "imageId": result["imageId"]}
         else:
-            return {
-                "type": "Image",
-                "base64": base64.b64encode(await self.account.staff.fetch_resource(element.resource)).decode("utf-8"),
-            }
+            return {"type": "Image", "base64": await self.resource_base64(element.resource)}
 
     @m.entity(ElizabethCapability.serialize_element, element=FlashImage)
     async def flash_image(self, element: FlashImage):
@@ -122,15 +147,11 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
                 "type": "Voice",
                 "url": element.resource.url,
             }
-        elif isinstance(element.resource, LocalFileResource):
-            return {"type": "Voice", "base64": base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")}
-        elif isinstance(element.resource, RawResource):
-            return {"type": "Voice", "base64": base64.b64encode(element.resource.data).decode("utf-8")}
+        elif self.account.connection.upload_media:
+            result = await self.upload(element.resource, "voice")
+            return {"type": "Voice", "voiceId": result["voiceId"]}
         else:
-            return {
-                "type": "Voice",
-                "base64": base64.b64encode(await self.account.staff.fetch_resource(element.resource)).decode("utf-8"),
-            }
+            return {"type": "Voice", "base64": await self.resource_base64(element.resource)}
 
     @m.entity(ElizabethCapability.serialize_element, element=Video)
     async def video(self, element: Video):
@@ -169,7 +190,7 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
                         "senderId": int(node.uid) if node.uid else None,
                         "senderName": node.name,
                         "time": int(node.time.timestamp()),
-                        "messageChain": await ElizabethCapability(self.account.staff).serialize_chain(node.content),
+                        "messageChain": await ElizabethCapability(self.staff).serialize_chain(node.content),
                     }
                 )
         return {"type": "Forward", "display": display, "nodeList": nodes}
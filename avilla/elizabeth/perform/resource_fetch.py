@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientSession
-
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.exceptions import UnknownTarget
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
@@ -28,6 +26,5 @@ class ElizabethResourceFetchPerform((m := ProtocolCollector["ElizabethProtocol"]
     async def fetch_resource(self, resource: ElizabethResource) -> bytes:
         if resource.url is None:
             raise UnknownTarget
-        async with ClientSession() as session:
-            async with session.get(resource.url, ssl=ssl_ctx) as resp:
-                return await resp.read()
+        async with self.protocol.avilla.http_session.get(resource.url, ssl=ssl_ctx) as resp:
+            return await resp.read()
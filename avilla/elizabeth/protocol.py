@@ -18,6 +18,7 @@ class ElizabethConfig(ProtocolConfig):
     host: str
     port: int
     access_token: str
+    upload_media: bool = False
     base_url: URL = field(init=False)
 
     def __post_init__(self):
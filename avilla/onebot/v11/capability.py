@@ -5,10 +5,23 @@ from typing import Any
 from graia.amnesia.message import Element, MessageChain
 
 from avilla.core import Selector
-from avilla.core.event import AvillaEvent
+from avilla.core.event import (
+    AvillaEvent,
+    DirectSessionCreated,
+    MemberCreated,
+    MemberDestroyed,
+    MetadataModified,
+    SceneCreated,
+    SceneDestroyed,
+)
 from avilla.core.ryanvk import TargetOverload
 from avilla.core.ryanvk.collector.application import ApplicationCollector
+from avilla.standard.core.activity import ActivityTrigged
 from avilla.standard.core.application import AvillaLifecycleEvent
+from avilla.standard.core.file import FileReceived
+from avilla.standard.core.message import MessageReceived, MessageRevoked, MessageSent
+from avilla.standard.core.request import RequestEvent
+from avilla.standard.qq.event import PocketLuckyKingNoticed
 from avilla.standard.qq.elements import Forward
 from graia.ryanvk import Fn, PredicateOverload, TypeOverload
 
@@ -23,6 +36,38 @@ def onebot11_event_type(raw: dict) -> str:
     )
 
 
+# the events each raw event type may turn into, used to skip the frames nobody listens to.
+# types handled with side effects (e.g. the lifecycle ones registering accounts) are left out and always handled.
+EVENT_ROUTES: dict[str, tuple[type[AvillaEvent], ...]] = {
+    "message.private.friend": (MessageReceived,),
+    "message.private.group": (MessageReceived,),
+    "message.private.other": (MessageReceived,),
+    "message.group.normal": (MessageReceived,),
+    "message.group.notice": (MessageReceived,),
+    "message.group.anonymous": (MessageReceived,),
+    "message_sent.group.normal": (MessageSent,),
+    "notice.group_recall": (MessageRevoked,),
+    "notice.friend_recall": (MessageRevoked,),
+    "notice.group_admin.set": (MetadataModified,),
+    "notice.group_admin.unset": (MetadataModified,),
+    "notice.group_decrease.leave": (MemberDestroyed,),
+    "notice.group_decrease.kick": (MemberDestroyed,),
+    "notice.group_decrease.kick_me": (SceneDestroyed,),
+    "notice.group_increase.approve": (SceneCreated, MemberCreated),
+    "notice.group_increase.invite": (SceneCreated, MemberCreated),
+    "notice.group_ban.ban": (MetadataModified,),
+    "notice.group_ban.lift_ban": (MetadataModified,),
+    "notice.friend_add": (DirectSessionCreated,),
+    "notice.notify.poke": (ActivityTrigged,),
+    "notice.notify.lucky_king": (PocketLuckyKingNoticed,),
+    "notice.notify.honor": (MetadataModified,),
+    "notice.group_upload": (FileReceived,),
+    "request.friend": (RequestEvent,),
+    "request.group.add": (RequestEvent,),
+    "request.group.invite": (RequestEvent,),
+}
+
+
 class OneBot11Capability((m := ApplicationCollector())._):
     @Fn.complex({PredicateOverload(lambda _, raw: onebot11_event_type(raw)): ["raw_event"]})
     async def event_callback(self, raw_event: dict) -> AvillaEvent | AvillaLifecycleEvent | None:
@@ -60,6 +105,7 @@ class OneBot11Capability((m := ApplicationCollector())._):
     async def handle_event(self, event: dict):
         maybe_event = await self.event_callback(event)
 
-        if maybe_event is not None:
+        # events of types unknown to EVENT_ROUTES are built anyway, but neither recorded nor posted for no one.
+        if maybe_event is not None and self.avilla.subscriptions.listened(type(maybe_event)):
             self.avilla.event_record(maybe_event)
             self.avilla.broadcast.postEvent(maybe_event)
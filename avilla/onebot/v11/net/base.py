@@ -2,25 +2,65 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
-from typing import TYPE_CHECKING, AsyncIterator
+from typing import TYPE_CHECKING, AsyncIterator, cast
 
 from loguru import logger
 from typing_extensions import Self
 
 from avilla.core.exceptions import ActionFailed
-from avilla.core.ryanvk.staff import Staff
-from avilla.onebot.v11.capability import OneBot11Capability
+from avilla.core.ryanvk.staff import SharedStaff
+from avilla.core.utilles.single_flight import SingleFlight
+from avilla.core.utilles.ttl_cache import TTLCache
+from avilla.onebot.v11.capability import EVENT_ROUTES, OneBot11Capability, onebot11_event_type
 
 if TYPE_CHECKING:
     from avilla.onebot.v11.account import OneBot11Account
     from avilla.onebot.v11.protocol import OneBot11Protocol
 
+_MISSING = object()
 
-class OneBot11Networking:
+
+class OneBot11Networking(SharedStaff):
     protocol: OneBot11Protocol
     accounts: dict[int, OneBot11Account]
     response_waiters: dict[str, asyncio.Future]
     close_signal: asyncio.Event
+    call_flight: SingleFlight
+    response_cache: TTLCache[tuple, dict | None]
+
+    # read-only actions, identical concurrent calls of which are merged into one request.
+    coalesced_actions: frozenset[str] = frozenset(
+        {
+            "get_login_info",
+            "get_stranger_info",
+            "get_friend_list",
+            "get_group_info",
+            "get_group_list",
+            "get_group_member_info",
+            "get_group_member_list",
+            "get_group_honor_info",
+            "get_msg",
+            "get_forward_msg",
+            "get_status",
+            "get_version_info",
+        }
+    )
+    # actions whose responses are cached in `response_cache`, feeding every metadata derived from them.
+    # the cache is off unless configured, as it only follows the notices and the set_/delete_ actions
+    # of this connection: `Context.pull(flush=True)` may still be served a cached response.
+    cached_actions: frozenset[str] = frozenset(
+        {
+            "get_login_info",
+            "get_stranger_info",
+            "get_group_info",
+            "get_group_member_info",
+            "get_msg",
+            "get_forward_msg",
+        }
+    )
+
+    # whether local files are sent as file:// URIs, for implementations running on the same filesystem.
+    local_file_uri: bool = False
 
     def __init__(self, protocol: OneBot11Protocol):
         super().__init__()
@@ -28,6 +68,8 @@ class OneBot11Networking:
         self.accounts = {}
         self.response_waiters = {}
         self.close_signal = asyncio.Event()
+        self.call_flight = SingleFlight()
+        self.response_cache = TTLCache(0, 0)
 
     def get_staff_components(self):
         return {"connection": self, "protocol": self.protocol, "avilla": self.protocol.avilla}
@@ -35,10 +77,6 @@ class OneBot11Networking:
     def get_staff_artifacts(self):
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
-    @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
-
     def message_receive(self) -> AsyncIterator[tuple[Self, dict]]:
         ...
 
@@ -53,28 +91,84 @@ class OneBot11Networking:
         ...
 
     async def message_handle(self):
+        scheduler = self.protocol.avilla.event_scheduler
+        subscriptions = self.protocol.avilla.subscriptions
+
         async for connection, data in self.message_receive():
             if echo := data.get("echo"):
                 if future := self.response_waiters.get(echo):
                     future.set_result(data)
                 continue
 
-            async def event_parse_task(data: dict):
-                with suppress(NotImplementedError):
-                    await OneBot11Capability(connection.staff).handle_event(data)
-                    return
+            if data.get("post_type") == "meta_event":
+                if (
+                    subscriptions.enabled
+                    and data.get("meta_event_type") == "heartbeat"
+                    and data.get("self_id") in self.accounts
+                ):
+                    # heartbeats of known accounts turn into no event at all.
+                    continue
+                # handled in order with the frames, so accounts are registered before their events are.
+                await self.event_parse(connection, data)
+                continue
+
+            if data.get("post_type") == "notice":
+                # notices are what change the groups and members, the cached responses may be outdated.
+                self.response_cache.clear()
+
+            # routed on the header fields only, so the frames nobody listens to are never deserialized.
+            if subscriptions.enabled and "post_type" in data:
+                routes = EVENT_ROUTES.get(onebot11_event_type(data))
+                if routes is not None and not subscriptions.listened(*routes):
+                    continue
 
-                logger.warning(f"received unsupported event: {data}")
+            # responses share the connection with events, so the reader never waits for the scheduler,
+            # which would block the responses that handlers may be waiting for.
+            lane = ("onebot11", data.get("self_id"), data.get("group_id") or data.get("user_id"))
+            if not scheduler.submit(lane, self.event_parse(connection, data)):
+                logger.warning(f"{self} too many pending events, dropped event: {data}")
 
-            asyncio.create_task(event_parse_task(data))
+    async def event_parse(self, connection: OneBot11Networking, data: dict):
+        with suppress(NotImplementedError):
+            await OneBot11Capability(connection.staff).handle_event(data)
+            return
+
+        logger.warning(f"received unsupported event: {data}")
 
     async def connection_closed(self):
+        self.response_cache.clear()
         self.close_signal.set()
 
     async def call(self, action: str, params: dict | None = None) -> dict | None:
         if not self.alive:
             raise RuntimeError("connection is not established")
 
+        if action not in self.coalesced_actions and action not in self.cached_actions:
+            if action.startswith(("set_", "delete_")):
+                # the cached responses may be outdated by the action.
+                self.response_cache.clear()
+            return await self.request(action, params)
+
+        key = (action, tuple(sorted((params or {}).items())))
+        if action not in self.cached_actions or not self.response_cache.enabled:
+            return await self.call_flight.run(key, lambda: self.request(action, params))
+
+        try:
+            cached = self.response_cache.get(key, _MISSING)
+        except TypeError:  # unhashable params
+            return await self.request(action, params)
+
+        if cached is not _MISSING:
+            return cast("dict | None", cached)
+
+        generation = self.response_cache.generation
+        result = await self.call_flight.run(key, lambda: self.request(action, params))
+        if self.response_cache.generation == generation:
+            # a clear during the request means the response may already be outdated.
+            self.response_cache.set(key, result)
+        return result
+
+    async def request(self, action: str, params: dict | None = None) -> dict | None:
         future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
         echo = str(hash(future))
         self.response_waiters[echo] = future
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from contextlib import suppress
 from typing import TYPE_CHECKING, cast
 
@@ -11,6 +10,8 @@ from launart.manager import Launart
 from launart.utilles import any_completed
 from loguru import logger
 
+from avilla.core.utilles.json_codec import dumps, loads
+from avilla.core.utilles.ttl_cache import TTLCache
 from avilla.onebot.v11.net.base import OneBot11Networking
 from avilla.standard.core.account import AccountUnregistered
 
@@ -30,6 +31,10 @@ class OneBot11WsClientNetworking(OneBot11Networking, Service):
     def __init__(self, protocol: OneBot11Protocol, config: OneBot11ForwardConfig) -> None:
         super().__init__(protocol)
         self.config = config
+        self.response_cache = TTLCache(config.response_cache_size, config.response_cache_ttl)
+        if config.response_cache_actions is not None:
+            self.cached_actions = config.response_cache_actions
+        self.local_file_uri = config.local_file_uri
 
     @property
     def id(self):
@@ -44,7 +49,7 @@ class OneBot11WsClientNetworking(OneBot11Networking, Service):
                 self.close_signal.set()
                 break
             elif msg.type == aiohttp.WSMsgType.TEXT:
-                data: dict = json.loads(cast(str, msg.data))
+                data: dict = loads(cast(str, msg.data))
                 yield self, data
         else:
             await self.connection_closed()
@@ -53,7 +58,7 @@ class OneBot11WsClientNetworking(OneBot11Networking, Service):
         if self.connection is None:
             raise RuntimeError("connection is not established")
 
-        await self.connection.send_json(payload)
+        await self.connection.send_json(payload, dumps=dumps)
 
     async def wait_for_available(self):
         await self.status.wait_for_available()
@@ -120,7 +125,7 @@ class OneBot11WsClientNetworking(OneBot11Networking, Service):
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=dumps)
 
         async with self.stage("blocking"):
             await self.connection_daemon(manager, self.session)
@@ -12,6 +12,8 @@ from starlette.routing import WebSocketRoute
 from starlette.websockets import WebSocket
 from yarl import URL
 
+from avilla.core.utilles.json_codec import dumps, loads
+from avilla.core.utilles.ttl_cache import TTLCache
 from avilla.onebot.v11.net.base import OneBot11Networking
 from avilla.standard.core.account import AccountUnregistered
 
@@ -36,8 +38,8 @@ class OneBot11WsServerConnection(OneBot11Networking):
         return not self.close_signal.is_set()
 
     async def message_receive(self):
-        async for msg in self.connection.iter_json():
-            yield self, msg
+        async for msg in self.connection.iter_text():
+            yield self, loads(msg)
         else:
             await self.connection_closed()
 
@@ -45,7 +47,7 @@ class OneBot11WsServerConnection(OneBot11Networking):
         return
 
     async def send(self, payload: dict) -> None:
-        return await self.connection.send_json(payload)
+        return await self.connection.send_text(dumps(payload))
 
     async def unregister_account(self):
         avilla = self.protocol.avilla
@@ -84,6 +86,10 @@ class OneBot11WsServerNetworking(Service):
 
         await ws.accept()
         connection = OneBot11WsServerConnection(ws, self.protocol)
+        connection.response_cache = TTLCache(self.config.response_cache_size, self.config.response_cache_ttl)
+        if self.config.response_cache_actions is not None:
+            connection.cached_actions = self.config.response_cache_actions
+        connection.local_file_uri = self.config.local_file_uri
         self.connections[account_id] = connection
 
         try:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
@@ -62,6 +62,27 @@ class OneBot11BanActionPerform((m := AccountCollector["OneBot11Protocol", "OneBo
             raise RuntimeError(f"Failed to get member {target}")
         return Nick(result.get("card", "") or result["nickname"], result["nickname"], result.get("title"))
 
+    async def get_member_infos(self, targets: Sequence[Selector]) -> dict[Selector, dict]:
+        groups: dict[str, list[Selector]] = {}
+        for target in targets:
+            groups.setdefault(target["group"], []).append(target)
+
+        result = {}
+        for group, members in groups.items():
+            member_list = await self.account.connection.call("get_group_member_list", {"group_id": int(group)})
+            infos = {str(i["user_id"]): i for i in member_list or []}
+            for target in members:
+                if (info := infos.get(target["member"])) is not None:
+                    result[target] = info
+        return result
+
+    @m.pull_many("land.group.member", Nick)
+    async def get_member_nicks(self, targets: Sequence[Selector], route: ...) -> dict[Selector, Nick]:
+        return {
+            target: Nick(info.get("card", "") or info["nickname"], info["nickname"], info.get("title"))
+            for target, info in (await self.get_member_infos(targets)).items()
+        }
+
     @m.pull("land.friend", Nick)
     @m.pull("land.stranger", Nick)
     async def get_user_nick(self, target: Selector, route: ...) -> Nick:
@@ -86,6 +107,12 @@ class OneBot11BanActionPerform((m := AccountCollector["OneBot11Protocol", "OneBo
             raise RuntimeError(f"Failed to get member {target}")
         return Summary(result["nickname"], None)
 
+    @m.pull_many("land.group.member", Summary)
+    async def get_member_summaries(self, targets: Sequence[Selector], route: ...) -> dict[Selector, Summary]:
+        return {
+            target: Summary(info["nickname"], None) for target, info in (await self.get_member_infos(targets)).items()
+        }
+
     @m.pull("land.friend", Summary)
     @m.pull("land.stranger", Summary)
     async def get_user_summary(self, target: Selector, route: ...) -> Summary:
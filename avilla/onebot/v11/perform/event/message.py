@@ -24,7 +24,7 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
         if account is None:
             logger.warning(f"Unknown account {self_id} received message {raw_event}")
             return
-        friend = Selector().land(account.route["land"]).friend(str(raw_event["sender"]["user_id"]))
+        friend = Selector().land(account.route["land"]).friend(str(raw_event["sender"]["user_id"])).intern()
         context = Context(
             account,
             friend,
@@ -59,9 +59,9 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
         if account is None:
             logger.warning(f"Unknown account {self_id} received message {raw_event}")
             return
-        group = Selector().land(account.route["land"]).group(str(raw_event["sender"]["group_id"]))
+        group = Selector().land(account.route["land"]).group(str(raw_event["sender"]["group_id"])).intern()
         # 好像 ob11 本来没这个字段, 但 gocq 是有的, 不过嘛, 管他呢
-        member = group.member(str(raw_event["sender"]["user_id"]))
+        member = group.member(str(raw_event["sender"]["user_id"])).intern()
         context = Context(
             account,
             member,
@@ -96,8 +96,8 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
         if account is None:
             logger.warning(f"Unknown account {self_id} received message {raw_event}")
             return
-        group = Selector().land(account.route["land"]).group(str(raw_event["group_id"]))
-        member = group.member(str(raw_event["sender"]["user_id"]))
+        group = Selector().land(account.route["land"]).group(str(raw_event["group_id"])).intern()
+        member = group.member(str(raw_event["sender"]["user_id"])).intern()
         context = Context(
             account,
             member,
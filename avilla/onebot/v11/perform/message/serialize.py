@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import base64
 from typing import TYPE_CHECKING, cast
 
 from avilla.core.elements import (
@@ -13,8 +12,9 @@ from avilla.core.elements import (
     Text,
     Video,
 )
-from avilla.core.resource import LocalFileResource, RawResource, UrlResource
+from avilla.core.resource import LocalFileResource, RawResource, Resource, UrlResource
 from avilla.core.ryanvk.collector.account import AccountCollector
+from avilla.core.utilles.io import b64encode, read_file
 from avilla.onebot.v11.capability import OneBot11Capability
 from avilla.onebot.v11.resource import (
     OneBot11ImageResource,
@@ -45,6 +45,18 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
 
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
+    async def resource_file(self, resource: Resource[bytes]) -> str:
+        if isinstance(resource, LocalFileResource) and self.account.connection.local_file_uri:
+            # the implementation reads the file by itself, so it needn't be inlined in the payload.
+            return resource.file.resolve().as_uri()
+        if isinstance(resource, RawResource):
+            data = resource.data
+        elif isinstance(resource, LocalFileResource):
+            data = await read_file(resource.file)
+        else:
+            data = cast(bytes, await self.account.staff.fetch_resource(resource))
+        return "base64://" + await b64encode(data)
+
     @m.entity(OneBot11Capability.serialize_element, element=Text)
     async def text(self, element: Text) -> dict:
         return {"type": "text", "data": {"text": element.text}}
@@ -70,30 +82,11 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                     "url": element.resource.url,
                 },
             }
-        elif isinstance(element.resource, LocalFileResource):
-            data = base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")
-            return {
-                "type": "image",
-                "data": {
-                    "file": "base64://" + data,
-                },
-            }
-        elif isinstance(element.resource, RawResource):
-            data = base64.b64encode(element.resource.data).decode("utf-8")
-            return {
-                "type": "image",
-                "data": {
-                    "file": "base64://" + data,
-                },
-            }
         else:
             return {
                 "type": "image",
                 "data": {
-                    "file": "base64://"
-                    + base64.b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource))).decode(
-                        "utf-8"
-                    ),
+                    "file": await self.resource_file(element.resource),
                 },
             }
 
@@ -114,30 +107,11 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                     "url": element.resource.url,
                 },
             }
-        elif isinstance(element.resource, LocalFileResource):
-            data = base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")
-            return {
-                "type": "record",
-                "data": {
-                    "file": "base64://" + data,
-                },
-            }
-        elif isinstance(element.resource, RawResource):
-            data = base64.b64encode(element.resource.data).decode("utf-8")
-            return {
-                "type": "record",
-                "data": {
-                    "file": "base64://" + data,
-                },
-            }
         else:
             return {
                 "type": "record",
                 "data": {
-                    "file": "base64://"
-                    + base64.b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource))).decode(
-                        "utf-8"
-                    ),
+                    "file": await self.resource_file(element.resource),
                 },
             }
 
@@ -158,30 +132,11 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                     "url": element.resource.url,
                 },
             }
-        elif isinstance(element.resource, LocalFileResource):
-            data = base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")
-            return {
-                "type": "video",
-                "data": {
-                    "file": "base64://" + data,
-                },
-            }
-        elif isinstance(element.resource, RawResource):
-            data = base64.b64encode(element.resource.data).decode("utf-8")
-            return {
-                "type": "video",
-                "data": {
-                    "file": "base64://" + data,
-                },
-            }
         else:
             return {
                 "type": "video",
                 "data": {
-                    "file": "base64://"
-                    + base64.b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource))).decode(
-                        "utf-8"
-                    ),
+                    "file": await self.resource_file(element.resource),
                 },
             }
 
@@ -5,6 +5,10 @@ from typing import TYPE_CHECKING, Callable, cast
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
+from avilla.standard.core.privilege import Privilege
+from avilla.standard.core.profile import Nick, Summary
+
+from ...utils import PRIVILEGE_LEVEL
 
 if TYPE_CHECKING:
     from avilla.onebot.v11.account import OneBot11Account  # noqa
@@ -28,7 +32,20 @@ class OneBot11GroupQueryPerform((m := AccountCollector["OneBot11Protocol", "OneB
     async def query_group_members(self, predicate: Callable[[str, str], bool] | str, previous: Selector):
         result = await self.account.connection.call("get_group_member_list", {"group_id": int(previous["group"])})
         result = cast(list, result)
+        self_id = self.account.route["account"]
+        self_level = next((PRIVILEGE_LEVEL[i["role"]] for i in result if str(i["user_id"]) == self_id), None)
         for i in result:
             member_id = str(i["user_id"])
             if callable(predicate) and predicate("member", member_id) or member_id == predicate:
-                yield previous.member(member_id)
+                member = previous.member(member_id)
+                self.staff.sideload_metadata(
+                    member,
+                    Nick(i.get("card", "") or i["nickname"], i["nickname"], i.get("title")),
+                    Summary(i["nickname"], None),
+                )
+                if member_id == self_id:
+                    self.staff.sideload_metadata(member, Privilege(True, True))
+                elif self_level is not None:
+                    level = PRIVILEGE_LEVEL[i["role"]]
+                    self.staff.sideload_metadata(member, Privilege(level > 0, self_level > level))
+                yield member
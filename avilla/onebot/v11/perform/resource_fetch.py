@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientSession
-
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
 from avilla.onebot.v11.resource import (
@@ -28,6 +26,5 @@ class OneBot11ResourceFetchPerform((m := ProtocolCollector["OneBot11Protocol"]()
     @m.entity(CoreCapability.fetch, resource=OneBot11ImageResource)
     @m.entity(CoreCapability.fetch, resource=OneBot11VideoResource)
     async def fetch_resource(self, resource: OneBot11Resource) -> bytes:
-        async with ClientSession() as session:
-            async with session.get(resource.url, ssl=ssl_ctx) as resp:
-                return await resp.read()
+        async with self.protocol.avilla.http_session.get(resource.url, ssl=ssl_ctx) as resp:
+            return await resp.read()
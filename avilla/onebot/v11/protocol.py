@@ -17,6 +17,10 @@ from .service import OneBot11Service
 class OneBot11ForwardConfig:
     endpoint: URL
     access_token: str | None = None
+    response_cache_size: int = 0
+    response_cache_ttl: float = 10.0
+    response_cache_actions: frozenset[str] | None = None
+    local_file_uri: bool = False
 
 
 @dataclass
@@ -25,6 +29,10 @@ class OneBot11ReverseConfig:
     path: str = "onebot/v11"
     endpoint: str = "ws/universal"
     access_token: str | None = None
+    response_cache_size: int = 0
+    response_cache_ttl: float = 10.0
+    response_cache_actions: frozenset[str] | None = None
+    local_file_uri: bool = False
 
 
 def _import_performs():
@@ -9,7 +9,8 @@ from loguru import logger
 from typing_extensions import Self
 from aiohttp import ClientSession, FormData
 
-from avilla.core.ryanvk.staff import Staff
+from avilla.core.ryanvk.staff import SharedStaff
+from avilla.core.utilles.json_codec import loads
 from avilla.qqapi.audit import MessageAudited, audit_result
 from avilla.qqapi.capability import QQAPICapability
 
@@ -22,7 +23,7 @@ if TYPE_CHECKING:
 CallMethod = Literal["get", "post", "fetch", "update", "multipart", "put", "delete", "patch"]
 
 
-class QQAPINetworking:
+class QQAPINetworking(SharedStaff):
     protocol: QQAPIProtocol
     close_signal: asyncio.Event
     session: ClientSession
@@ -45,10 +46,6 @@ class QQAPINetworking:
     def get_staff_artifacts(self):
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
-    @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
-
     def message_receive(self, shard: tuple[int, int]) -> AsyncIterator[tuple[Self, dict]]:
         ...
 
@@ -62,13 +59,16 @@ class QQAPINetworking:
     async def send(self, payload: dict, shard: tuple[int, int]) -> None:
         ...
 
+    def update_sequence(self, shard: tuple[int, int], sequence: int | None):
+        ...
+
     async def message_handle(self, shard: tuple[int, int]):
         async for connection, data in self.message_receive(shard):
             if data["op"] != Opcode.DISPATCH:
                 logger.debug(f"received other payload: {data}")
                 continue
             payload = Payload(**data)
-            connection.sequence = payload.sequence  # type: ignore
+            connection.update_sequence(shard, payload.sequence)
 
             async def event_parse_task(_data: Payload):
                 event_type = _data.type
@@ -84,9 +84,12 @@ class QQAPINetworking:
                 logger.warning(f"received unsupported event {event_type.lower()}: {_data.data}")
                 return
 
-            asyncio.create_task(event_parse_task(payload))
+            body = payload.d or {}
+            scene = body.get("group_openid") or body.get("channel_id") or (body.get("author") or {}).get("id")
+            if not self.protocol.avilla.event_scheduler.submit(("qqapi", self, scene), event_parse_task(payload)):
+                logger.warning(f"too many pending events, dropped event: {data}")
 
-    async def connection_closed(self):
+    async def connection_closed(self, shard: tuple[int, int] | None = None):
         self.close_signal.set()
 
     async def _call_http(
@@ -181,7 +184,7 @@ class QQAPINetworking:
                     raise NetworkError(
                         f"Get authorization failed with status code {resp.status}." " Please check your config."
                     )
-                data = await resp.json()
+                data = await resp.json(loads=loads)
             self._access_token = cast(str, data["access_token"])
             self._expires_in = datetime.now(timezone.utc) + timedelta(seconds=int(data["expires_in"]))
         return self._access_token
@@ -6,6 +6,7 @@ from typing import Literal
 
 from aiohttp import ClientResponse
 
+from avilla.core.utilles.json_codec import loads
 from avilla.qqapi.exception import (
     ActionFailed,
     ApiNotAvailable,
@@ -18,10 +19,10 @@ from avilla.qqapi.exception import (
 async def validate_response(resp: ClientResponse):
     status = resp.status
     if status == 200 or 203 <= status < 300:
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         return data.get("data", data)
     if status in {201, 202}:
-        data = await resp.json()
+        data = await resp.json(loads=loads)
         if data and (audit_id := data.get("data", {}).get("message_audit", {}).get("audit_id")):
             exc = AuditException(audit_id)
         else:
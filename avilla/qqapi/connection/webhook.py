@@ -16,6 +16,7 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 from avilla.core.account import AccountInfo
 from avilla.core.selector import Selector
+from avilla.core.utilles.json_codec import dumps, loads
 from avilla.qqapi.account import QQAPIAccount
 from avilla.qqapi.const import PLATFORM
 from avilla.standard.core.account import (
@@ -80,7 +81,7 @@ class QQAPIWebhookNetworking(Service):
 
     async def handle_request(self, req: web.Request):
         header = req.headers
-        data = await req.json()
+        data = await req.json(loads=loads)
         payload = Payload(**data)
         bot_id = header["X-Bot-Appid"]
         secret = self.config.secrets[bot_id]
@@ -104,7 +105,7 @@ class QQAPIWebhookNetworking(Service):
             except Exception as e:
                 logger.exception(f"Failed to sign message: {e}")
                 return web.Response(status=500)
-            return web.json_response({"plain_token": plain_token, "signature": signature_hex})
+            return web.json_response({"plain_token": plain_token, "signature": signature_hex}, dumps=dumps)
 
         if self.config.verify_payload:
             ed25519 = header["X-Signature-Ed25519"]
@@ -212,7 +213,7 @@ class QQAPIWebhookNetworking(Service):
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=dumps)
             logger.info(f"starting server on {self.config.host}:{self.config.port}")
             self.wsgi = web.Application(logger=logger)  # type: ignore
             self.wsgi.router.freeze = lambda: None  # monkey patch
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import sys
-from contextlib import suppress
-from dataclasses import asdict
+from contextlib import asynccontextmanager, nullcontext, suppress
+from dataclasses import asdict, dataclass, field
 from typing import TYPE_CHECKING, cast
 
 import aiohttp
@@ -15,6 +14,7 @@ from loguru import logger
 
 from avilla.core.account import AccountInfo
 from avilla.core.selector import Selector
+from avilla.core.utilles.json_codec import dumps, loads
 from avilla.qqapi.account import QQAPIAccount
 from avilla.qqapi.const import PLATFORM
 from avilla.standard.core.account import (
@@ -31,17 +31,35 @@ if TYPE_CHECKING:
     from avilla.qqapi.protocol import QQAPIWebsocketConfig, QQAPIProtocol
 
 
+@dataclass
+class ShardSession:
+    """The gateway session of one shard, resumed on its own when the shard reconnects."""
+
+    shard: tuple[int, int]
+    session_id: str | None = None
+    sequence: int | None = None
+    close_signal: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def reset(self):
+        self.session_id = None
+        self.sequence = None
+
+
 class QQAPIWsClientNetworking(QQAPINetworking, Service):
     required: set[str] = set()
     stages: set[str] = {"preparing", "blocking", "cleanup"}
 
     config: QQAPIWebsocketConfig
     connections: dict[tuple[int, int], aiohttp.ClientWebSocketResponse]
+    sessions: dict[tuple[int, int], ShardSession]
     response_waiters: dict[str, asyncio.Future]
     # account_id: str
     self_info: dict
-    sequence: int | None
-    session_id: str | None
+    identify_buckets: dict[int, asyncio.Semaphore]
+    # from `session_start_limit` of `gateway/bot`:
+    max_concurrency: int
+    identify_remaining: int | None
+    identify_reset_after: float
 
     @property
     def id(self):
@@ -51,11 +69,51 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         super().__init__(protocol, config, config.id, config.secret)
         self.response_waiters = {}
         self.close_signal = asyncio.Event()
-        self.session_id = None
-        self.sequence = None
         if any([not config.id, not config.token, not config.secret]):
             raise ValueError("config is not complete")
         self.connections = {}
+        self.sessions = {}
+        self.identify_buckets = {}
+        self.max_concurrency = 1
+        self.identify_remaining = None
+        self.identify_reset_after = 0.0
+
+    def get_session(self, shard: tuple[int, int]) -> ShardSession:
+        if (session := self.sessions.get(shard)) is None:
+            session = self.sessions[shard] = ShardSession(shard)
+        return session
+
+    def update_sequence(self, shard: tuple[int, int], sequence: int | None):
+        if sequence is not None:
+            self.get_session(shard).sequence = sequence
+
+    @asynccontextmanager
+    async def identify_slot(self, shard: tuple[int, int]):
+        """Shards identify concurrently across buckets, one by one within a bucket (`shard_id % max_concurrency`)."""
+        bucket = shard[0] % self.max_concurrency
+        if (semaphore := self.identify_buckets.get(bucket)) is None:
+            semaphore = self.identify_buckets[bucket] = asyncio.Semaphore(1)
+
+        await semaphore.acquire()
+        try:
+            if self.identify_remaining is not None and self.identify_remaining <= 0:
+                logger.warning(f"{self} Session start limit reached, waiting {self.identify_reset_after:.0f}s")
+                await asyncio.sleep(self.identify_reset_after)
+                await self.update_start_limit()
+            if self.identify_remaining is not None:
+                self.identify_remaining -= 1
+            yield
+        finally:
+            # released later rather than slept on, so that this shard goes on receiving meanwhile.
+            asyncio.get_running_loop().call_later(self.config.identify_interval, semaphore.release)
+
+    async def update_start_limit(self) -> dict:
+        gateway_info = await self.call_http("get", "gateway/bot")
+        start_limit = gateway_info.get("session_start_limit", {})
+        self.max_concurrency = max(start_limit.get("max_concurrency") or 1, 1)
+        self.identify_remaining = start_limit.get("remaining")
+        self.identify_reset_after = (start_limit.get("reset_after") or 0) / 1000
+        return gateway_info
 
     async def get_authorization_header(self) -> dict[str, str]:
         """获取当前 Bot 的鉴权信息"""
@@ -67,39 +125,50 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
     async def message_receive(self, shard: tuple[int, int]):
         if (connection := self.connections.get(shard)) is None:
             raise RuntimeError("connection is not established")
+        session = self.get_session(shard)
 
         async for msg in connection:
             # logger.debug(f"{msg=}")
 
             if msg.type in {aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED}:
-                self.close_signal.set()
+                session.close_signal.set()
                 break
             elif msg.type == aiohttp.WSMsgType.TEXT:
-                data: dict = json.loads(cast(str, msg.data))
+                data: dict = loads(cast(str, msg.data))
                 if data["op"] == Opcode.RECONNECT:
-                    logger.warning("Received reconnect event from server, will reconnect in 5 seconds...")
+                    logger.warning(f"Shard {shard} received reconnect event from server, will reconnect...")
+                    session.close_signal.set()
                     break
                 if data["op"] == Opcode.INVALID_SESSION:
-                    self.session_id = None
-                    self.sequence = None
-                    logger.warning("Received invalid session event from server, will try to resume")
+                    session.reset()
+                    logger.warning(f"Shard {shard} received invalid session event from server, will identify again")
+                    session.close_signal.set()
                     break
                 if data["op"] == Opcode.HEARTBEAT_ACK:
                     continue
                 yield self, data
         else:
-            await self.connection_closed()
+            # kept for resuming; the server answers with an invalid session if it can't be resumed.
+            session.close_signal.set()
 
-    async def connection_closed(self):
-        self.session_id = None
-        self.sequence = None
+    async def connection_closed(self, shard: tuple[int, int] | None = None):
+        """Drops the session of `shard`, or of every shard if not given, so that they identify again."""
+        if shard is not None:
+            session = self.get_session(shard)
+            session.reset()
+            session.close_signal.set()
+            return
+
+        for session in self.sessions.values():
+            session.reset()
+            session.close_signal.set()
         self.close_signal.set()
 
     async def send(self, payload: dict, shard: tuple[int, int]):
         if (connection := self.connections.get(shard)) is None:
             raise RuntimeError("connection is not established")
 
-        await connection.send_json(payload)
+        await connection.send_json(payload, dumps=dumps)
 
     async def wait_for_available(self):
         await self.status.wait_for_available()
@@ -122,7 +191,7 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         if not (connection := self.connections.get(shard)):
             raise RuntimeError("connection is not established")
         try:
-            payload = Payload(**await connection.receive_json())
+            payload = Payload(**await connection.receive_json(loads=loads))
             assert payload.opcode == Opcode.HELLO, f"Received unexpected payload: {payload!r}"
             return payload.data["heartbeat_interval"]
         except Exception as e:
@@ -135,7 +204,8 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         """鉴权连接"""
         if not (connection := self.connections.get(shard)):
             raise RuntimeError("connection is not established")
-        if not self.session_id:
+        session = self.get_session(shard)
+        if not session.session_id:
             payload = Payload(
                 op=Opcode.IDENTIFY,
                 d={
@@ -154,8 +224,8 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                 op=Opcode.RESUME,
                 d={
                     "token": await self._get_authorization_header(),
-                    "session_id": self.session_id,
-                    "seq": self.sequence,
+                    "session_id": session.session_id,
+                    "seq": session.sequence,
                 },
             )
 
@@ -165,21 +235,21 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
             logger.error(f"Error while sending {payload.opcode.name.title()} event: {e}")
             return False
 
-        if not self.session_id:
+        account_route = Selector().land("qqapi").account(self.config.id)
+        if not session.session_id:
             # https://bot.q.qq.com/wiki/develop/api/gateway/reference.html#_2-%E9%89%B4%E6%9D%83%E8%BF%9E%E6%8E%A5
             # 鉴权成功之后，后台会下发一个 Ready Event
-            payload = Payload(**await connection.receive_json())
+            payload = Payload(**await connection.receive_json(loads=loads))
             if payload.opcode == Opcode.INVALID_SESSION:
-                logger.warning("Received invalid session event from server, will try to resume")
+                logger.warning(f"Shard {shard} received invalid session event from server, will identify again")
                 return False
             if not (payload.opcode == Opcode.DISPATCH and payload.type == "READY" and payload.data):
                 logger.error(f"Received unexpected payload: {payload}")
                 return False
-            self.sequence = payload.sequence
-            self.session_id = payload.data["session_id"]
+            session.sequence = payload.sequence
+            session.session_id = payload.data["session_id"]
             self.self_info = payload.data["user"]
             # self.account_id = payload.data["user"]["id"]
-            account_route = Selector().land("qqapi").account(self.config.id)
             if account_route in self.protocol.avilla.accounts:
                 account = cast(QQAPIAccount, self.protocol.avilla.accounts[account_route].account)
             else:
@@ -190,42 +260,50 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                     self.protocol,
                     PLATFORM,
                 )
+                self.protocol.avilla.broadcast.postEvent(AccountRegistered(self.protocol.avilla, account))
             self.protocol.service.accounts[self.config.id] = account
             account.connection = self
-            self.protocol.avilla.broadcast.postEvent(AccountRegistered(self.protocol.avilla, account))
-        else:
+        elif self.config.id in self.protocol.service.accounts:
             account = self.protocol.service.accounts[self.config.id]
+        else:
+            # the account was marked unavailable along with the last shard, and comes back with this one.
+            account = cast(QQAPIAccount, self.protocol.avilla.accounts[account_route].account)
+            self.protocol.service.accounts[self.config.id] = account
             account.connection = self
         self.protocol.avilla.broadcast.postEvent(AccountAvailable(self.protocol.avilla, account))
         return True
 
     async def _heartbeat(self, heartbeat_interval: int, shard: tuple[int, int]):
         """心跳"""
+        session = self.get_session(shard)
         while True:
-            if self.session_id:
+            if session.session_id:
                 with suppress(Exception):
-                    await self.send({"op": 1, "d": self.sequence}, shard=shard)
+                    await self.send({"op": 1, "d": session.sequence}, shard=shard)
             await asyncio.sleep(heartbeat_interval / 1000)
 
     async def connection_daemon(
         self, manager: Launart, session: aiohttp.ClientSession, url: str, shard: tuple[int, int]
     ):
+        shard_session = self.get_session(shard)
+        account_route = Selector().land("qqapi").account(self.config.id)
         while not manager.status.exiting:
             try:
                 async with session.ws_connect(url, timeout=30) as conn:
                     self.connections[shard] = conn
-                    logger.info(f"{self.id} Websocket client connected")
+                    logger.info(f"{self.id} Websocket client connected (shard {shard})")
                     heartbeat_interval = await self._hello(shard)
                     if not heartbeat_interval:
                         await asyncio.sleep(3)
                         continue
-                    result = await self._authenticate(shard)
+                    # resuming does not count against the identify limit.
+                    async with nullcontext() if shard_session.session_id else self.identify_slot(shard):
+                        result = await self._authenticate(shard)
                     if not result:
                         await asyncio.sleep(3)
                         continue
-                    account_route = Selector().land("qqapi").account(self.config.id)
-                    self.close_signal.clear()
-                    close_task = asyncio.create_task(self.close_signal.wait())
+                    shard_session.close_signal.clear()
+                    close_task = asyncio.create_task(shard_session.close_signal.wait())
                     receiver_task = asyncio.create_task(self.message_handle(shard))
                     sigexit_task = asyncio.create_task(manager.status.wait_for_sigexit())
                     heartbeat_task = asyncio.create_task(self._heartbeat(heartbeat_interval, shard))
@@ -235,14 +313,18 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                         receiver_task,
                         heartbeat_task,
                     )
+                    for task in pending:
+                        task.cancel()
                     if sigexit_task in done:
-                        logger.info(f"{self} Websocket client exiting...")
+                        logger.info(f"{self} Websocket client exiting (shard {shard})...")
                         await conn.close()
+                        shard_session.close_signal.set()
+                        self.connections.pop(shard, None)
+                        if self.connections:
+                            # the account goes along with the last shard still connected.
+                            return
                         self.close_signal.set()
-                        receiver_task.cancel()
-                        heartbeat_task.cancel()
                         with suppress(KeyError):
-                            del self.connections[shard]
                             await self.protocol.avilla.broadcast.postEvent(
                                 AccountUnregistered(
                                     self.protocol.avilla, self.protocol.avilla.accounts[account_route].account
@@ -251,11 +333,10 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                             del self.protocol.service.accounts[self.config.id]
                             del self.protocol.avilla.accounts[account_route]
                         return
-                    if close_task in done:
-                        receiver_task.cancel()
-                        heartbeat_task.cancel()
-                        logger.warning(f"{self} Connection closed by server, will reconnect in 5 seconds...")
-
+                    logger.warning(f"{self} Connection of shard {shard} closed, will reconnect in 5 seconds...")
+                    with suppress(KeyError):
+                        del self.connections[shard]
+                    if not self.alive:
                         with suppress(KeyError):
                             await self.protocol.avilla.broadcast.postEvent(
                                 AccountUnavailable(
@@ -264,39 +345,36 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                             )
                             del self.protocol.service.accounts[self.config.id]
                             # del self.protocol.avilla.accounts[account_route]
-                        await asyncio.sleep(5)
-                        logger.info(f"{self} Reconnecting...")
-                        continue
+                    await asyncio.sleep(5)
+                    logger.info(f"{self} Reconnecting shard {shard}...")
+                    continue
             except Exception as e:
-                logger.error(f"{self} Error while connecting: {e}")
+                logger.error(f"{self} Error while connecting shard {shard}: {e}")
                 await asyncio.sleep(5)
-                logger.info(f"{self} Reconnecting...")
+                logger.info(f"{self} Reconnecting shard {shard}...")
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
-            self.session = aiohttp.ClientSession()
-            gateway_info = await self.call_http("get", "gateway/bot")
+            self.session = aiohttp.ClientSession(json_serialize=dumps)
+            gateway_info = await self.update_start_limit()
             ws_url = gateway_info["url"]
-            remain = gateway_info.get("session_start_limit", {}).get("remaining")
-            if remain is not None and remain <= 0:
+            if self.identify_remaining is not None and self.identify_remaining <= 0:
                 logger.error("Session start limit reached, please wait for a while")
                 manager.status.exiting = True
                 return
         tasks = []
         async with self.stage("blocking"):
             if self.config.shard:
-                tasks.append(
-                    asyncio.create_task(self.connection_daemon(manager, self.session, ws_url, self.config.shard))
-                )
+                shards = [self.config.shard]
             else:
-                shards = gateway_info.get("shards") or 1
-                logger.debug(f"Get Shards: {shards}")
-                for i in range(shards):
-                    tasks.append(
-                        asyncio.create_task(self.connection_daemon(manager, self.session, ws_url, (i, shards)))
-                    )
-                    await asyncio.sleep(gateway_info.get("session_start_limit", {}).get("max_concurrency", 1))
-            await any_completed(*tasks)
+                total = gateway_info.get("shards") or 1
+                logger.debug(f"Get Shards: {total}, max concurrency: {self.max_concurrency}")
+                shards = [(i, total) for i in range(total)]
+            # started all at once, the identify buckets take care of the pacing.
+            for shard in shards:
+                tasks.append(asyncio.create_task(self.connection_daemon(manager, self.session, ws_url, shard)))
+            # every shard closes on its own before the cleanup, the last one taking the account with it.
+            await asyncio.wait(tasks, return_when=asyncio.ALL_COMPLETED)
 
         async with self.stage("cleanup"):
             await self.session.close()
@@ -304,3 +382,4 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                 task.cancel()
             await asyncio.wait(tasks, return_when=asyncio.ALL_COMPLETED)
             self.connections.clear()
+            self.sessions.clear()
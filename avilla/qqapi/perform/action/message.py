@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from base64 import b64encode
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -12,6 +11,7 @@ from avilla.core import Context, CoreCapability, Message
 from avilla.core.exceptions import ActionFailed
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
+from avilla.core.utilles.io import b64encode
 from avilla.qqapi.capability import QQAPICapability
 from avilla.qqapi.exception import AuditException
 from avilla.qqapi.utils import form_data, unescape
@@ -44,7 +44,7 @@ class QQAPIMessageActionPerform((m := AccountCollector["QQAPIProtocol", "QQAPIAc
         file_data: str | bytes | None = None,
     ) -> dict:
         if isinstance(file_data, bytes):
-            file_data = b64encode(file_data).decode()
+            file_data = await b64encode(file_data)
         result = await self.account.connection.call_http(
             "post",
             f"v2/groups/{target.pattern['group']}/files",
@@ -69,7 +69,7 @@ class QQAPIMessageActionPerform((m := AccountCollector["QQAPIProtocol", "QQAPIAc
         file_data: str | bytes | None = None,
     ) -> dict:
         if isinstance(file_data, bytes):
-            file_data = b64encode(file_data).decode()
+            file_data = await b64encode(file_data)
         result = await self.account.connection.call_http(
             "post",
             f"v2/users/{target.pattern['friend']}/files",
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from avilla.core.elements import Audio, Face, File, Notice, NoticeAll, Picture, Text, Video
 from avilla.core.resource import LocalFileResource, RawResource, UrlResource
 from avilla.core.ryanvk.collector.account import AccountCollector
+from avilla.core.utilles.io import read_file
 from avilla.qqapi.capability import QQAPICapability
 from avilla.qqapi.element import Ark, Embed, Keyboard, Markdown, Reference
 from avilla.qqapi.resource import (
@@ -50,7 +51,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIImageResource, UrlResource)):
             return "media", ("image", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_image", element.resource.file.read_bytes()
+            return "file_image", await read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_image", element.resource.data
         return "file_image", await self.account.staff.fetch_resource(element.resource)
@@ -60,7 +61,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIAudioResource, UrlResource)):
             return "media", ("audio", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_audio", element.resource.file.read_bytes()
+            return "file_audio", await read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_audio", element.resource.data
         return "file_audio", await self.account.staff.fetch_resource(element.resource)
@@ -70,7 +71,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIVideoResource, UrlResource)):
             return "media", ("video", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_video", element.resource.file.read_bytes()
+            return "file_video", await read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_video", element.resource.data
         return "file_video", await self.account.staff.fetch_resource(element.resource)
@@ -80,7 +81,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIFileResource, UrlResource)):
             return "media", ("file", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_file", element.resource.file.read_bytes()
+            return "file_file", await read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_file", element.resource.data
         return "file_file", await self.account.staff.fetch_resource(element.resource)
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientSession
-
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
 from avilla.qqapi.resource import (
@@ -27,6 +25,5 @@ class QQAPIResourceFetchPerform((m := ProtocolCollector["QQAPIProtocol"]())._):
     @m.entity(CoreCapability.fetch, resource=QQAPIImageResource)
     @m.entity(CoreCapability.fetch, resource=QQAPIVideoResource)
     async def fetch_resource(self, resource: QQAPIResource) -> bytes:
-        async with ClientSession() as session:
-            async with session.get(resource.url) as resp:
-                return await resp.read()
+        async with self.protocol.avilla.http_session.get(resource.url) as resp:
+            return await resp.read()
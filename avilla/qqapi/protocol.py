@@ -78,6 +78,8 @@ class QQAPIWebsocketConfig(ProtocolConfig, QQAPIConfig):
     secret: str
     """client secret"""
     shard: tuple[int, int] | None = None
+    identify_interval: float = 5.0
+    """the period in which each identify bucket allows one identify, `max_concurrency` of `gateway/bot` counts on it"""
     intent: Intents = field(default_factory=Intents)
     is_sandbox: bool = False
     api_base: URL = URL("https://api.sgroup.qq.com/")
@@ -1,6 +1,7 @@
-import json
 import re
 
+from avilla.core.utilles.json_codec import dumps
+
 
 def escape(s: str) -> str:
     return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
@@ -41,7 +42,7 @@ def form_data(message: dict):
     for key, value in message.items():
         if isinstance(value, (list, dict)):
             files[key] = {
-                "value": json.dumps({key: value}).encode("utf-8"),
+                "value": dumps({key: value}).encode("utf-8"),
                 "content_type": "application/json",
                 "filename": f"{key}.json",
             }
@@ -4,7 +4,7 @@ from typing import Any
 
 from graia.amnesia.message import Element, MessageChain
 
-from avilla.core.event import AvillaEvent
+from avilla.core.event import AvillaEvent, MemberCreated, MetadataModified
 from avilla.core.ryanvk.collector.application import ApplicationCollector
 from avilla.core.ryanvk.overload.target import TargetOverload
 from avilla.core.selector import Selector
@@ -13,6 +13,17 @@ from avilla.standard.qq.elements import Forward
 from graia.ryanvk import Fn, PredicateOverload, SimpleOverload, TypeOverload
 
 
+# the events each raw event type may turn into, used to skip the events nobody listens to.
+# "message::recv" is left out, since its raw message is cached for the later lookups of replies and forwards;
+# its perform skips building the message instead.
+EVENT_ROUTES: dict[str, tuple[type[AvillaEvent], ...]] = {
+    "group::name_update": (MetadataModified,),
+    "group::member::mute": (MetadataModified,),
+    "group::member::add": (MemberCreated,),
+    "group::member::legacy::add::invited": (MemberCreated,),
+}
+
+
 class RedCapability((m := ApplicationCollector())._):
     @Fn.complex({SimpleOverload(): ["event_type"]})
     async def event_callback(self, event_type: str, raw_event: dict) -> AvillaEvent | AvillaLifecycleEvent | None:
@@ -53,6 +64,7 @@ class RedCapability((m := ApplicationCollector())._):
     async def handle_event(self, event_type: str, payload: dict):
         maybe_event = await self.event_callback(event_type, payload)
 
-        if maybe_event is not None:
+        # events of types unknown to EVENT_ROUTES are built anyway, but neither recorded nor posted for no one.
+        if maybe_event is not None and self.avilla.subscriptions.listened(type(maybe_event)):
             self.avilla.event_record(maybe_event)
             self.avilla.broadcast.postEvent(maybe_event)
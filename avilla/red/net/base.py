@@ -7,16 +7,16 @@ from typing import TYPE_CHECKING, AsyncIterator, Literal, overload
 from loguru import logger
 from typing_extensions import Self
 
-from avilla.core.ryanvk.staff import Staff
+from avilla.core.ryanvk.staff import SharedStaff
 from avilla.red.account import RedAccount
-from avilla.red.capability import RedCapability
+from avilla.red.capability import EVENT_ROUTES, RedCapability
 from avilla.red.utils import MsgType, get_msg_types
 
 if TYPE_CHECKING:
     from avilla.red.protocol import RedProtocol
 
 
-class RedNetworking:
+class RedNetworking(SharedStaff):
     protocol: RedProtocol
     account: RedAccount | None
     close_signal: asyncio.Event
@@ -33,10 +33,6 @@ class RedNetworking:
     def get_staff_artifacts(self):
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
-    @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
-
     def message_receive(self) -> AsyncIterator[tuple[Self, dict]]:
         ...
 
@@ -51,6 +47,9 @@ class RedNetworking:
         ...
 
     async def message_handle(self):
+        scheduler = self.protocol.avilla.event_scheduler
+        subscriptions = self.protocol.avilla.subscriptions
+
         async for connection, data in self.message_receive():
             event_type = data["type"]
             if not data["payload"]:
@@ -63,6 +62,13 @@ class RedNetworking:
                     return
                 logger.warning(f"received unsupported event {t}: {payload}")
 
+            def schedule(t: str, payload: dict):
+                if (routes := EVENT_ROUTES.get(t)) is not None and not subscriptions.listened(*routes):
+                    return
+                scene = payload.get("peerUin") if isinstance(payload, dict) else None
+                if not scheduler.submit(("red", self, scene), event_parse_task(t, payload)):
+                    logger.warning(f"too many pending events, dropped event {t}: {payload}")
+
             def handle_message(message: dict):
                 types = get_msg_types(message)
                 if types.msg == MsgType.system and types.send == "system":
@@ -72,21 +78,21 @@ class RedNetworking:
                         and message["elements"][0]["grayTipElement"]["subElementType"] == 4
                         and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 1
                     ):
-                        asyncio.create_task(event_parse_task("group::member::add", message))
+                        schedule("group::member::add", message)
                     elif (
                         message["subMsgType"] == 8
                         and message["elements"][0]["elementType"] == 8
                         and message["elements"][0]["grayTipElement"]["subElementType"] == 4
                         and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 8
                     ):
-                        asyncio.create_task(event_parse_task("group::member::mute", message))
+                        schedule("group::member::mute", message)
                     elif (
                         message["subMsgType"] == 8
                         and message["elements"][0]["elementType"] == 8
                         and message["elements"][0]["grayTipElement"]["subElementType"] == 4
                         and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 5
                     ):
-                        asyncio.create_task(event_parse_task("group::name_update", message))
+                        schedule("group::name_update", message)
                     elif (
                         message["subMsgType"] == 12
                         and message["elements"][0]["elementType"] == 8
@@ -94,18 +100,18 @@ class RedNetworking:
                         and message["elements"][0]["grayTipElement"]["xmlElement"]["busiType"] == "1"
                         and message["elements"][0]["grayTipElement"]["xmlElement"]["busiId"] == "10145"
                     ):
-                        asyncio.create_task(event_parse_task("group::member::legacy::add::invited", message))
+                        schedule("group::member::legacy::add::invited", message)
                     else:
                         logger.warning(f"received unsupported event: {message}")
                         return
                 else:
-                    asyncio.create_task(event_parse_task("message::recv", message))
+                    schedule("message::recv", message)
 
             if event_type == "message::recv":
                 for msg in data["payload"]:
                     handle_message(msg)
             else:
-                asyncio.create_task(event_parse_task(event_type, data["payload"]))
+                schedule(event_type, data["payload"])
 
     async def connection_closed(self):
         self.close_signal.set()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import TYPE_CHECKING, Literal, cast
 
 import aiohttp
@@ -10,6 +9,7 @@ from launart.manager import Launart
 from launart.utilles import any_completed
 from loguru import logger
 
+from avilla.core.utilles.json_codec import dumps, loads
 from avilla.red.account import RedAccount
 from avilla.red.net.base import RedNetworking
 from avilla.standard.core.account import AccountUnavailable, AccountUnregistered
@@ -43,7 +43,7 @@ class RedWsClientNetworking(RedNetworking, Service):
                 self.close_signal.set()
                 break
             elif msg.type == aiohttp.WSMsgType.TEXT:
-                data: dict = json.loads(cast(str, msg.data))
+                data: dict = loads(cast(str, msg.data))
                 yield self, data
         else:
             await self.connection_closed()
@@ -52,7 +52,7 @@ class RedWsClientNetworking(RedNetworking, Service):
         if self.connection is None:
             raise RuntimeError("connection is not established")
 
-        await self.connection.send_json(payload)
+        await self.connection.send_json(payload, dumps=dumps)
 
     async def call_http(
         self, method: Literal["get", "post", "multipart"], action: str, params: dict | None = None, raw: bool = False
@@ -63,14 +63,14 @@ class RedWsClientNetworking(RedNetworking, Service):
                 (self.config.http_endpoint / action).with_query(params or {}),
                 headers={"Authorization": f"Bearer {self.config.access_token}"},
             ) as resp:
-                return (await resp.content.read()) if raw else await resp.json(content_type=None)
+                return (await resp.content.read()) if raw else await resp.json(loads=loads, content_type=None)
         if method == "post":
             async with self.session.post(
                 (self.config.http_endpoint / action),
                 json=params or {},
                 headers={"Authorization": f"Bearer {self.config.access_token}"},
             ) as resp:
-                return (await resp.content.read()) if raw else await resp.json(content_type=None)
+                return (await resp.content.read()) if raw else await resp.json(loads=loads, content_type=None)
         if method == "multipart":
             data = aiohttp.FormData(quote_fields=False)
             if params is None:
@@ -86,7 +86,7 @@ class RedWsClientNetworking(RedNetworking, Service):
                 data=data,
                 headers={"Authorization": f"Bearer {self.config.access_token}"},
             ) as resp:
-                return (await resp.content.read()) if raw else await resp.json(content_type=None)
+                return (await resp.content.read()) if raw else await resp.json(loads=loads, content_type=None)
         raise ValueError(f"Unknown method {method}")
 
     async def wait_for_available(self):
@@ -159,7 +159,7 @@ class RedWsClientNetworking(RedNetworking, Service):
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(json_serialize=dumps)
 
         async with self.stage("blocking"):
             await self.connection_daemon(manager, self.session)
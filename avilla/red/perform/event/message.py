@@ -25,12 +25,22 @@ class RedEventMessagePerform((m := ConnectionCollector())._):
             logger.warning(f"Unknown account received message {raw_event}")
             return
         cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
+        await cache.set(
+            f"red/account({account.route['account']}).message({raw_event['msgId']})", raw_event, timedelta(minutes=5)
+        )
+        # cached for the later lookups of replies and forwards, the message itself is only built when received.
+        if not self.protocol.avilla.subscriptions.listened(MessageReceived, MessageSent):
+            return
+
         reply = None
         if raw_event["chatType"] == 2:
             group = (
-                Selector().land(account.route["land"]).group(str(raw_event.get("peerUin", raw_event.get("peerUid"))))
+                Selector()
+                .land(account.route["land"])
+                .group(str(raw_event.get("peerUin", raw_event.get("peerUid"))))
+                .intern()
             )
-            member = group.member(str(raw_event.get("senderUin", raw_event.get("senderUid"))))
+            member = group.member(str(raw_event.get("senderUin", raw_event.get("senderUid")))).intern()
             context = Context(
                 account,
                 member,
@@ -53,7 +63,10 @@ class RedEventMessagePerform((m := ConnectionCollector())._):
             )
         else:
             friend = (
-                Selector().land(account.route["land"]).friend(f"{raw_event.get('peerUin', raw_event.get('senderUin'))}")
+                Selector()
+                .land(account.route["land"])
+                .friend(f"{raw_event.get('peerUin', raw_event.get('senderUin'))}")
+                .intern()
             )
             context = Context(
                 account,
@@ -75,7 +88,6 @@ class RedEventMessagePerform((m := ConnectionCollector())._):
                 time=datetime.fromtimestamp(int(raw_event["msgTime"])),
                 reply=reply,
             )
-        await cache.set(f"red/account({account.route['account']}).message({msg.id})", raw_event, timedelta(minutes=5))
         context._collect_metadatas(msg.to_selector(), msg)
         return (
             MessageSent(context, msg, account)
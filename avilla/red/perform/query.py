@@ -8,6 +8,8 @@ from graia.amnesia.builtins.memcache import Memcache, MemcacheService
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
+from avilla.standard.core.privilege import MuteInfo
+from avilla.standard.core.profile import Nick, Summary
 
 if TYPE_CHECKING:
     from ..account import RedAccount  # noqa
@@ -56,4 +58,11 @@ class RedQueryPerform((m := AccountCollector["RedProtocol", "RedAccount"]())._):
                 timedelta(minutes=5),
             )
             if callable(predicate) and predicate("member", member_id) or member_id == predicate:
-                yield previous.member(member_id)
+                member = previous.member(member_id)
+                self.staff.sideload_metadata(
+                    member,
+                    Nick(i["nick"], i["remark"] or i["nick"], i["cardName"]),
+                    Summary(i["nick"], "a member of this group"),
+                    MuteInfo(i["shutUpTime"] > 0, timedelta(seconds=i["shutUpTime"])),
+                )
+                yield member
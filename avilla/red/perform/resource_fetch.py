@@ -3,8 +3,6 @@ from __future__ import annotations
 from contextlib import suppress
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientSession
-
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
 from avilla.red.resource import (
@@ -38,9 +36,8 @@ class RedResourceFetchPerform((m := ProtocolCollector["RedProtocol"]())._):
                 return f.read()
         if isinstance(resource, RedImageResource):
             with suppress(Exception):
-                async with ClientSession() as session:
-                    async with session.get(resource.url) as resp:
-                        return await resp.read()
+                async with self.protocol.avilla.http_session.get(resource.url) as resp:
+                    return await resp.read()
         if TYPE_CHECKING:
             assert isinstance(resource.ctx.account, RedAccount)
         return await resource.ctx.account.websocket_client.call_http(
@@ -3,8 +3,6 @@ from __future__ import annotations
 from base64 import b64decode
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientSession
-
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
 from avilla.satori.resource import (
@@ -33,6 +31,5 @@ class SatoriResourceFetchPerform((m := ProtocolCollector["SatoriProtocol"]())._)
                 return f.read()
         if resource.src.startswith("data:"):
             return b64decode(resource.src[5:].split(";", 1)[1][7:])
-        async with ClientSession() as session:
-            async with session.get(resource.src) as resp:
-                return await resp.read()
+        async with self.protocol.avilla.http_session.get(resource.src) as resp:
+            return await resp.read()
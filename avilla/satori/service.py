@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from contextlib import suppress
 from typing import TYPE_CHECKING
 
@@ -18,7 +17,7 @@ from avilla.standard.core.account import (
 )
 
 from ..core import Selector
-from ..core.ryanvk.staff import Staff
+from ..core.ryanvk.staff import SharedStaff
 from .account import SatoriAccount
 from .capability import SatoriCapability
 from .const import platform
@@ -27,7 +26,7 @@ if TYPE_CHECKING:
     from .protocol import SatoriProtocol
 
 
-class SatoriService(App):
+class SatoriService(App, SharedStaff):
     id = "satori.service"
 
     protocol: SatoriProtocol
@@ -46,10 +45,6 @@ class SatoriService(App):
     def get_staff_artifacts(self):
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
-    @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
-
     async def handle_event(self, account: Account, event: Event):
         async def event_parse_task(connection: Account, raw: Event):
             with suppress(NotImplementedError):
@@ -58,7 +53,11 @@ class SatoriService(App):
 
             logger.warning(f"received unsupported event {raw.type}: {raw}")
 
-        asyncio.create_task(event_parse_task(account, event))
+        scene = event.channel.id if event.channel else (event.user.id if event.user else None)
+        if not self.protocol.avilla.event_scheduler.submit(
+            ("satori", account.identity, scene), event_parse_task(account, event)
+        ):
+            logger.warning(f"too many pending events, dropped event {event.type}: {event}")
 
     async def handle_lifecycle(self, account: Account, state: LoginStatus):
         if state == LoginStatus.ONLINE:
@@ -1,4 +1,5 @@
 from ._runtime import GLOBAL_GALLERY as GLOBAL_GALLERY
+from ._runtime import artifacts_modified as artifacts_modified
 from ._runtime import merge as merge
 from ._runtime import ref as ref
 from .access import Access as Access
@@ -16,6 +17,7 @@ from .overload import SimpleOverload as SimpleOverload
 from .overload import TypeOverload as TypeOverload
 from .override import OverridePerformEntity as OverridePerformEntity
 from .perform import BasePerform as BasePerform
+from .staff import ArtifactView as ArtifactView
 from .staff import Staff as Staff
 from .typing import SupportsCollect as SupportsCollect
 from .typing import SupportsMerge as SupportsMerge
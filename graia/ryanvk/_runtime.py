@@ -8,6 +8,15 @@ from graia.ryanvk.typing import SupportsMerge
 
 GLOBAL_GALLERY = {}  # layout: {namespace: {identify: {...}}}, cover-mode.
 
+artifacts_version = 0
+# bumped whenever an artifact map is mutated after collecting,
+# caches derived from artifact maps are dropped when this changes.
+
+
+def artifacts_modified():
+    global artifacts_version
+    artifacts_version += 1
+
 
 def ref(namespace: str, identify: str | None = None) -> dict[Any, Any]:
     ns = GLOBAL_GALLERY.setdefault(namespace, {})
@@ -16,6 +25,7 @@ def ref(namespace: str, identify: str | None = None) -> dict[Any, Any]:
 
 
 def merge(*artifacts: dict[Any, Any]):
+    artifacts_modified()  # overload scopes of the artifacts are merged in place.
     chainmap = ChainMap(*artifacts)
     total_signatures = list(dict.fromkeys(chain(*[i.keys() for i in artifacts])))
     result = {}
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, TypeVar
 
 from typing_extensions import Concatenate, ParamSpec
 
+from . import _runtime
 from .sign import FnImplement, FnRecord
 
 if TYPE_CHECKING:
@@ -18,7 +20,44 @@ R = TypeVar("R", covariant=True)
 P = ParamSpec("P")
 
 
+class DispatchCache:
+    # layout: {(fn, artifact_view, overload_keys): (collector, entity)}
+
+    max_size: int
+    version: int
+    records: OrderedDict[Hashable, tuple[BaseCollector, Callable]]
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size = max_size
+        self.version = _runtime.artifacts_version
+        self.records = OrderedDict()
+
+    def get(self, key: Hashable) -> tuple[BaseCollector, Callable] | None:
+        if self.version != _runtime.artifacts_version:
+            self.clear()
+            return
+
+        record = self.records.get(key)
+        if record is not None:
+            self.records.move_to_end(key)
+        return record
+
+    def set(self, key: Hashable, record: tuple[BaseCollector, Callable]):
+        self.records[key] = record
+        if len(self.records) > self.max_size:
+            self.records.popitem(last=False)
+
+    def clear(self):
+        self.records.clear()
+        self.version = _runtime.artifacts_version
+
+
 class OverloadBehavior:
+    dispatch_cache: DispatchCache | None
+
+    def __init__(self, dispatch_cache: DispatchCache | None = None) -> None:
+        self.dispatch_cache = dispatch_cache
+
     def harvest_record(self, staff: Staff, fn: Fn) -> FnRecord:
         result = staff.artifact_map.get(FnImplement(fn))
         if result is None:
@@ -28,26 +67,41 @@ class OverloadBehavior:
     def harvest_overload(
         self, staff: Staff, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs
     ) -> tuple[BaseCollector, Callable[Concatenate[Any, P], R]]:
-        artifact_record = self.harvest_record(staff, fn)
+        if not fn.has_overload_capability:
+            return self.harvest_record(staff, fn)["record_tuple"]  # type: ignore
 
-        if fn.has_overload_capability:
-            bound_args = fn.shape_signature.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            collections = None
+        overload_args = fn.extract_overload_args(args, kwargs)
 
-            for overload_item, required_args in fn.overload_param_map.items():
-                scope = artifact_record["overload_scopes"][overload_item.identity]
-                entities = overload_item.get_entities(scope, {i: bound_args.arguments[i] for i in required_args})
-                collections = entities if collections is None else collections.intersection(entities)
+        cache = self.dispatch_cache
+        if cache is None or not fn.dispatch_cacheable:
+            return self.dispatch(staff, fn, overload_args)
 
-            if not collections:
-                raise NotImplementedError
+        cache_key = (
+            fn,
+            staff.artifact_view,
+            tuple([overload_item.get_dispatch_key(i) for overload_item, i in overload_args.items()]),
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached  # type: ignore
 
-            return collections.pop()  # type: ignore
+        record = self.dispatch(staff, fn, overload_args)
+        cache.set(cache_key, record)
+        return record
 
-        else:
-            return artifact_record["record_tuple"]  # type: ignore
+    def dispatch(self, staff: Staff, fn: Fn, overload_args: dict[Any, dict[str, Any]]) -> tuple[BaseCollector, Callable]:
+        artifact_record = self.harvest_record(staff, fn)
+        collections = None
+
+        for overload_item, args in overload_args.items():
+            scope = artifact_record["overload_scopes"][overload_item.identity]
+            entities = overload_item.get_entities(scope, args)
+            collections = entities if collections is None else collections.intersection(entities)
+
+        if not collections:
+            raise NotImplementedError
 
+        return next(iter(collections))  # type: ignore
 
 
-DEFAULT_BEHAVIOR = OverloadBehavior()
+DEFAULT_BEHAVIOR = OverloadBehavior(DispatchCache())
@@ -3,7 +3,7 @@ from __future__ import annotations
 from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
-from ._runtime import GLOBAL_GALLERY
+from ._runtime import GLOBAL_GALLERY, artifacts_modified
 from .perform import BasePerform
 
 if TYPE_CHECKING:
@@ -44,6 +44,7 @@ class BaseCollector:
 
     def collect(self, signature: Any, artifact: Any):
         self.artifacts[signature] = artifact
+        artifacts_modified()
 
     def on_collected(self, func: Callable[[type], Any]):
         self.collected_callbacks.append(func)
@@ -66,7 +67,11 @@ class BaseCollector:
         return context_manager.__enter__()
 
     def post_merge(self, origin: dict):
-        self.on_collected(lambda _: origin.update(self.artifacts))
+        def merge_into(_):
+            origin.update(self.artifacts)
+            artifacts_modified()
+
+        self.on_collected(merge_into)
 
     def entity(self, signature: SupportsCollect[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
         return signature.collect(self, *args, **kwargs)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Callable, Generic, overload
 
 from typing_extensions import Concatenate, ParamSpec, Self, TypeVar
 
+from graia.ryanvk._runtime import artifacts_modified
 from graia.ryanvk.sign import FnImplement
 
 from .behavior import DEFAULT_BEHAVIOR, OverloadBehavior
@@ -45,6 +46,9 @@ class Fn(Generic[P, R]):
     overload_params: dict[str, FnOverload]
     overload_param_map: dict[FnOverload, list[str]]
     overload_map: dict[str, FnOverload]
+    overload_binders: list[tuple[FnOverload, list[tuple[str, int | None, Any]]]]
+    # layout: [(overload_item, [(param_name, positional_index, default)])]
+    dispatch_cacheable: bool
 
     def __init__(
         self: Fn[P, R],
@@ -59,6 +63,44 @@ class Fn(Generic[P, R]):
         self.overload_param_map = overload_param_map or {}
         self.overload_params = {i: k for k, v in self.overload_param_map.items() for i in v}
         self.overload_map = {i.identity: i for i in self.overload_param_map}
+        self.overload_binders = self._compile_binders()
+        self.dispatch_cacheable = all(i.dispatch_key_hashable for i in self.overload_param_map)
+
+    def _compile_binders(self):
+        positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        indexes = {}
+        for index, param in enumerate(self.shape_signature.parameters.values()):
+            if param.kind not in positional_kinds:
+                break
+            indexes[param.name] = index
+
+        binders = []
+        for overload_item, required_args in self.overload_param_map.items():
+            params = []
+            for name in required_args:
+                if name not in self.shape_signature.parameters:
+                    raise TypeError(f"{self.shape.__qualname__} has no parameter named {name!r} to overload")
+                params.append((name, indexes.get(name), self.shape_signature.parameters[name].default))
+            binders.append((overload_item, params))
+
+        return binders
+
+    def extract_overload_args(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[FnOverload, dict[str, Any]]:
+        result = {}
+
+        for overload_item, params in self.overload_binders:
+            values = result[overload_item] = {}
+            for name, index, default in params:
+                if index is not None and index < len(args):
+                    values[name] = args[index]
+                elif name in kwargs:
+                    values[name] = kwargs[name]
+                elif default is not inspect.Parameter.empty:
+                    values[name] = default
+                else:
+                    raise TypeError(f"missing a required argument: {name!r}")
+
+        return result
 
     def __set_name__(self, owner: type[BasePerform], name: str):
         self.owner = owner
@@ -118,6 +160,7 @@ class Fn(Generic[P, R]):
             else:
                 artifact["record_tuple"] = (collector, entity)
 
+            artifacts_modified()
             return entity
 
         return wrapper
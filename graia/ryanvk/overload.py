@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, Hashable
 
 from graia.ryanvk.collector import BaseCollector
 
 
 class FnOverload:
+    dispatch_key_hashable: bool = False
+    # whether get_dispatch_key always returns a hashable value, which makes the Fn dispatch cacheable.
+
     @property
     def identity(self) -> str:
         return self.__class__.__name__
@@ -22,6 +25,11 @@ class FnOverload:
     def get_entities(self, scope: dict[Any, Any], args: dict[str, Any]) -> set[tuple[BaseCollector, Callable]]:
         return scope["_"]
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> Hashable:
+        # the value which get_entities actually depends on, used as dispatch cache key.
+        # by default, the arguments themselves, which are not known to be hashable.
+        return tuple(args.values())
+
     def merge_scopes(self, *scopes: dict[Any, Any]) -> dict:
         return scopes[-1]
 
@@ -30,6 +38,8 @@ class FnOverload:
 
 
 class SimpleOverload(FnOverload):
+    dispatch_key_hashable = True
+
     @property
     def identity(self) -> str:
         return str(id(self))
@@ -73,6 +83,8 @@ class SimpleOverload(FnOverload):
 
 
 class TypeOverload(FnOverload):
+    dispatch_key_hashable = True
+
     @property
     def identity(self) -> str:
         return "type_overload:" + str(id(self))
@@ -102,6 +114,9 @@ class TypeOverload(FnOverload):
 
         return result_sets.pop().intersection(*result_sets)
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> Hashable:
+        return tuple([type(i) for i in args.values()])
+
     def merge_scopes(self, *scopes: dict[Any, Any]):
         # layout: {arg: {value: set}}
 
@@ -128,6 +143,10 @@ class NoneOverload(FnOverload):
     def identity(self) -> str:
         return "none_overload:" + str(id(self))
 
+    @property
+    def dispatch_key_hashable(self) -> bool:
+        return self.bypassing.dispatch_key_hashable
+
     def get_params_layout(self, params: list[str], args: dict[str, Any]) -> dict[str, Any]:
         if self.default_factory is not None:
             return {param: args.get(param) or self.default_factory(param) for param in params}
@@ -169,7 +188,15 @@ class NoneOverload(FnOverload):
 
         return sets.pop().intersection(*sets)
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> Hashable:
+        return tuple(
+            (True, None) if v is None else (False, self.bypassing.get_dispatch_key({k: v})) for k, v in args.items()
+        )
+
+
 class PredicateOverload(FnOverload):
+    dispatch_key_hashable = True
+
     predicate: Callable[[str, Any], Any]
 
     def __init__(self, predicate: Callable[[str, Any], Any]) -> None:
@@ -204,6 +231,9 @@ class PredicateOverload(FnOverload):
 
         return result_sets.pop().intersection(*result_sets)
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> Hashable:
+        return tuple([self.predicate(k, v) for k, v in args.items()])
+
     def merge_scopes(self, *scopes: dict[Any, Any]):
         # layout: {arg: {value: set}}
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from collections import ChainMap
 from contextlib import AsyncExitStack, asynccontextmanager
 from copy import copy
-from typing import TYPE_CHECKING, Any, Callable, Protocol, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Protocol, TypeVar, overload
 
 from typing_extensions import ParamSpec
 
+from . import _runtime
+
 if TYPE_CHECKING:
     from .fn import Fn
     from .perform import BasePerform
@@ -15,20 +16,74 @@ P = ParamSpec("P")
 R = TypeVar("R", covariant=True)
 VnCallable = TypeVar("VnCallable", bound=Callable)
 
+
+class ArtifactView:
+    """A flattened, read-only layout of artifact collections, shared by every staff with the same layers.
+
+    Lookup follows ChainMap semantics: former collections cover the latter ones.
+    Collections should be modified via collectors or `BasePerform.apply_to`,
+    otherwise call `artifacts_modified` to have the views rebuilt.
+    """
+
+    collections: tuple[dict[Any, Any], ...]
+    mapping: dict[Any, Any]
+    version: int
+
+    views: ClassVar[dict[tuple[int, ...], ArtifactView]] = {}
+    # layout: {ids of collections: view}, views hold their collections so the ids stay unique.
+    max_views: ClassVar[int] = 1024
+
+    def __init__(self, collections: tuple[dict[Any, Any], ...]) -> None:
+        self.collections = collections
+        self.version = _runtime.artifacts_version
+        self.mapping = {}
+        for collection in reversed(collections):
+            self.mapping.update(collection)
+
+    @classmethod
+    def of(cls, collections: list[dict[Any, Any]]) -> ArtifactView:
+        key = tuple(map(id, collections))
+        view = cls.views.get(key)
+        if view is not None and view.fresh:
+            return view
+
+        if view is not None or len(cls.views) >= cls.max_views:
+            # artifacts were modified since the views were built, or too many layouts are seen: start over.
+            cls.views.clear()
+
+        view = cls.views[key] = cls(tuple(collections))
+        return view
+
+    @property
+    def fresh(self) -> bool:
+        return self.version == _runtime.artifacts_version
+
+
 class Staff:
     artifact_collections: list[dict[Any, Any]]
-    artifact_map: ChainMap[Any, Any]
+    _artifact_view: ArtifactView
     components: dict[str, Any]
     exit_stack: AsyncExitStack
     instances: dict[type, Any]
 
     def __init__(self, artifacts_collections: list[dict[Any, Any]], components: dict[str, Any]) -> None:
         self.artifact_collections = artifacts_collections
-        self.artifact_map = ChainMap(*artifacts_collections)
+        self._artifact_view = ArtifactView.of(artifacts_collections)
         self.components = components
         self.exit_stack = AsyncExitStack()
         self.instances = {}
 
+    @property
+    def artifact_view(self) -> ArtifactView:
+        view = self._artifact_view
+        if not view.fresh:
+            view = self._artifact_view = ArtifactView.of(self.artifact_collections)
+        return view
+
+    @property
+    def artifact_map(self) -> dict[Any, Any]:
+        return self.artifact_view.mapping
+
     def call_fn(self, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
         collector, entity = fn.behavior.harvest_overload(self, fn, *args, **kwargs)
         return fn.execute(self, collector, entity, *args, **kwargs)
@@ -49,6 +104,7 @@ class Staff:
         perform = perform_type(self)
         perform.__post_init__(*args, **kwargs)
         self.artifact_collections.insert(0, perform.__collector__.artifacts)
+        self._artifact_view = ArtifactView.of(self.artifact_collections)
 
     async def maintain(self, perform: BasePerform):
         await self.exit_stack.enter_async_context(perform.lifespan())
@@ -59,8 +115,11 @@ class Staff:
             yield self
 
     def ext(self, components: dict[str, Any]):
+        # a cheap overlay: artifacts and exit stack are shared,
+        # performs are instantiated again as they may access the extra components.
         instance = copy(self)
-        instance.components.update(components)
+        instance.components = {**self.components, **components}
+        instance.instances = {}
         return instance
 
     def get_fn_call(self, fn: Fn[P, R]) -> Callable[P, R]:
@@ -0,0 +1,82 @@
+"""Compare cached and uncached `Staff.call_fn` dispatch.
+
+Two shapes are measured: a OneBot11-like element deserializer dispatched by a predicate,
+and a target-dispatched call made on many distinct members, as the metadata pulls are.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from avilla.core.ryanvk.overload.target import TargetOverload
+from avilla.core.selector import Selector
+from graia.ryanvk import BaseCollector, Fn, PredicateOverload, Staff
+from graia.ryanvk.behavior import DispatchCache, OverloadBehavior
+
+ELEMENT_TYPES = ["text", "face", "image", "record", "at", "reply", "json", "xml", "dice", "rps", "poke", "video"]
+CHAIN = [{"type": t, "data": {}} for t in ["reply", "at", "text", "face", "text", "image", "text"]]
+TARGET_PATTERNS = [
+    "land.group",
+    "land.group.member",
+    "land.group.member.nickname",
+    "land.group.announcement",
+    "land.group.file",
+    "land.friend",
+    "land.friend.nickname",
+    "land.stranger",
+]
+TARGETS = [
+    Selector().land("qq").group(str(group)).member(str(member)) for group in range(64) for member in range(96)
+]
+ROUNDS = 20000
+
+
+def build_element(behavior: OverloadBehavior):
+    class Capability((m := BaseCollector())._):
+        @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]}, behavior=behavior)
+        def deserialize_element(self, raw_element: dict) -> str:  # type: ignore
+            ...
+
+    class Perform((m := BaseCollector())._):
+        for element_type in ELEMENT_TYPES:
+
+            @m.entity(Capability.deserialize_element, raw_element=element_type)
+            def _(self, raw_element: dict, *, _type: str = element_type) -> str:
+                return _type
+
+    return Staff([Perform.__collector__.artifacts], {}), Capability.deserialize_element, [(raw,) for raw in CHAIN]
+
+
+def build_target(behavior: OverloadBehavior):
+    class Capability((m := BaseCollector())._):
+        @Fn.complex({TargetOverload(): ["target"]}, behavior=behavior)
+        def describe(self, target: Selector) -> str:  # type: ignore
+            ...
+
+    class Perform((m := BaseCollector())._):
+        for pattern in TARGET_PATTERNS:
+
+            @m.entity(Capability.describe, target=pattern)
+            def _(self, target: Selector, *, _pattern: str = pattern) -> str:
+                return _pattern
+
+    return Staff([Perform.__collector__.artifacts], {}), Capability.describe, [(target,) for target in TARGETS]
+
+
+def main():
+    for shape, build in [("element", build_element), ("target", build_target)]:
+        for name, behavior in [("uncached", OverloadBehavior()), ("cached", OverloadBehavior(DispatchCache()))]:
+            staff, fn, calls = build(behavior)
+
+            def run(staff=staff, fn=fn, calls=calls):
+                for args in calls:
+                    staff.call_fn(fn, *args)
+
+            rounds = max(1, ROUNDS // len(calls))
+            elapsed = min(timeit.repeat(run, number=rounds, repeat=5))
+            per_call = elapsed / (rounds * len(calls)) * 1e9
+            print(f"{shape:>8} {name:>9}: {elapsed:.3f}s for {rounds * len(calls)} calls, {per_call:.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compare the available JSON codecs on transport payloads shaped like real OneBot11 / QQAPI / Red traffic."""
+
+from __future__ import annotations
+
+import json
+import timeit
+
+from avilla.core.utilles.json_codec import CODECS
+
+PAYLOADS = {
+    "onebot11.message": {
+        "time": 1700000000,
+        "self_id": 3165388245,
+        "post_type": "message",
+        "message_type": "group",
+        "sub_type": "normal",
+        "message_id": -2147481234,
+        "group_id": 123456789,
+        "user_id": 987654321,
+        "anonymous": None,
+        "message": [
+            {"type": "reply", "data": {"id": "-2147481233"}},
+            {"type": "at", "data": {"qq": "3165388245"}},
+            {"type": "text", "data": {"text": " 你好，Avilla！今天的天气怎么样？"}},
+            {"type": "face", "data": {"id": "178"}},
+            {
+                "type": "image",
+                "data": {
+                    "file": "0d7a6a3f4c1e2b9d8f7e6a5b4c3d2e1f.image",
+                    "url": "https://gchat.qpic.cn/gchatpic_new/987654321/123456789-0D7A6A3F4C1E2B9D8F7E6A5B4C3D2E1F/0",
+                },
+            },
+        ],
+        "raw_message": "[CQ:reply,id=-2147481233][CQ:at,qq=3165388245] 你好，Avilla！今天的天气怎么样？[CQ:face,id=178]",
+        "font": 0,
+        "sender": {
+            "user_id": 987654321,
+            "nickname": "群友",
+            "card": "群名片",
+            "sex": "unknown",
+            "age": 0,
+            "area": "",
+            "level": "42",
+            "role": "member",
+            "title": "",
+        },
+    },
+    "onebot11.heartbeat": {
+        "time": 1700000000,
+        "self_id": 3165388245,
+        "post_type": "meta_event",
+        "meta_event_type": "heartbeat",
+        "status": {"online": True, "good": True, "stat": {"packet_received": 123456, "packet_sent": 65432}},
+        "interval": 5000,
+    },
+    "qqapi.dispatch": {
+        "op": 0,
+        "s": 42,
+        "t": "GROUP_AT_MESSAGE_CREATE",
+        "id": "GROUP_AT_MESSAGE_CREATE:abcdef0123456789",
+        "d": {
+            "id": "ROBOT1.0_abcdef0123456789abcdef0123456789",
+            "content": " /签到",
+            "timestamp": "2023-11-15T06:13:20+08:00",
+            "group_openid": "C0FFEE0123456789ABCDEF0123456789",
+            "author": {"id": "0123456789ABCDEF0123456789ABCDEF", "member_openid": "0123456789ABCDEF0123456789ABCDEF"},
+        },
+    },
+    "red.message": {
+        "type": "message::recv",
+        "payload": [
+            {
+                "msgId": "7301234567890123456",
+                "msgRandom": "1234567890",
+                "msgSeq": "12345",
+                "chatType": 2,
+                "msgTime": "1700000000",
+                "senderUin": "987654321",
+                "peerUin": "123456789",
+                "sendNickName": "群友",
+                "sendMemberName": "群名片",
+                "elements": [
+                    {
+                        "elementType": 1,
+                        "elementId": "7301234567890123457",
+                        "textElement": {"content": "你好", "atType": 0, "atUid": "", "atNtUid": ""},
+                    }
+                ],
+                "roleType": 2,
+            }
+        ],
+    },
+}
+ROUNDS = 20000
+
+
+def main():
+    raw = {name: json.dumps(payload, ensure_ascii=False) for name, payload in PAYLOADS.items()}
+
+    for codec_name, factory in CODECS.items():
+        try:
+            codec = factory()
+        except ImportError:
+            print(f"{codec_name:>8}: not installed")
+            continue
+
+        for name, payload in PAYLOADS.items():
+            text = raw[name]
+            decode = min(timeit.repeat(lambda codec=codec, text=text: codec.loads(text), number=ROUNDS, repeat=5))
+            encode = min(
+                timeit.repeat(lambda codec=codec, payload=payload: codec.dumps(payload), number=ROUNDS, repeat=5)
+            )
+            print(
+                f"{codec_name:>8} {name:<20}: "
+                f"loads {decode / ROUNDS * 1e6:.2f} us/op, dumps {encode / ROUNDS * 1e6:.2f} us/op"
+            )
+
+
+if __name__ == "__main__":
+    main()
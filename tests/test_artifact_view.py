@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import unittest
+
+from graia.ryanvk import ArtifactView, BaseCollector, Fn, Staff, artifacts_modified
+
+
+class Capability((m := BaseCollector())._):
+    @Fn
+    def name(self) -> str:  # type: ignore
+        ...
+
+
+def build(result: str):
+    class Perform((m := BaseCollector())._):
+        @m.entity(Capability.name)
+        def name(self) -> str:
+            return result
+
+    return Perform
+
+
+class ArtifactViewTest(unittest.TestCase):
+    def setUp(self):
+        self.former = build("former")
+        self.latter = build("latter")
+        self.collections = [self.former.__collector__.artifacts, self.latter.__collector__.artifacts]
+
+    def test_shared(self):
+        first = Staff(self.collections, {})
+        second = Staff(list(self.collections), {})
+        self.assertIs(first.artifact_view, second.artifact_view)
+        # former collections cover the latter ones, as with a ChainMap.
+        self.assertEqual(first.call_fn(Capability.name), "former")
+
+    def test_modified(self):
+        staff = Staff(self.collections, {})
+        view = staff.artifact_view
+        artifacts_modified()
+        self.assertFalse(view.fresh)
+        self.assertIsNot(staff.artifact_view, view)
+        self.assertTrue(staff.artifact_view.fresh)
+
+    def test_inject(self):
+        staff = Staff([self.latter.__collector__.artifacts], {})
+        view = staff.artifact_view
+        self.assertEqual(staff.call_fn(Capability.name), "latter")
+
+        staff.inject(self.former)
+        self.assertIsNot(staff.artifact_view, view)
+        self.assertEqual(staff.artifact_view.collections[0], self.former.__collector__.artifacts)
+        # the injected perform takes over, whatever was dispatched before.
+        self.assertEqual(staff.call_fn(Capability.name), "former")
+
+    def test_max_views(self):
+        max_views = ArtifactView.max_views
+        ArtifactView.max_views = 2
+        try:
+            staffs = [Staff([build(str(i)).__collector__.artifacts], {}) for i in range(3)]
+            self.assertLessEqual(len(ArtifactView.views), 2)
+            self.assertEqual([staff.call_fn(Capability.name) for staff in staffs], ["0", "1", "2"])
+        finally:
+            ArtifactView.max_views = max_views
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import unittest
+
+from graia.ryanvk import BaseCollector, Fn, FnOverload, PredicateOverload, Staff, artifacts_modified
+from graia.ryanvk.behavior import DispatchCache, OverloadBehavior
+
+
+class CountingBehavior(OverloadBehavior):
+    def __init__(self, dispatch_cache: DispatchCache | None = None) -> None:
+        super().__init__(dispatch_cache)
+        self.dispatched = 0
+
+    def dispatch(self, staff, fn, overload_args):
+        self.dispatched += 1
+        return super().dispatch(staff, fn, overload_args)
+
+
+def build(behavior: OverloadBehavior, overload: FnOverload):
+    class Capability((m := BaseCollector())._):
+        @Fn.complex({overload: ["raw"]}, behavior=behavior)
+        def handle(self, raw: dict) -> str:  # type: ignore
+            ...
+
+    class Perform((m := BaseCollector())._):
+        for name in ["text", "image", "at"]:
+
+            @m.entity(Capability.handle, raw=name)
+            def _(self, raw: dict, *, _name: str = name) -> str:
+                return _name
+
+    return Staff([Perform.__collector__.artifacts], {}), Capability.handle
+
+
+class DispatchCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.behavior = CountingBehavior(DispatchCache())
+        self.staff, self.fn = build(self.behavior, PredicateOverload(lambda _, raw: raw["type"]))
+
+    def test_cached(self):
+        self.assertEqual(self.staff.call_fn(self.fn, {"type": "text"}), "text")
+        # keyed on the predicate result, so other arguments of the same type hit the cache.
+        self.assertEqual(self.staff.call_fn(self.fn, {"type": "text", "data": {"text": "hi"}}), "text")
+        self.assertEqual(self.behavior.dispatched, 1)
+
+        self.assertEqual(self.staff.call_fn(self.fn, {"type": "image"}), "image")
+        self.assertEqual(self.behavior.dispatched, 2)
+
+    def test_unimplemented(self):
+        with self.assertRaises(NotImplementedError):
+            self.staff.call_fn(self.fn, {"type": "unknown"})
+        with self.assertRaises(NotImplementedError):
+            self.staff.call_fn(self.fn, {"type": "unknown"})
+        self.assertEqual(self.behavior.dispatched, 2)
+
+    def test_invalidated(self):
+        self.staff.call_fn(self.fn, {"type": "text"})
+        artifacts_modified()
+        self.staff.call_fn(self.fn, {"type": "text"})
+        self.assertEqual(self.behavior.dispatched, 2)
+
+    def test_evicted(self):
+        self.behavior.dispatch_cache = DispatchCache(max_size=2)
+        for name in ["text", "image", "text", "at", "image"]:
+            self.staff.call_fn(self.fn, {"type": name})
+
+        # "text" was used again before "at" came, so "image" is evicted in its stead.
+        self.assertEqual(self.behavior.dispatched, 4)
+
+    def test_uncacheable(self):
+        class PlainOverload(FnOverload):
+            @property
+            def identity(self) -> str:
+                return "plain_overload:" + str(id(self))
+
+        staff, fn = build(self.behavior, PlainOverload())
+        self.assertFalse(fn.dispatch_cacheable)
+        self.assertTrue(self.fn.dispatch_cacheable)
+
+        # the arguments are unhashable, which must not reach the cache.
+        staff.call_fn(fn, {"type": "text"})
+        staff.call_fn(fn, {"type": "text"})
+        self.assertEqual(self.behavior.dispatched, 2)
+        self.assertFalse(self.behavior.dispatch_cache.records)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import unittest
+
+from graia.ryanvk import BaseCollector, Fn, SimpleOverload, Staff
+
+
+class FnBinderTest(unittest.TestCase):
+    def setUp(self):
+        self.kind = SimpleOverload()
+        self.mode = SimpleOverload()
+
+        @Fn.complex({self.kind: ["kind"], self.mode: ["mode"]})
+        def handle(self, data: str, kind: str = "text", *, mode: str = "plain") -> str:  # type: ignore
+            ...
+
+        self.fn = handle
+
+    def test_positional(self):
+        self.assertEqual(
+            self.fn.extract_overload_args(("data", "image"), {"mode": "raw"}),
+            {self.kind: {"kind": "image"}, self.mode: {"mode": "raw"}},
+        )
+
+    def test_keyword(self):
+        self.assertEqual(
+            self.fn.extract_overload_args(("data",), {"kind": "image", "mode": "raw"}),
+            {self.kind: {"kind": "image"}, self.mode: {"mode": "raw"}},
+        )
+
+    def test_default(self):
+        self.assertEqual(
+            self.fn.extract_overload_args(("data",), {}),
+            {self.kind: {"kind": "text"}, self.mode: {"mode": "plain"}},
+        )
+
+    def test_kw_only_not_positional(self):
+        # `mode` is keyword-only, so a surplus positional argument never binds to it.
+        self.assertEqual(
+            self.fn.extract_overload_args(("data", "image", "raw"), {}),
+            {self.kind: {"kind": "image"}, self.mode: {"mode": "plain"}},
+        )
+
+    def test_missing(self):
+        overload = SimpleOverload()
+
+        @Fn.complex({overload: ["data"]})
+        def handle(self, data: str) -> str:  # type: ignore
+            ...
+
+        with self.assertRaises(TypeError):
+            handle.extract_overload_args((), {})
+
+    def test_unknown_param(self):
+        with self.assertRaises(TypeError):
+
+            @Fn.complex({SimpleOverload(): ["unknown"]})
+            def handle(self, kind: str) -> str:  # type: ignore
+                ...
+
+    def test_call(self):
+        class Capability((m := BaseCollector())._):
+            handle = self.fn
+
+        class Perform((m := BaseCollector())._):
+            @m.entity(Capability.handle, kind="image", mode="raw")
+            def image_raw(self, data: str, kind: str = "text", *, mode: str = "plain") -> str:
+                return f"raw image {data}"
+
+            @m.entity(Capability.handle, kind="text", mode="plain")
+            def text_plain(self, data: str, kind: str = "text", *, mode: str = "plain") -> str:
+                return f"plain text {data}"
+
+        staff = Staff([Perform.__collector__.artifacts], {})
+        self.assertEqual(staff.call_fn(Capability.handle, "a"), "plain text a")
+        self.assertEqual(staff.call_fn(Capability.handle, "b", "image", mode="raw"), "raw image b")
+
+
+if __name__ == "__main__":
+    unittest.main()
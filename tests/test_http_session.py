@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from graia.broadcast import Broadcast
+from launart import Launart
+
+from avilla.core import Avilla
+from avilla.core.http import HttpSessionConfig, HttpSessionService
+
+
+class HttpSessionServiceTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = HttpSessionService(HttpSessionConfig(limit=10, limit_per_host=2))
+
+        @asynccontextmanager
+        async def stage(name: str):
+            yield
+
+        self.service.stage = stage  # type: ignore
+
+    async def test_session(self):
+        session = self.service.session
+        self.addAsyncCleanup(session.close)
+        # created on demand and shared by every fetch.
+        self.assertIs(self.service.session, session)
+        self.assertEqual(session.connector.limit, 10)  # type: ignore
+        self.assertEqual(session.connector.limit_per_host, 2)  # type: ignore
+        self.assertEqual(session.timeout.total, 300.0)
+        self.assertEqual(session.timeout.sock_connect, 10.0)
+
+    async def test_cleanup(self):
+        sigexit = asyncio.Event()
+        manager = SimpleNamespace(status=SimpleNamespace(wait_for_sigexit=sigexit.wait))
+        launch = asyncio.create_task(self.service.launch(manager))  # type: ignore
+
+        session = self.service.session
+        sigexit.set()
+        await launch
+
+        self.assertTrue(session.closed)
+        with self.assertRaises(RuntimeError):
+            _ = self.service.session
+
+    async def test_avilla_http_session(self):
+        avilla = Avilla(broadcast=Broadcast(), launch_manager=Launart())
+        self.assertIs(avilla.http_session, avilla.http_service.session)  # type: ignore
+        self.addAsyncCleanup(avilla.http_session.close)
+
+        avilla.http_service = None
+        with self.assertRaises(RuntimeError):
+            _ = avilla.http_session
+
+
+if __name__ == "__main__":
+    unittest.main()
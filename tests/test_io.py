@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import base64
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from avilla.core.utilles import io
+
+DATA = b"\x89PNG" * 16
+
+
+class IOTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.threshold = io.offload_threshold
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file = Path(directory.name, "image.png")
+        self.file.write_bytes(DATA)
+
+    def tearDown(self):
+        io.configure(threshold=self.threshold)
+
+    async def test_inline(self):
+        io.configure(threshold=len(DATA) + 1)
+        self.assertEqual(await io.read_file(self.file), DATA)
+        self.assertEqual(await io.b64encode(DATA), base64.b64encode(DATA).decode())
+
+    async def test_offload(self):
+        io.configure(threshold=len(DATA))
+        threads = []
+
+        def current_thread():
+            threads.append(threading.current_thread().name)
+
+        await io.run_blocking(current_thread)
+        self.assertTrue(threads[0].startswith("avilla-io"))
+        self.assertEqual(await io.read_file(self.file), DATA)
+        self.assertEqual(await io.b64encode(DATA), base64.b64encode(DATA).decode())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+from avilla.core.utilles.json_codec import CODECS, JsonCodec, get_codec, set_codec
+
+PAYLOAD = {"post_type": "message", "self_id": 3165388245, "message": [{"type": "text", "data": {"text": "你好"}}]}
+
+
+class JsonCodecTest(unittest.TestCase):
+    def tearDown(self):
+        set_codec(None)
+
+    def installed(self):
+        for factory in CODECS.values():
+            try:
+                yield factory()
+            except ImportError:
+                continue
+
+    def test_round_trip(self):
+        for codec in self.installed():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(codec.loads(codec.dumps(PAYLOAD)), PAYLOAD)
+                self.assertEqual(codec.loads(json.dumps(PAYLOAD).encode()), PAYLOAD)
+
+    def test_big_integers(self):
+        big = {"id": 2**70}
+        for codec in self.installed():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(json.loads(codec.dumps(big)), big)
+
+    def test_invalid(self):
+        for codec in self.installed():
+            with self.subTest(codec=codec.name), self.assertRaises(ValueError):
+                codec.loads("{")
+
+    def test_set_codec(self):
+        set_codec("json")
+        self.assertEqual(get_codec().name, "json")
+
+        custom = JsonCodec("custom", json.loads, json.dumps)
+        set_codec(custom)
+        self.assertIs(get_codec(), custom)
+
+        with self.assertRaises(ValueError):
+            set_codec("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import base64
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from avilla.core.elements import Picture
+from avilla.core.resource import LocalFileResource, RawResource
+from avilla.core.ryanvk.staff import Staff
+from avilla.elizabeth.perform.message.serialize import ElizabethMessageSerializePerform
+from avilla.onebot.v11.perform.message.serialize import OneBot11MessageSerializePerform
+
+DATA = b"\x89PNG" * 16
+
+
+class MediaSerializeTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file = Path(directory.name, "image.png")
+        self.file.write_bytes(DATA)
+        self.encoded = base64.b64encode(DATA).decode()
+
+    def perform(self, perform_type: type, connection: SimpleNamespace, **components):
+        account = SimpleNamespace(connection=connection)
+        staff = Staff([perform_type.__collector__.artifacts], {"account": account, **components})
+        return perform_type(staff)
+
+    async def test_onebot11_local_file_uri(self):
+        perform = self.perform(OneBot11MessageSerializePerform, SimpleNamespace(local_file_uri=True))
+        self.assertEqual(await perform.resource_file(LocalFileResource(self.file)), self.file.resolve().as_uri())
+        # raw bytes have no file to point at.
+        self.assertEqual(await perform.resource_file(RawResource(DATA)), "base64://" + self.encoded)
+
+    async def test_onebot11_base64(self):
+        perform = self.perform(OneBot11MessageSerializePerform, SimpleNamespace(local_file_uri=False))
+        self.assertEqual(await perform.resource_file(LocalFileResource(self.file)), "base64://" + self.encoded)
+
+    async def test_elizabeth_base64(self):
+        perform = self.perform(ElizabethMessageSerializePerform, SimpleNamespace(upload_media=False))
+        self.assertEqual(await perform.image(Picture(self.file)), {"type": "Image", "base64": self.encoded})
+
+    async def test_elizabeth_upload(self):
+        calls = []
+
+        async def call(method, action, params):
+            calls.append((method, action, params))
+            return {"imageId": "{ID}"}
+
+        connection = SimpleNamespace(upload_media=True, session_key="key", call=call)
+        perform = self.perform(ElizabethMessageSerializePerform, connection, upload_type="friend")
+        self.assertEqual(await perform.image(Picture(RawResource(DATA))), {"type": "Image", "imageId": "{ID}"})
+        self.assertEqual(
+            calls,
+            [
+                (
+                    "multipart",
+                    "uploadImage",
+                    {"sessionKey": "key", "type": "friend", "img": {"value": DATA, "filename": "image"}},
+                )
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from avilla.core.selector import Selector
+from avilla.core.utilles.metadata_cache import MetadataCache
+
+GROUP = Selector().land("qq").group("1")
+MEMBER = GROUP.member("10")
+OTHER_MEMBER = GROUP.member("20")
+OTHER_GROUP = Selector().land("qq").group("2")
+
+
+class Nick:
+    ...
+
+
+class Summary:
+    ...
+
+
+class MetadataCacheTest(unittest.TestCase):
+    def test_get_set(self):
+        cache = MetadataCache()
+        self.assertIsNone(cache.get((MEMBER, Nick)))
+
+        cache.set((MEMBER, Nick), "nick")
+        self.assertEqual(cache.get((MEMBER, Nick)), "nick")
+        self.assertIsNone(cache.get((MEMBER, Summary)))
+        # selectors equal by content share the entries.
+        self.assertEqual(cache.get((Selector().land("qq").group("1").member("10"), Nick)), "nick")
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_expire(self):
+        cache = MetadataCache(ttl=10)
+        with mock.patch("avilla.core.utilles.ttl_cache.monotonic", return_value=100.0):
+            cache.set((MEMBER, Nick), "nick")
+        with mock.patch("avilla.core.utilles.ttl_cache.monotonic", return_value=109.0):
+            self.assertEqual(cache.get((MEMBER, Nick)), "nick")
+        with mock.patch("avilla.core.utilles.ttl_cache.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get((MEMBER, Nick)))
+        self.assertEqual(len(cache), 0)
+        self.assertFalse(cache._targets)
+
+    def test_lru(self):
+        cache = MetadataCache(max_size=2)
+        cache.set((MEMBER, Nick), 1)
+        cache.set((OTHER_MEMBER, Nick), 2)
+        cache.get((MEMBER, Nick))
+        cache.set((GROUP, Summary), 3)
+
+        self.assertEqual(cache.get((MEMBER, Nick)), 1)
+        self.assertIsNone(cache.get((OTHER_MEMBER, Nick)))
+        self.assertEqual(len(cache), 2)
+        # evicted entries leave the target index as well.
+        self.assertNotIn(OTHER_MEMBER, cache._targets)
+
+    def test_invalidate(self):
+        cache = MetadataCache()
+        cache.set((MEMBER, Nick), 1)
+        cache.set((MEMBER, Summary), 2)
+
+        cache.invalidate(MEMBER, Nick)
+        self.assertIsNone(cache.get((MEMBER, Nick)))
+        self.assertEqual(cache.get((MEMBER, Summary)), 2)
+
+        cache.invalidate(MEMBER)
+        self.assertIsNone(cache.get((MEMBER, Summary)))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_descendants(self):
+        cache = MetadataCache()
+        cache.set((GROUP, Summary), 0)
+        cache.set((MEMBER, Nick), 1)
+        cache.set((OTHER_MEMBER, Nick), 2)
+        cache.set((OTHER_GROUP.member("10"), Nick), 3)
+
+        cache.invalidate(GROUP)
+        self.assertEqual(cache.get((MEMBER, Nick)), 1)
+
+        cache.invalidate(GROUP, descendants=True)
+        self.assertIsNone(cache.get((GROUP, Summary)))
+        self.assertIsNone(cache.get((MEMBER, Nick)))
+        self.assertIsNone(cache.get((OTHER_MEMBER, Nick)))
+        self.assertEqual(cache.get((OTHER_GROUP.member("10"), Nick)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
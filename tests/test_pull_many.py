@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import unittest
+from typing import Sequence
+
+from avilla.core.ryanvk.collector.base import AvillaBaseCollector
+from avilla.core.ryanvk.staff import Staff
+from avilla.core.selector import Selector
+from avilla.standard.core.profile import Nick
+
+GROUP = Selector().land("qq").group("1")
+MEMBERS = [GROUP.member(str(i)) for i in range(4)]
+OTHER_GROUP_MEMBER = Selector().land("qq").group("2").member("0")
+FRIEND = Selector().land("qq").friend("0")
+
+
+class PullManyTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        batches = self.batches = []
+        pulls = self.pulls = []
+
+        class NickPerform((m := AvillaBaseCollector())._):
+            @m.pull_many("land.group.member", Nick)
+            async def get_nicks(self, targets: Sequence[Selector], route: type[Nick]) -> dict[Selector, Nick]:
+                batches.append(list(targets))
+                # the member list misses those who left meanwhile.
+                return {
+                    target: Nick(target.pattern["member"], "batched", None)
+                    for target in targets
+                    if target.pattern["member"] in {"0", "1"}
+                }
+
+            @m.pull("land.group.member", Nick)
+            async def get_nick(self, target: Selector, route: type[Nick]) -> Nick:
+                pulls.append(target)
+                return Nick(target.pattern["member"], "single", None)
+
+            @m.pull("land.friend", Nick)
+            async def get_friend_nick(self, target: Selector, route: type[Nick]) -> Nick:
+                pulls.append(target)
+                return Nick(target.pattern["friend"], "single", None)
+
+        self.staff = Staff([NickPerform.__collector__.artifacts], {})
+
+    async def test_partial_batch(self):
+        result = await self.staff.pull_metadata_many(MEMBERS, Nick)
+
+        self.assertEqual(self.batches, [MEMBERS])
+        # the targets missing from the batch result are pulled one by one.
+        self.assertEqual(self.pulls, MEMBERS[2:])
+        self.assertEqual(list(result), MEMBERS)
+        self.assertEqual([i.nickname for i in result.values()], ["batched", "batched", "single", "single"])
+
+    async def test_grouping(self):
+        targets = [MEMBERS[0], FRIEND, OTHER_GROUP_MEMBER, MEMBERS[0], MEMBERS[1]]
+        result = await self.staff.pull_metadata_many(targets, Nick)
+
+        # members of every group resolve to the same implementation, the friend has no batched one.
+        self.assertEqual(self.batches, [[MEMBERS[0], OTHER_GROUP_MEMBER, MEMBERS[1]]])
+        self.assertEqual(self.pulls, [FRIEND])
+        # duplicates are pulled once, in the order they first came.
+        self.assertEqual(list(result), [MEMBERS[0], FRIEND, OTHER_GROUP_MEMBER, MEMBERS[1]])
+        self.assertEqual(result[FRIEND].nickname, "single")
+
+
+if __name__ == "__main__":
+    unittest.main()
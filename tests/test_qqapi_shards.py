@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+from avilla.core.selector import Selector
+from avilla.qqapi.connection.ws_client import QQAPIWsClientNetworking
+from avilla.qqapi.protocol import QQAPIWebsocketConfig
+from avilla.standard.core.account import AccountUnregistered
+
+
+class FakeConnection:
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    @asynccontextmanager
+    async def ws_connect(self, url: str, timeout: float):
+        yield FakeConnection()
+
+
+class QQAPIShardTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.events = []
+
+        async def post_event(event):
+            self.events.append(event)
+
+        self.route = Selector().land("qqapi").account("1")
+        avilla = SimpleNamespace(
+            accounts={self.route: SimpleNamespace(account="account")},
+            broadcast=SimpleNamespace(postEvent=post_event),
+        )
+        protocol = SimpleNamespace(avilla=avilla, service=SimpleNamespace(accounts={"1": "account"}))
+        config = QQAPIWebsocketConfig(id="1", token="token", secret="secret", identify_interval=0.05)
+        self.networking = QQAPIWsClientNetworking(protocol, config)  # type: ignore
+
+    async def test_identify_buckets(self):
+        networking = self.networking
+        networking.max_concurrency = 2
+        networking.identify_remaining = 10
+        identified = []
+
+        async def identify(shard: tuple[int, int]):
+            async with networking.identify_slot(shard):
+                identified.append((shard, asyncio.get_running_loop().time()))
+
+        start = asyncio.get_running_loop().time()
+        await asyncio.gather(*(identify((i, 4)) for i in range(4)))
+        at = {shard: time - start for shard, time in identified}
+
+        # shards 0 and 1 are in different buckets, shards 2 and 3 wait for the interval of their bucket.
+        self.assertLess(at[(0, 4)], 0.04)
+        self.assertLess(at[(1, 4)], 0.04)
+        self.assertGreaterEqual(at[(2, 4)], 0.04)
+        self.assertGreaterEqual(at[(3, 4)], 0.04)
+        self.assertEqual(networking.identify_remaining, 6)
+
+    async def test_shard_close(self):
+        networking = self.networking
+        for shard in [(0, 2), (1, 2)]:
+            session = networking.get_session(shard)
+            session.session_id = f"session {shard[0]}"
+            session.sequence = 1
+
+        await networking.connection_closed((0, 2))
+        self.assertIsNone(networking.sessions[(0, 2)].session_id)
+        self.assertTrue(networking.sessions[(0, 2)].close_signal.is_set())
+        self.assertEqual(networking.sessions[(1, 2)].session_id, "session 1")
+        self.assertFalse(networking.sessions[(1, 2)].close_signal.is_set())
+        self.assertFalse(networking.close_signal.is_set())
+
+        await networking.connection_closed()
+        self.assertIsNone(networking.sessions[(1, 2)].session_id)
+        self.assertTrue(networking.close_signal.is_set())
+
+    async def test_unregister_with_last_shard(self):
+        networking = self.networking
+        sigexit = asyncio.Event()
+        manager = SimpleNamespace(status=SimpleNamespace(exiting=False, wait_for_sigexit=sigexit.wait))
+
+        async def hello(shard):
+            return 1000
+
+        async def authenticate(shard):
+            return True
+
+        async def forever(*args, **kwargs):
+            await asyncio.Future()
+
+        networking._hello = hello  # type: ignore
+        networking._authenticate = authenticate  # type: ignore
+        networking.message_handle = forever  # type: ignore
+        networking._heartbeat = forever  # type: ignore
+
+        shards = [(0, 2), (1, 2)]
+        first = asyncio.create_task(networking.connection_daemon(manager, FakeSession(), "", shards[0]))  # type: ignore
+        await asyncio.sleep(0)
+        self.assertEqual(set(networking.connections), {shards[0]})
+
+        # only the second shard exits: the first one keeps the account.
+        second_exit = asyncio.Event()
+        second_manager = SimpleNamespace(status=SimpleNamespace(exiting=False, wait_for_sigexit=second_exit.wait))
+        second = asyncio.create_task(
+            networking.connection_daemon(second_manager, FakeSession(), "", shards[1])  # type: ignore
+        )
+        await asyncio.sleep(0)
+        second_exit.set()
+        await second
+        self.assertEqual(set(networking.connections), {shards[0]})
+        self.assertEqual(self.events, [])
+        self.assertIn(self.route, networking.protocol.avilla.accounts)
+        self.assertFalse(networking.close_signal.is_set())
+
+        sigexit.set()
+        await first
+        self.assertEqual(networking.connections, {})
+        self.assertEqual([type(event) for event in self.events], [AccountUnregistered])
+        self.assertNotIn(self.route, networking.protocol.avilla.accounts)
+        self.assertEqual(networking.protocol.service.accounts, {})
+        self.assertTrue(networking.close_signal.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
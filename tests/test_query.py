@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import unittest
+import weakref
+
+from avilla.core.ryanvk.descriptor.query import (
+    QueryRecord,
+    _querier_plans,
+    find_querier_plan,
+    find_querier_steps,
+    query_concurrent_generator,
+)
+from avilla.core.selector import Selector, _parse_follows
+from graia.ryanvk import ArtifactView
+from graia.ryanvk._runtime import artifacts_modified
+
+
+class QueryConcurrentGeneratorTest(unittest.IsolatedAsyncioTestCase):
+    async def test_fan_out(self):
+        async def groups(predicate, previous=None):
+            for group in ("1", "2", "3"):
+                yield Selector().land("qq").group(group)
+
+        async def members(predicate, previous):
+            for member in ("10", "20"):
+                yield previous.member(member)
+
+        results = [i async for i in query_concurrent_generator([(groups, ""), (members, "")])]
+        self.assertEqual(
+            {(i["group"], i["member"]) for i in results},
+            {(group, member) for group in ("1", "2", "3") for member in ("10", "20")},
+        )
+
+    async def test_limit_closes_handlers(self):
+        closed = []
+
+        async def endless(predicate, previous=None):
+            index = 0
+            try:
+                while True:
+                    yield Selector().land("qq").group(str(index))
+                    index += 1
+                    await asyncio.sleep(0)
+            finally:
+                closed.append(True)
+
+        results = [i async for i in query_concurrent_generator([(endless, "")], limit=5)]
+        self.assertEqual(len(results), 5)
+        # the handler is closed by the time the query returns.
+        self.assertEqual(closed, [True])
+
+    async def test_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def groups(predicate, previous=None):
+            for group in range(16):
+                yield Selector().land("qq").group(str(group))
+
+        async def members(predicate, previous):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            yield previous.member("1")
+
+        results = [i async for i in query_concurrent_generator([(groups, ""), (members, "")], concurrency=4)]
+        self.assertEqual(len(results), 16)
+        self.assertLessEqual(peak, 4)
+
+    async def test_error(self):
+        async def broken(predicate, previous=None):
+            raise ValueError("broken")
+            yield
+
+        with self.assertRaises(ValueError):
+            async for _ in query_concurrent_generator([(broken, "")]):
+                ...
+
+
+class QuerierPlanTest(unittest.TestCase):
+    def setUp(self):
+        self.artifacts = {
+            QueryRecord(None, "land"): ...,
+            QueryRecord("land", "group"): ...,
+            QueryRecord("land.group", "member"): ...,
+            QueryRecord(None, "land.friend"): ...,
+        }
+
+    def test_same_as_steps(self):
+        view = ArtifactView.of([self.artifacts])
+        for pattern in ["land.group.member", "land(qq).group(1).member", "land.friend", "land.stranger"]:
+            items = _parse_follows(pattern)
+            self.assertEqual(find_querier_plan(view, items), find_querier_steps(self.artifacts, items))
+
+    def test_shared_by_shape(self):
+        view = ArtifactView.of([self.artifacts])
+        find_querier_plan(view, _parse_follows("land(qq).group(1).member"))
+        find_querier_plan(view, _parse_follows("land.group(2).member(3)"))
+        self.assertEqual(list(_querier_plans[view]), [("land", "group", "member")])
+
+    def test_dropped_with_view(self):
+        view = ArtifactView.of([self.artifacts])
+        self.assertIsNone(find_querier_plan(view, _parse_follows("land.group.file")))
+
+        self.artifacts[QueryRecord("land.group", "file")] = ...
+        artifacts_modified()
+        fresh = ArtifactView.of([self.artifacts])
+        self.assertIsNot(fresh, view)
+        self.assertIsNotNone(find_querier_plan(fresh, _parse_follows("land.group.file")))
+
+        stale = weakref.ref(view)
+        del view
+        gc.collect()
+        self.assertIsNone(stale())
+        self.assertIn(fresh, _querier_plans)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+from loguru import logger
+
+from avilla.core.recorder import EventRecorder
+
+
+class Event:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class Other(Event):
+    ...
+
+
+class EventRecorderTest(unittest.TestCase):
+    def setUp(self):
+        self.records = []
+        self.sink = logger.add(lambda message: self.records.append(message.record), level="DEBUG")
+        self.recorder = EventRecorder("INFO")
+
+    def tearDown(self):
+        self.recorder.close()
+        logger.remove(self.sink)
+
+    def test_format_on_worker(self):
+        threads = []
+
+        def formatter(text: str) -> str:
+            threads.append(threading.current_thread())
+            return f"event {text}"
+
+        self.recorder.register(Event, "INFO", formatter, lambda event: (event.text,))
+        event = Event("a")
+        self.recorder.record(event)
+        # changes made after recording don't reach the record.
+        event.text = "b"
+        self.recorder.close()
+
+        self.assertEqual([record["message"] for record in self.records], ["event a"])
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertEqual(self.records[0]["extra"]["event_type"], "Event")
+
+    def test_format_on_caller(self):
+        self.recorder.register(Event, "INFO", lambda event: f"event {event.text}")
+        event = Event("a")
+        self.recorder.record(event)
+        event.text = "b"
+        self.recorder.close()
+
+        self.assertEqual([record["message"] for record in self.records], ["event a"])
+
+    def test_origin(self):
+        self.recorder.register(Event, "INFO", lambda event: event.text)
+
+        def event_record(event):
+            self.recorder.record(event, depth=1)
+
+        event_record(Event("a"))
+        self.recorder.close()
+
+        record = self.records[0]
+        self.assertEqual((record["name"], record["function"]), (__name__, "test_origin"))
+
+    def test_level(self):
+        self.recorder.register(Event, "DEBUG", lambda event: event.text)
+        self.recorder.register(Other, "INFO", lambda event: event.text)
+        self.recorder.record(Event("debug"))
+        self.recorder.record(Other("info"))
+
+        self.recorder.level = None
+        self.recorder.record(Other("disabled"))
+        self.recorder.close()
+
+        self.assertEqual([record["message"] for record in self.records], ["info"])
+
+    def test_resolve(self):
+        self.recorder.register(Event, "INFO", str)
+        self.recorder.register(Other, None)
+
+        self.assertIsNotNone(self.recorder.resolve(Event))
+        self.assertIsNone(self.recorder.resolve(Other))
+        self.assertIsNone(self.recorder.resolve(int))
+
+
+if __name__ == "__main__":
+    unittest.main()
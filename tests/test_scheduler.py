@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from avilla.core.scheduler import EventScheduler
+
+
+class EventSchedulerTest(unittest.IsolatedAsyncioTestCase):
+    async def drain(self, scheduler: EventScheduler):
+        while scheduler.tasks:
+            await asyncio.gather(*scheduler.tasks)
+
+    async def test_lane_order(self):
+        scheduler = EventScheduler()
+        order = []
+
+        async def job(index: int):
+            # later jobs would finish first if they were not run in order.
+            await asyncio.sleep(0.01 / (index + 1))
+            order.append(index)
+
+        for index in range(5):
+            self.assertTrue(scheduler.submit("lane", job(index)))
+        self.assertEqual(scheduler.lane_depths, {"lane": 5})
+
+        await self.drain(scheduler)
+        self.assertEqual(order, [0, 1, 2, 3, 4])
+        self.assertEqual(scheduler.pending, 0)
+        self.assertEqual(scheduler.lanes, {})
+
+    async def test_lanes_concurrent(self):
+        scheduler = EventScheduler()
+        started = asyncio.Event()
+        order = []
+
+        async def blocked():
+            await started.wait()
+            order.append("blocked")
+
+        async def other():
+            order.append("other")
+            started.set()
+
+        scheduler.submit("a", blocked())
+        scheduler.submit("b", other())
+        await asyncio.wait_for(self.drain(scheduler), 1)
+        self.assertEqual(order, ["other", "blocked"])
+
+    async def test_max_concurrency(self):
+        scheduler = EventScheduler(max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        for lane in range(6):
+            scheduler.submit(lane, job())
+        await self.drain(scheduler)
+        self.assertEqual(peak, 2)
+
+    async def test_max_pending(self):
+        scheduler = EventScheduler(max_pending=2)
+        ran = []
+
+        async def job(index: int):
+            ran.append(index)
+
+        self.assertTrue(scheduler.submit("lane", job(0)))
+        self.assertTrue(scheduler.submit("other", job(1)))
+        refused = job(2)
+        self.assertFalse(scheduler.submit("lane", refused))
+        # refused jobs are closed, rather than left never awaited.
+        self.assertIsNone(refused.cr_frame)
+
+        await self.drain(scheduler)
+        self.assertEqual(sorted(ran), [0, 1])
+        self.assertTrue(scheduler.submit("lane", job(3)))
+        await self.drain(scheduler)
+
+    async def test_unbounded_by_default(self):
+        scheduler = EventScheduler()
+        self.assertIsNone(scheduler.max_pending)
+
+    async def test_failure_keeps_lane(self):
+        scheduler = EventScheduler()
+        ran = []
+
+        async def broken():
+            raise ValueError("broken")
+
+        async def job():
+            ran.append(True)
+
+        scheduler.submit("lane", broken())
+        scheduler.submit("lane", job())
+        await self.drain(scheduler)
+        self.assertEqual(ran, [True])
+        self.assertEqual(scheduler.pending, 0)
+
+
+class ElizabethLaneTest(unittest.TestCase):
+    def test_event_scene(self):
+        from avilla.elizabeth.connection.base import event_scene
+
+        self.assertEqual(event_scene({"type": "GroupMessage", "sender": {"id": 1, "group": {"id": 10}}}), 10)
+        self.assertEqual(event_scene({"type": "FriendMessage", "sender": {"id": 2}}), 2)
+        self.assertEqual(event_scene({"type": "MemberJoinEvent", "member": {"id": 3, "group": {"id": 11}}}), 11)
+        self.assertEqual(event_scene({"type": "BotMuteEvent", "operator": {"id": 4, "group": {"id": 12}}}), 12)
+        self.assertEqual(event_scene({"type": "GroupNameChangeEvent", "group": {"id": 13}, "operator": None}), 13)
+        self.assertEqual(event_scene({"type": "NudgeEvent", "subject": {"id": 14, "kind": "Group"}}), 14)
+        self.assertEqual(event_scene({"type": "MemberJoinRequestEvent", "groupId": 15, "fromId": 5}), 15)
+        self.assertEqual(event_scene({"type": "NewFriendRequestEvent", "groupId": 0, "fromId": 6}), 6)
+        self.assertEqual(event_scene({"type": "FriendAddEvent", "friend": {"id": 7}}), 7)
+        self.assertIsNone(event_scene({"type": "FriendRecallEvent", "operator": 8, "authorId": 8}))
+
+
+if __name__ == "__main__":
+    unittest.main()
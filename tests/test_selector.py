@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import copy
+import gc
+import unittest
+
+from avilla.core.selector import Selector
+
+
+class SelectorTest(unittest.TestCase):
+    def test_equality(self):
+        built = Selector().land("qq").group("1").member("10")
+        mapped = Selector({"land": "qq", "group": "1", "member": "10"})
+
+        self.assertEqual(built, mapped)
+        self.assertEqual(hash(built), hash(mapped))
+        self.assertEqual(len({built, mapped}), 1)
+        self.assertNotEqual(built, Selector().land("qq").group("1").member("20"))
+        # the order of the keys is part of the selector.
+        self.assertNotEqual(Selector().a("1").b("2"), Selector().b("2").a("1"))
+
+    def test_values_stringified(self):
+        self.assertEqual(Selector().land("qq").group(1), Selector().land("qq").group("1"))
+
+    def test_pattern(self):
+        selector = Selector().land("qq").group("1").member("10")
+        self.assertEqual(dict(selector.pattern), {"land": "qq", "group": "1", "member": "10"})
+        self.assertEqual(selector["group"], "1")
+        self.assertIn("member", selector)
+        self.assertNotIn("friend", selector)
+        self.assertEqual(selector.path, "land.group.member")
+        self.assertEqual(selector.display, "land(qq).group(1).member(10)")
+        self.assertEqual((selector.last_key, selector.last_value), ("member", "10"))
+        with self.assertRaises(KeyError):
+            selector["friend"]
+
+    def test_derive(self):
+        group = Selector().land("qq").group("1")
+        member = group.member("10")
+
+        # derived selectors leave the original untouched.
+        self.assertEqual(group.path, "land.group")
+        self.assertEqual(member.appendix("group", "2"), Selector().land("qq").group("2").member("10"))
+        self.assertEqual(member.land("tg"), Selector().land("tg").group("1").member("10"))
+        self.assertEqual(Selector().group("1").land("qq").path, "land.group")
+
+    def test_copy(self):
+        selector = Selector().land("qq").group("1")
+        self.assertEqual(copy.copy(selector), selector)
+        self.assertEqual(copy.deepcopy(selector), selector)
+
+    def test_follows(self):
+        selector = Selector().land("qq").group("1").member("10")
+        self.assertTrue(selector.follows("land.group.member"))
+        self.assertTrue(selector.follows("::group(1).member"))
+        self.assertTrue(selector.follows("land.group.*"))
+        self.assertFalse(selector.follows("land.group"))
+        self.assertFalse(selector.follows("land.group(2).member"))
+        self.assertTrue(selector.follows("land.group.member#even", even=lambda v: int(v) % 2 == 0))
+
+
+class SelectorInternTest(unittest.TestCase):
+    def test_identity(self):
+        first = Selector().land("qq").group("1").intern()
+        second = Selector({"land": "qq", "group": "1"}).intern()
+        self.assertIs(first, second)
+        self.assertIsNot(first, Selector().land("qq").group("2").intern())
+
+    def test_released(self):
+        items = Selector().land("qq").group("released").intern()._items
+        gc.collect()
+        self.assertNotIn(items, Selector._interned)
+
+        kept = Selector().land("qq").group("kept").intern()
+        gc.collect()
+        self.assertIs(Selector._interned[kept._items], kept)
+
+    def test_subclass(self):
+        class ContextSelector(Selector):
+            pass
+
+        selector = ContextSelector().land("qq").group("subclass")
+        self.assertIs(selector.intern(), selector)
+        self.assertNotIn(selector._items, Selector._interned)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from avilla.core.utilles.single_flight import SingleFlight
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_merged(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flight.run("key", factory) for _ in range(8)))
+        self.assertEqual(results, [1] * 8)
+        self.assertEqual(calls, 1)
+        self.assertEqual(flight.flights, {})
+
+        # finished flights are not reused.
+        self.assertEqual(await flight.run("key", factory), 2)
+
+    async def test_distinct_keys(self):
+        flight = SingleFlight()
+
+        async def factory(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(flight.run("a", lambda: factory(1)), flight.run("b", lambda: factory(2)))
+        self.assertEqual(results, [1, 2])
+
+    async def test_error_shared(self):
+        flight = SingleFlight()
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        results = await asyncio.gather(*(flight.run("key", factory) for _ in range(3)), return_exceptions=True)
+        self.assertTrue(all(isinstance(i, ValueError) for i in results))
+
+    async def test_cancelled_caller(self):
+        flight = SingleFlight()
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.create_task(flight.run("key", factory))
+        second = asyncio.create_task(flight.run("key", factory))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        # the call goes on for the other callers.
+        self.assertEqual(await second, "done")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+    async def test_unhashable_key(self):
+        flight = SingleFlight()
+
+        async def factory():
+            return "done"
+
+        self.assertEqual(await flight.run(["unhashable"], factory), "done")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import unittest
+
+from graia.broadcast import Broadcast
+from graia.broadcast.entities.dispatcher import BaseDispatcher
+from graia.broadcast.entities.event import Dispatchable
+from graia.broadcast.entities.listener import Listener
+from graia.broadcast.interfaces.dispatcher import DispatcherInterface
+
+from avilla.core.utilles.subscription import SubscriptionIndex
+
+
+class Ping(Dispatchable):
+    class Dispatcher(BaseDispatcher):
+        @staticmethod
+        async def catch(interface: DispatcherInterface):
+            ...
+
+
+class Pong(Ping):
+    ...
+
+
+async def handler():
+    ...
+
+
+class SubscriptionIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.broadcast = Broadcast()
+        self.index = SubscriptionIndex(self.broadcast)
+
+    def test_receiver(self):
+        self.assertFalse(self.index.listened(Ping))
+
+        self.broadcast.receiver(Ping)(handler)
+        self.assertTrue(self.index.listened(Ping))
+        # matched by the exact class, as Broadcast does.
+        self.assertFalse(self.index.listened(Pong))
+        self.assertTrue(self.index.listened(Pong, Ping))
+
+    def test_event_appended_to_listener(self):
+        self.broadcast.receiver(Ping)(handler)
+        self.assertFalse(self.index.listened(Pong))
+
+        self.broadcast.receiver(Pong)(handler)
+        self.assertTrue(self.index.listened(Pong))
+
+    def test_remove_listener(self):
+        self.broadcast.receiver(Ping)(handler)
+        self.assertTrue(self.index.listened(Ping))
+
+        self.broadcast.removeListener(self.broadcast.getListener(handler))
+        self.assertFalse(self.index.listened(Ping))
+
+    def test_listener_appended_directly(self):
+        self.assertFalse(self.index.listened(Ping))
+
+        self.broadcast.listeners.append(
+            Listener(handler, self.broadcast.getDefaultNamespace(), [Ping])
+        )
+        self.assertTrue(self.index.listened(Ping))
+
+    def test_disabled(self):
+        self.index.enabled = False
+        self.assertTrue(self.index.listened(Ping))
+
+
+class AvillaListenersTest(unittest.TestCase):
+    # Avilla's own listeners keep the events feeding its caches from being skipped.
+
+    def make_avilla(self, **kwargs):
+        from launart import Launart
+
+        from avilla.core import Avilla
+
+        return Avilla(broadcast=Broadcast(), launch_manager=Launart(), skip_unlistened_events=True, **kwargs)
+
+    def test_cache_events_listened(self):
+        from avilla.core.event import MemberCreated, MetadataModified, SceneDestroyed
+        from avilla.standard.core.message import MessageReceived
+
+        subscriptions = self.make_avilla(metadata_cache_size=1024).subscriptions
+        self.assertTrue(subscriptions.listened(MetadataModified))
+        self.assertTrue(subscriptions.listened(MemberCreated))
+        self.assertTrue(subscriptions.listened(SceneDestroyed))
+        self.assertTrue(subscriptions.listened(MessageReceived))
+
+    def test_cache_events_skipped_without_caches(self):
+        from avilla.core.event import MemberCreated, MetadataModified
+        from avilla.standard.core.message import MessageReceived
+
+        subscriptions = self.make_avilla(message_cache_size=0, metadata_cache_size=0).subscriptions
+        self.assertFalse(subscriptions.listened(MetadataModified))
+        self.assertFalse(subscriptions.listened(MemberCreated))
+        self.assertFalse(subscriptions.listened(MessageReceived))
+
+
+class CapabilitySkipTest(unittest.IsolatedAsyncioTestCase):
+    # events built by the protocols are neither recorded nor posted when nobody listens to them.
+
+    async def test_handle_event(self):
+        from unittest import mock
+
+        from launart import Launart
+
+        from avilla.core import Avilla
+        from avilla.core.ryanvk.collector.application import ApplicationCollector
+        from avilla.core.ryanvk.staff import Staff
+        from avilla.elizabeth.capability import ElizabethCapability
+
+        class PingPerform((m := ApplicationCollector())._):
+            @m.entity(ElizabethCapability.event_callback, raw_event="Ping")
+            async def ping(self, raw_event: dict):
+                return Ping()
+
+        avilla = Avilla(broadcast=Broadcast(), launch_manager=Launart(), skip_unlistened_events=True)
+        staff = Staff([PingPerform.__collector__.artifacts, avilla.global_artifacts], {"avilla": avilla})
+
+        with mock.patch.object(avilla.broadcast, "postEvent") as post_event, mock.patch.object(
+            avilla, "event_record"
+        ) as event_record:
+            await ElizabethCapability(staff).handle_event({"type": "Ping"})
+            post_event.assert_not_called()
+            event_record.assert_not_called()
+
+            avilla.broadcast.receiver(Ping)(handler)
+            await ElizabethCapability(staff).handle_event({"type": "Ping"})
+            post_event.assert_called_once()
+            event_record.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
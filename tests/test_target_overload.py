@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import unittest
+
+from avilla.core.ryanvk.overload.target import TargetOverload, TargetOverloadConfig
+from avilla.core.selector import Selector
+from graia.ryanvk import artifacts_modified
+
+QQ_GROUP = Selector().land("qq").group("1")
+
+
+class TargetOverloadTest(unittest.TestCase):
+    def setUp(self):
+        self.overload = TargetOverload()
+        self.scope = {}
+
+    def collect(self, entity: str, pattern: str | TargetOverloadConfig):
+        self.overload.collect_entity(None, self.scope, entity, {"target": pattern})  # type: ignore
+
+    def lookup(self, target: Selector):
+        return {entity for _, entity in self.overload.get_entities(self.scope, {"target": target})}
+
+    def test_branches(self):
+        self.collect("group", "land.group")
+        self.collect("qq_group", "land(qq).group")
+        self.collect("large_group", TargetOverloadConfig("land.group#large", large=lambda value: int(value) > 100))
+        self.collect("member", "land.group.member")
+        self.collect("qq_friend", "land(qq).friend")
+        self.collect("contact", "land.contact")
+
+        self.assertEqual(self.lookup(QQ_GROUP), {"qq_group"})
+        self.assertEqual(self.lookup(Selector().land("tg").group("1")), {"group"})
+        self.assertEqual(self.lookup(Selector().land("tg").group("1000")), {"large_group"})
+        self.assertEqual(self.lookup(Selector().land("qq").friend("1")), {"qq_friend"})
+        # the levels under the default branch are reachable from its literal siblings, unless they cover them.
+        self.assertEqual(self.lookup(Selector().land("qq").contact("1")), {"contact"})
+        self.assertEqual(self.lookup(Selector().land("tg").group("1").member("10")), {"member"})
+        with self.assertRaises(NotImplementedError):
+            self.lookup(QQ_GROUP.member("10"))
+
+        with self.assertRaises(NotImplementedError):
+            self.lookup(Selector().land("tg").friend("1"))
+        with self.assertRaises(NotImplementedError):
+            self.lookup(Selector().land("qq"))
+
+    def test_recompiled(self):
+        self.collect("group", "land.group")
+        self.assertEqual(self.lookup(QQ_GROUP), {"group"})
+
+        self.collect("qq_group", "land(qq).group")
+        artifacts_modified()
+        self.assertEqual(self.lookup(QQ_GROUP), {"qq_group"})
+
+    def test_dispatch_key(self):
+        self.collect("qq_group", "land(qq).group")
+        self.collect("member", "land.group.member")
+
+        key = self.overload.get_dispatch_key({"target": QQ_GROUP.member("10")})
+        # only the land chooses among branches, members of any group share the key.
+        self.assertEqual(key, self.overload.get_dispatch_key({"target": Selector().land("qq").group("2").member("20")}))
+        self.assertNotEqual(key, self.overload.get_dispatch_key({"target": Selector().land("tg").group("1").member("10")}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from avilla.core.utilles.ttl_cache import TTLCache
+
+
+class TTLCacheTest(unittest.TestCase):
+    def test_get_set(self):
+        cache = TTLCache(4, 10)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("a", "default"), "default")
+
+        cache.set("a", None)
+        # stored values may be None, told apart by the default.
+        self.assertIsNone(cache.get("a", "default"))
+        self.assertIn("a", cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_expire(self):
+        cache = TTLCache(4, 10)
+        with mock.patch("avilla.core.utilles.ttl_cache.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with mock.patch("avilla.core.utilles.ttl_cache.monotonic", return_value=111.0):
+            self.assertNotIn("a", cache)
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru(self):
+        cache = TTLCache(2, 10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+    def test_disabled(self):
+        for cache in (TTLCache(0, 10), TTLCache(4, 0)):
+            self.assertFalse(cache.enabled)
+            cache.set("a", 1)
+            self.assertEqual(len(cache), 0)
+
+    def test_clear_generation(self):
+        cache = TTLCache(4, 10)
+        cache.set("a", 1)
+        generation = cache.generation
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertNotEqual(cache.generation, generation)
+
+
+if __name__ == "__main__":
+    unittest.main()